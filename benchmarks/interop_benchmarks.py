@@ -0,0 +1,409 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Benchmarks of the interop hot paths.
+
+Run this script to time each benchmark and optionally store the results as a JSON
+baseline or compare them against one::
+
+    python benchmarks/interop_benchmarks.py --save baseline.json
+    python benchmarks/interop_benchmarks.py --compare baseline.json --threshold 0.2
+
+Comparing exits with status 1 if any benchmark is slower than its baseline by more
+than the threshold. Baselines are only meaningful on the machine they were recorded on.
+
+The array round trips run up to ``--max-elements`` elements, ``10**5`` by default.
+Sizes up to ``10**7`` can be requested, but parsing that many elements takes minutes.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import locale
+import os
+from pathlib import Path
+import platform
+import re
+import sys
+import tempfile
+import timeit
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+import ansys.tools.variableinterop as acvi
+from ansys.tools.variableinterop.array_value_conversion import (
+    to_boolean_array_value,
+    to_integer_array_value,
+    to_real_array_value,
+    to_string_array_value,
+)
+
+DEFAULT_THRESHOLD: float = 0.2
+"""Fraction by which a benchmark may be slower than its baseline before it is flagged."""
+
+DEFAULT_MAX_ELEMENTS: int = 10**5
+"""Largest array used by the API string round trips unless more are requested."""
+
+ARRAY_SIZES: Sequence[int] = tuple(10**exponent for exponent in range(2, 8))
+"""Element counts of the arrays used by the API string round trips."""
+
+DISPLAY_LOCALES: Sequence[str] = ("en_US.UTF-8", "de_DE.UTF-8", "ja_JP.UTF-8")
+"""Locales used by the display formatting benchmarks, when available."""
+
+FILE_SIZE: int = 16 << 20
+"""Size, in bytes, of the file used by the file write benchmark."""
+
+
+class Benchmark(NamedTuple):
+    """A named operation to time."""
+
+    name: str
+    """Name of the benchmark, used as its key in baselines."""
+    setup: Callable[[], Callable[[], Any]]
+    """Prepares the inputs and returns the operation to time."""
+    nbytes: int = 0
+    """Bytes processed per run of the operation, for reporting throughput."""
+
+
+def _scalar_construction() -> Iterator[Benchmark]:
+    for value_type, argument in (
+        (acvi.IntegerValue, 42),
+        (acvi.RealValue, 4.2),
+        (acvi.BooleanValue, True),
+        (acvi.StringValue, "forty-two"),
+    ):
+        yield Benchmark(
+            f"construct/{value_type.__name__}",
+            lambda t=value_type, a=argument: lambda: t(a),
+        )
+
+
+def _conversions() -> Iterator[Benchmark]:
+    scalar_sources = (
+        acvi.IntegerValue(42),
+        acvi.RealValue(4.5),
+        acvi.BooleanValue(True),
+        acvi.StringValue("1.5"),
+    )
+    for conversion in (
+        acvi.to_integer_value,
+        acvi.to_real_value,
+        acvi.to_boolean_value,
+        acvi.to_string_value,
+    ):
+        for source in scalar_sources:
+            if conversion is acvi.to_integer_value and isinstance(source, acvi.StringValue):
+                source = acvi.StringValue("42")
+            yield Benchmark(
+                f"convert/{conversion.__name__}/{type(source).__name__}",
+                lambda c=conversion, s=source: lambda: c(s),
+            )
+
+    array_sources = (
+        acvi.IntegerArrayValue(values=np.arange(1000)),
+        acvi.RealArrayValue(values=np.linspace(0.0, 1.0, 1000)),
+        acvi.BooleanArrayValue(values=np.arange(1000) % 2 == 0),
+        acvi.StringArrayValue(values=[str(i) for i in range(1000)]),
+    )
+    for conversion in (
+        to_integer_array_value,
+        to_real_array_value,
+        to_boolean_array_value,
+        to_string_array_value,
+    ):
+        for source in array_sources:
+            if conversion is to_boolean_array_value and isinstance(source, acvi.StringArrayValue):
+                source = acvi.StringArrayValue(values=["true", "false"] * 500)
+            yield Benchmark(
+                f"convert/{conversion.__name__}/{type(source).__name__}[1000]",
+                lambda c=conversion, s=source: lambda: c(s),
+            )
+
+
+def _array_values(size: int) -> Iterator[acvi.CommonArrayValue]:
+    yield acvi.RealArrayValue(values=np.linspace(-1.0, 1.0, size))
+    yield acvi.IntegerArrayValue(values=np.arange(size))
+    yield acvi.BooleanArrayValue(values=np.arange(size) % 3 == 0)
+    yield acvi.StringArrayValue(values=np.array([f"s{i}" for i in range(size)]))
+
+
+def _api_round_trips(max_elements: int) -> Iterator[Benchmark]:
+    for size in ARRAY_SIZES:
+        if size > max_elements:
+            break
+        for value in _array_values(size):
+            for shape in ((size,), (size // 10, 10)):
+                shaped = value.reshape(shape)
+                label = "x".join(map(str, shape))
+
+                def setup(v=shaped) -> Callable[[], Any]:
+                    return lambda: acvi.from_api_string(v.variable_type, acvi.to_api_string(v))
+
+                yield Benchmark(
+                    f"api_round_trip/{type(value).__name__}/{label}", setup, shaped.nbytes
+                )
+
+
+def _available_locales() -> List[str]:
+    available = []
+    for name in DISPLAY_LOCALES:
+        try:
+            acvi.RealValue(1.5).to_display_string(name)
+        except locale.Error:
+            continue
+        available.append(name)
+    return available
+
+
+def _display_formatting() -> Iterator[Benchmark]:
+    values = (
+        acvi.IntegerValue(123456),
+        acvi.RealValue(1234.5678),
+        acvi.BooleanValue(True),
+        acvi.StringValue("display"),
+        acvi.RealArrayValue(values=np.linspace(0.0, 1.0, 100)),
+    )
+    for locale_name in _available_locales():
+        for value in values:
+            yield Benchmark(
+                f"display/{locale_name}/{type(value).__name__}",
+                lambda v=value, n=locale_name: lambda: v.to_display_string(n),
+            )
+
+
+def _coercion() -> Iterator[Benchmark]:
+    def undecorated(value: acvi.RealValue, count: acvi.IntegerValue) -> float:
+        return value
+
+    decorated = acvi.implicit_coerce(undecorated)
+    yield Benchmark("implicit_coerce/none", lambda: lambda: undecorated(1.5, 3))
+    yield Benchmark("implicit_coerce/decorated", lambda: lambda: decorated(1.5, 3))
+
+
+def _metadata() -> Iterator[Benchmark]:
+    metadata = acvi.RealMetadata()
+    metadata.lower_bound = acvi.RealValue(1.0)
+    metadata.upper_bound = acvi.RealValue(10.0)
+    metadata.enumerated_values = [acvi.RealValue(v) for v in (0.5, 2.0, 4.0)]
+    metadata.custom_metadata["unit"] = acvi.StringValue("m")
+    source = acvi.IntegerValue(3)
+    yield Benchmark("metadata/get_default_value", lambda: metadata.get_default_value)
+    yield Benchmark("metadata/runtime_convert", lambda: lambda: metadata.runtime_convert(source))
+    yield Benchmark("metadata/clone", lambda: metadata.clone)
+
+
+def _file_write(directory: Path) -> Iterator[Benchmark]:
+    source = directory / "source.bin"
+    destination = directory / "destination.bin"
+
+    def setup() -> Callable[[], Any]:
+        source.write_bytes(os.urandom(FILE_SIZE))
+        value = acvi.NonManagingFileScope().read_from_file(source, None, None)
+        return lambda: asyncio.run(value.write_file(destination))
+
+    yield Benchmark("file/write_file", setup, FILE_SIZE)
+
+
+def all_benchmarks(directory: Path, max_elements: int = DEFAULT_MAX_ELEMENTS) -> List[Benchmark]:
+    """
+    Get every benchmark.
+
+    Parameters
+    ----------
+    directory : Path
+        Directory the file benchmarks may write to.
+    max_elements : int, optional
+        Largest array used by the API string round trips.
+
+    Returns
+    -------
+    List[Benchmark]
+        Benchmarks, in the order they should run.
+    """
+    return [
+        *_scalar_construction(),
+        *_conversions(),
+        *_api_round_trips(max_elements),
+        *_display_formatting(),
+        *_coercion(),
+        *_metadata(),
+        *_file_write(directory),
+    ]
+
+
+def time_benchmark(benchmark: Benchmark, repeat: int = 5, min_seconds: float = 0.2) -> float:
+    """
+    Time a benchmark.
+
+    Parameters
+    ----------
+    benchmark : Benchmark
+        Benchmark to time.
+    repeat : int, optional
+        Number of timing runs. The fastest is reported.
+    min_seconds : float, optional
+        Minimum duration of each timing run. Fast operations are repeated within a run
+        until it lasts at least this long.
+
+    Returns
+    -------
+    float
+        Seconds taken by one run of the operation.
+    """
+    operation = benchmark.setup()
+    # Run once untimed so that lazy imports and caches do not count against the first run.
+    operation()
+    timer = timeit.Timer(operation)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_seconds or number >= 1 << 20:
+            break
+        number = max(number * 2, int(number * min_seconds / max(elapsed, 1e-9)))
+    runs = [elapsed] + timer.repeat(repeat=max(repeat - 1, 0), number=number)
+    return min(runs) / number
+
+
+def run(
+    benchmarks: Sequence[Benchmark],
+    repeat: int = 5,
+    min_seconds: float = 0.2,
+    report: Callable[[str], None] = print,
+) -> Dict[str, Any]:
+    """
+    Time benchmarks and collect the results in the baseline format.
+
+    Parameters
+    ----------
+    benchmarks : Sequence[Benchmark]
+        Benchmarks to time.
+    repeat : int, optional
+        Number of timing runs per benchmark.
+    min_seconds : float, optional
+        Minimum duration of each timing run.
+    report : Callable[[str], None], optional
+        Receives a line of progress for each benchmark.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Environment description under ``"environment"`` and the seconds per run of each
+        benchmark under ``"results"``.
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    for benchmark in benchmarks:
+        seconds = time_benchmark(benchmark, repeat, min_seconds)
+        results[benchmark.name] = {"seconds": seconds}
+        line = f"{benchmark.name:<70} {seconds * 1e6:14.3f} us"
+        if benchmark.nbytes:
+            line += f" {benchmark.nbytes / seconds / (1 << 20):10.1f} MiB/s"
+        report(line)
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "package": acvi.__version__,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def find_regressions(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> Dict[str, float]:
+    """
+    Find the benchmarks that are slower than their baseline by more than a threshold.
+
+    Benchmarks missing from either set of results are ignored.
+
+    Parameters
+    ----------
+    current : Dict[str, Any]
+        Results of the current run, as returned by ``run``.
+    baseline : Dict[str, Any]
+        Baseline results, in the same format.
+    threshold : float, optional
+        Fraction by which a benchmark may be slower before it is flagged.
+
+    Returns
+    -------
+    Dict[str, float]
+        Ratio of current to baseline time for each regressed benchmark.
+    """
+    regressions: Dict[str, float] = {}
+    for name, result in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None or reference["seconds"] <= 0:
+            continue
+        ratio = result["seconds"] / reference["seconds"]
+        if ratio > 1 + threshold:
+            regressions[name] = ratio
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the benchmarks from the command line.
+
+    Parameters
+    ----------
+    argv : Optional[Sequence[str]], optional
+        Command-line arguments. The default is ``None``, which uses ``sys.argv``.
+
+    Returns
+    -------
+    int
+        Exit status: ``1`` if a regression was found, ``0`` otherwise.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--save", type=Path, help="write the results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="compare against this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--max-elements", type=int, default=DEFAULT_MAX_ELEMENTS)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-seconds", type=float, default=0.2)
+    parser.add_argument("-k", "--filter", help="only run benchmarks matching this regex")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        benchmarks = all_benchmarks(Path(directory), args.max_elements)
+        if args.filter:
+            pattern = re.compile(args.filter)
+            benchmarks = [b for b in benchmarks if pattern.search(b.name)]
+        current = run(benchmarks, args.repeat, args.min_seconds)
+
+    if args.save is not None:
+        args.save.write_text(json.dumps(current, indent=2, sort_keys=True))
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        regressions = find_regressions(current, baseline, args.threshold)
+        for name, ratio in sorted(regressions.items()):
+            print(f"REGRESSION {name}: {ratio:.2f}x the baseline time")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -28,54 +28,217 @@ For high-level project documentation with examples and installation instructions
 http://variableinterop.docs.pyansys.com.
 """
 
-try:
-    import importlib.metadata as importlib_metadata
-except ModuleNotFoundError:
-    import importlib_metadata
+from __future__ import annotations
 
-__version__ = importlib_metadata.version("pyansys-tools-variableinterop")
-"""ansys.tools.variableinterop version."""
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
-from .api_serialization import from_api_string, to_api_string
-from .array_metadata import (
-    BooleanArrayMetadata,
-    IntegerArrayMetadata,
-    RealArrayMetadata,
-    StringArrayMetadata,
-)
-from .array_values import BooleanArrayValue, IntegerArrayValue, RealArrayValue, StringArrayValue
-from .common_variable_metadata import CommonVariableMetadata
-from .exceptions import IncompatibleTypesException, ValueDeserializationUnsupportedException
-from .file_array_metadata import FileArrayMetadata
-from .file_array_value import FileArrayValue
-from .file_metadata import FileMetadata
-from .file_scope import FileScope
-from .file_value import (
-    EMPTY_FILE,
-    AsyncLocalFileContentContext,
-    FileValue,
-    LocalFileContentContext,
-    LocalFileValue,
-)
-from .from_formatted_string_visitor import FromFormattedStringVisitor
-from .isave_context import ILoadContext, ISaveContext
-from .ivariable_type_pseudovisitor import IVariableTypePseudoVisitor, vartype_accept
-from .ivariable_visitor import IVariableValueVisitor
-from .ivariablemetadata_visitor import IVariableMetadataVisitor
-from .non_managing_file_scope import NonManagingFileScope
-from .numeric_metadata import NumericMetadata
-from .scalar_metadata import BooleanMetadata, IntegerMetadata, RealMetadata, StringMetadata
-from .scalar_value_conversion import (
-    to_boolean_value,
-    to_integer_value,
-    to_real_value,
-    to_string_value,
-)
-from .scalar_values import BooleanValue, IntegerValue, RealValue, StringValue
-from .utils.implicit_coercion import implicit_coerce, implicit_coerce_single
-from .utils.string_escaping import escape_string, unescape_string
-from .var_type_array_check import var_type_is_array
-from .variable_state import VariableState
-from .variable_type import VariableType
-from .variable_value import CommonArrayValue, IVariableValue, VariableValueInvalidError
-from .vartype_arrays_and_elements import get_element_type, to_array_type
+if TYPE_CHECKING:
+    from .api_serialization import from_api_string, from_api_strings, to_api_string, to_api_strings
+    from .archive_file_contexts import (
+        TarLoadContext,
+        TarSaveContext,
+        ZipLoadContext,
+        ZipSaveContext,
+    )
+    from .array_metadata import (
+        BooleanArrayMetadata,
+        IntegerArrayMetadata,
+        RealArrayMetadata,
+        StringArrayMetadata,
+    )
+    from .array_values import BooleanArrayValue, IntegerArrayValue, RealArrayValue, StringArrayValue
+    from .async_conversion import (
+        convert_async,
+        from_api_string_async,
+        to_api_string_async,
+        to_display_string_async,
+    )
+    from .common_variable_metadata import CommonVariableMetadata
+    from .content_addressed_file_scope import ContentAddressedFileScope
+    from .content_pin_registry import ContentPinRegistry, SharedFileContentContext
+    from .exceptions import IncompatibleTypesException, ValueDeserializationUnsupportedException
+    from .file_array_metadata import FileArrayMetadata
+    from .file_array_value import FileArrayValue
+    from .file_metadata import FileMetadata
+    from .file_scope import FileScope
+    from .file_value import (
+        EMPTY_FILE,
+        AsyncLocalFileContentContext,
+        FileValue,
+        LocalFileContentContext,
+        LocalFileValue,
+    )
+    from .from_formatted_string_visitor import FromFormattedStringVisitor
+    from .instrumentation import (
+        CallbackSink,
+        InstrumentationSink,
+        LoggingSink,
+        OperationRecord,
+        OperationStats,
+        StatsSink,
+        disable_instrumentation,
+        enable_instrumentation,
+        instrumentation_enabled,
+        instrumented,
+    )
+    from .isave_context import ILoadContext, ISaveContext
+    from .ivariable_type_pseudovisitor import IVariableTypePseudoVisitor, vartype_accept
+    from .ivariable_visitor import IVariableValueVisitor
+    from .ivariablemetadata_visitor import IVariableMetadataVisitor
+    from .local_content_cache import CachedFileContentContext, LocalContentCache
+    from .non_managing_file_scope import NonManagingFileScope
+    from .numeric_metadata import NumericMetadata
+    from .parallel_api_serialization import from_api_string_parallel, from_api_strings_parallel
+    from .scalar_metadata import BooleanMetadata, IntegerMetadata, RealMetadata, StringMetadata
+    from .scalar_value_conversion import (
+        to_boolean_value,
+        to_integer_value,
+        to_real_value,
+        to_string_value,
+    )
+    from .scalar_values import BooleanValue, IntegerValue, RealValue, StringValue
+    from .utils.content_sniffing import DEFAULT_CONTENT_SNIFFER, ContentSniffer, SniffedContent
+    from .utils.file_copy import FileCopyMethod
+    from .utils.implicit_coercion import implicit_coerce, implicit_coerce_single
+    from .utils.memory_accounting import estimate_nbytes, estimate_total_nbytes
+    from .utils.string_escaping import escape_string, unescape_string
+    from .value_interning import (
+        disable_interning,
+        enable_interning,
+        intern_strings,
+        intern_value,
+        interning_enabled,
+    )
+    from .var_type_array_check import var_type_is_array
+    from .variable_state import VariableState
+    from .variable_type import VariableType
+    from .variable_value import CommonArrayValue, IVariableValue, VariableValueInvalidError
+    from .vartype_arrays_and_elements import get_element_type, to_array_type
+    from .visitor_dispatch import TypeDispatcher, dispatch_by_type
+    from .write_behind_save_context import WriteBehindSaveContext
+
+    __version__: str
+    """ansys.tools.variableinterop version."""
+
+# Public attributes are imported from their submodules on first access (PEP 562), so
+# that importing the package does not load the file, async, and metadata subsystems
+# unless they are used.
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "from_api_string": ".api_serialization",
+    "from_api_strings": ".api_serialization",
+    "to_api_string": ".api_serialization",
+    "to_api_strings": ".api_serialization",
+    "TarLoadContext": ".archive_file_contexts",
+    "TarSaveContext": ".archive_file_contexts",
+    "ZipLoadContext": ".archive_file_contexts",
+    "ZipSaveContext": ".archive_file_contexts",
+    "BooleanArrayMetadata": ".array_metadata",
+    "IntegerArrayMetadata": ".array_metadata",
+    "RealArrayMetadata": ".array_metadata",
+    "StringArrayMetadata": ".array_metadata",
+    "BooleanArrayValue": ".array_values",
+    "IntegerArrayValue": ".array_values",
+    "RealArrayValue": ".array_values",
+    "StringArrayValue": ".array_values",
+    "convert_async": ".async_conversion",
+    "from_api_string_async": ".async_conversion",
+    "to_api_string_async": ".async_conversion",
+    "to_display_string_async": ".async_conversion",
+    "CommonVariableMetadata": ".common_variable_metadata",
+    "ContentAddressedFileScope": ".content_addressed_file_scope",
+    "ContentPinRegistry": ".content_pin_registry",
+    "SharedFileContentContext": ".content_pin_registry",
+    "IncompatibleTypesException": ".exceptions",
+    "ValueDeserializationUnsupportedException": ".exceptions",
+    "FileArrayMetadata": ".file_array_metadata",
+    "FileArrayValue": ".file_array_value",
+    "FileMetadata": ".file_metadata",
+    "FileScope": ".file_scope",
+    "EMPTY_FILE": ".file_value",
+    "AsyncLocalFileContentContext": ".file_value",
+    "FileValue": ".file_value",
+    "LocalFileContentContext": ".file_value",
+    "LocalFileValue": ".file_value",
+    "FromFormattedStringVisitor": ".from_formatted_string_visitor",
+    "CallbackSink": ".instrumentation",
+    "InstrumentationSink": ".instrumentation",
+    "LoggingSink": ".instrumentation",
+    "OperationRecord": ".instrumentation",
+    "OperationStats": ".instrumentation",
+    "StatsSink": ".instrumentation",
+    "disable_instrumentation": ".instrumentation",
+    "enable_instrumentation": ".instrumentation",
+    "instrumentation_enabled": ".instrumentation",
+    "instrumented": ".instrumentation",
+    "ILoadContext": ".isave_context",
+    "ISaveContext": ".isave_context",
+    "IVariableTypePseudoVisitor": ".ivariable_type_pseudovisitor",
+    "vartype_accept": ".ivariable_type_pseudovisitor",
+    "IVariableValueVisitor": ".ivariable_visitor",
+    "IVariableMetadataVisitor": ".ivariablemetadata_visitor",
+    "CachedFileContentContext": ".local_content_cache",
+    "LocalContentCache": ".local_content_cache",
+    "NonManagingFileScope": ".non_managing_file_scope",
+    "NumericMetadata": ".numeric_metadata",
+    "from_api_string_parallel": ".parallel_api_serialization",
+    "from_api_strings_parallel": ".parallel_api_serialization",
+    "BooleanMetadata": ".scalar_metadata",
+    "IntegerMetadata": ".scalar_metadata",
+    "RealMetadata": ".scalar_metadata",
+    "StringMetadata": ".scalar_metadata",
+    "to_boolean_value": ".scalar_value_conversion",
+    "to_integer_value": ".scalar_value_conversion",
+    "to_real_value": ".scalar_value_conversion",
+    "to_string_value": ".scalar_value_conversion",
+    "BooleanValue": ".scalar_values",
+    "IntegerValue": ".scalar_values",
+    "RealValue": ".scalar_values",
+    "StringValue": ".scalar_values",
+    "DEFAULT_CONTENT_SNIFFER": ".utils.content_sniffing",
+    "ContentSniffer": ".utils.content_sniffing",
+    "SniffedContent": ".utils.content_sniffing",
+    "FileCopyMethod": ".utils.file_copy",
+    "implicit_coerce": ".utils.implicit_coercion",
+    "implicit_coerce_single": ".utils.implicit_coercion",
+    "estimate_nbytes": ".utils.memory_accounting",
+    "estimate_total_nbytes": ".utils.memory_accounting",
+    "escape_string": ".utils.string_escaping",
+    "unescape_string": ".utils.string_escaping",
+    "disable_interning": ".value_interning",
+    "enable_interning": ".value_interning",
+    "intern_strings": ".value_interning",
+    "intern_value": ".value_interning",
+    "interning_enabled": ".value_interning",
+    "var_type_is_array": ".var_type_array_check",
+    "VariableState": ".variable_state",
+    "VariableType": ".variable_type",
+    "CommonArrayValue": ".variable_value",
+    "IVariableValue": ".variable_value",
+    "VariableValueInvalidError": ".variable_value",
+    "get_element_type": ".vartype_arrays_and_elements",
+    "to_array_type": ".vartype_arrays_and_elements",
+    "TypeDispatcher": ".visitor_dispatch",
+    "dispatch_by_type": ".visitor_dispatch",
+    "WriteBehindSaveContext": ".write_behind_save_context",
+}
+"""Submodule defining each public attribute of the package."""
+
+__all__ = ["__version__", *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value: Any = version("pyansys-tools-variableinterop")
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
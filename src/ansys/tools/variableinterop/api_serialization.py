@@ -19,9 +19,11 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-"""Defines the ``ToAPIStringVisitor`` class."""
-from typing import Optional
+"""Defines the ``ToAPIStringVisitor`` class and API string conversion functions."""
+import json
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 from overrides import overrides
 
 from .api_string_to_value_visitor import APIStringToValueVisitor
@@ -35,6 +37,9 @@ from .ivariable_visitor import IVariableValueVisitor
 from .scalar_values import BooleanValue, IntegerValue, RealValue, StringValue
 from .variable_type import VariableType
 from .variable_value import IVariableValue
+from .visitor_dispatch import TypeDispatcher, dispatch_by_type
+
+_GroupParser = Callable[[Sequence[str]], List[IVariableValue]]
 
 
 class ToAPIStringVisitor(IVariableValueVisitor[str]):
@@ -110,9 +115,45 @@ def to_api_string(value: IVariableValue, save_context: Optional[ISaveContext] =
     str
         Serialized form of the value.
     """
+    if save_context is None:
+        return value.accept(_NO_CONTEXT_VISITOR)
     return value.accept(ToAPIStringVisitor(save_context))
 
 
+_NO_CONTEXT_VISITOR = ToAPIStringVisitor(None)
+"""Shared visitor for conversions that do not support file values."""
+
+
+def to_api_strings(
+    values: Iterable[IVariableValue], save_context: Optional[ISaveContext] = None
+) -> List[str]:
+    """
+    Convert a batch of variable values to API strings.
+
+    The values may be of any mix of types. A single visitor is shared by the whole batch
+    and dispatched by value class, rather than being created and accepted for each value.
+
+    Parameters
+    ----------
+    values : Iterable[IVariableValue]
+        Values to convert to API strings.
+    save_context : Optional[ISaveContext], optional
+        Save context to use for conversion. The default value is ``None``, which indicates
+        that you do not want to support file values.
+
+    Returns
+    -------
+    List[str]
+        Serialized form of each value, in the order of ``values``.
+    """
+    dispatcher: TypeDispatcher[str]
+    if save_context is None:
+        dispatcher = dispatch_by_type(_NO_CONTEXT_VISITOR)
+    else:
+        dispatcher = TypeDispatcher(ToAPIStringVisitor(save_context))
+    return dispatcher.apply(values)
+
+
 def from_api_string(
     var_type: VariableType,
     source: str,
@@ -144,3 +185,180 @@ def from_api_string(
     generator: APIStringToValueVisitor = APIStringToValueVisitor(source, fscope, load_context)
     result: IVariableValue = vartype_accept(generator, var_type)
     return result
+
+
+def _parse_reals(sources: Sequence[str]) -> List[IVariableValue]:
+    """
+    Parse a group of ``REAL`` API strings with a single NumPy conversion.
+
+    If any string cannot be parsed, the group is parsed one string at a time so that the
+    error raised is the same as for ``RealValue.from_api_string``.
+    """
+    try:
+        parsed = np.asarray(sources, dtype=np.str_).astype(np.float64)
+    except (TypeError, ValueError):
+        return [RealValue.from_api_string(source) for source in sources]
+    return [RealValue(number) for number in parsed.tolist()]
+
+
+def _parse_integers(sources: Sequence[str]) -> List[IVariableValue]:
+    """
+    Parse a group of ``INTEGER`` API strings with a single NumPy conversion.
+
+    Strings written as floating-point numbers must be rounded as specified by
+    ``IntegerValue.from_api_string``, so a group containing any of them, or any string
+    that cannot be parsed, is parsed one string at a time.
+    """
+    if all(
+        isinstance(source, str) and "." not in source and "e" not in source and "E" not in source
+        for source in sources
+    ):
+        try:
+            parsed = np.asarray(sources, dtype=np.str_).astype(np.int64)
+        except (OverflowError, ValueError):
+            pass
+        else:
+            return [IntegerValue(number) for number in parsed.tolist()]
+    return [IntegerValue.from_api_string(source) for source in sources]
+
+
+def _each(parse: Callable[[str], IVariableValue]) -> _GroupParser:
+    """Make a group parser that applies a single-string parser to each string."""
+
+    def parse_group(sources: Sequence[str]) -> List[IVariableValue]:
+        return [parse(source) for source in sources]
+
+    return parse_group
+
+
+_GROUP_PARSERS: Dict[VariableType, _GroupParser] = {
+    VariableType.INTEGER: _parse_integers,
+    VariableType.REAL: _parse_reals,
+    VariableType.BOOLEAN: _each(BooleanValue.from_api_string),
+    VariableType.STRING: _each(StringValue.from_api_string),
+    VariableType.INTEGER_ARRAY: _each(IntegerArrayValue.from_api_string),
+    VariableType.REAL_ARRAY: _each(RealArrayValue.from_api_string),
+    VariableType.BOOLEAN_ARRAY: _each(BooleanArrayValue.from_api_string),
+    VariableType.STRING_ARRAY: _each(StringArrayValue.from_api_string),
+}
+"""Parsers for the types that do not need a file scope, by type."""
+
+
+def _file_group_parser(
+    var_type: VariableType, fscope: Optional[FileScope], load_context: Optional[ILoadContext]
+) -> _GroupParser:
+    """
+    Get the group parser for a type that needs a file scope and load context.
+
+    Parameters
+    ----------
+    var_type : VariableType
+        Type of the group. Must be ``FILE`` or ``FILE_ARRAY``.
+    fscope : Optional[FileScope]
+        File scope to use to deserialize file variables.
+    load_context : Optional[ILoadContext]
+        Load context to read file contents from.
+
+    Returns
+    -------
+    _GroupParser
+        Parser for the group.
+    """
+    if fscope is None or load_context is None:
+        raise NotImplementedError(
+            "Deserializing a file value requires a file scope and save context."
+        )
+    if var_type == VariableType.FILE:
+        return _each(lambda source: fscope.from_api_object(json.loads(source), load_context))
+    return _each(lambda source: FileArrayValue.from_api_string(source, load_context, fscope))
+
+
+def _types_and_sources(
+    pairs_or_types: Union[Iterable[Tuple[VariableType, str]], Iterable[VariableType], VariableType],
+    sources: Optional[Iterable[str]],
+) -> Tuple[List[VariableType], List[str]]:
+    """
+    Normalize the arguments of ``from_api_strings`` into parallel lists.
+
+    Parameters
+    ----------
+    pairs_or_types : Union[Iterable[Tuple[VariableType, str]], Iterable[VariableType], VariableType]
+        Variable type and source string pairs, variable types, or a single variable type.
+    sources : Optional[Iterable[str]]
+        Source strings, or ``None`` if ``pairs_or_types`` holds them.
+
+    Returns
+    -------
+    Tuple[List[VariableType], List[str]]
+        Variable type and source string of each value.
+    """
+    var_types: List[VariableType]
+    source_list: List[str]
+    if sources is None:
+        pairs = list(pairs_or_types)  # type: ignore
+        var_types = [var_type for var_type, _ in pairs]
+        source_list = [source for _, source in pairs]
+    else:
+        source_list = list(sources)
+        if isinstance(pairs_or_types, VariableType):
+            var_types = [pairs_or_types] * len(source_list)
+        else:
+            var_types = list(pairs_or_types)  # type: ignore
+            if len(var_types) != len(source_list):
+                raise ValueError(
+                    f"Got {len(var_types)} variable types for {len(source_list)} source strings."
+                )
+    return var_types, source_list
+
+
+def from_api_strings(
+    pairs_or_types: Union[Iterable[Tuple[VariableType, str]], Iterable[VariableType], VariableType],
+    sources: Optional[Iterable[str]] = None,
+    fscope: Optional[FileScope] = None,
+    load_context: Optional[ILoadContext] = None,
+) -> List[IVariableValue]:
+    """
+    Generate a batch of values from API strings.
+
+    The strings are grouped by variable type and each group is parsed together, so that,
+    for example, all ``REAL`` strings are parsed by a single NumPy conversion. The results
+    are returned in the original order.
+
+    Parameters
+    ----------
+    pairs_or_types : Union[Iterable[Tuple[VariableType, str]], Iterable[VariableType], VariableType]
+        If ``sources`` is ``None``, the variable type and source string of each value.
+        Otherwise, either the variable type of each string in ``sources`` or a single
+        variable type shared by all of them.
+    sources : Optional[Iterable[str]], optional
+        Source strings. The default is ``None``, which indicates that ``pairs_or_types``
+        holds the source strings.
+    fscope : Optional[FileScope], optional
+        File scope to use to deserialize file variables. The default is ``None``,
+        which indictates that file variables are not needed.
+    load_context : Optional[ILoadContext], optional
+        Load context to read file contents from. The default is ``None``, which
+        indicates file variables are not needed.
+
+    Returns
+    -------
+    List[IVariableValue]
+        Implementation of ``IVariableValue`` of the correct type for each source string,
+        in the order of the source strings.
+    """
+    var_types, source_list = _types_and_sources(pairs_or_types, sources)
+    groups: Dict[VariableType, List[int]] = {}
+    for index, var_type in enumerate(var_types):
+        groups.setdefault(var_type, []).append(index)
+
+    results: List[IVariableValue] = [None] * len(source_list)  # type: ignore
+    for var_type, indices in groups.items():
+        parse_group = _GROUP_PARSERS.get(var_type)
+        if parse_group is None:
+            if var_type not in (VariableType.FILE, VariableType.FILE_ARRAY):
+                raise NotImplementedError("Cannot create values with `UNKNOWN` type.")
+            parse_group = _file_group_parser(var_type, fscope, load_context)
+        parsed = parse_group([source_list[index] for index in indices])
+        for index, value in zip(indices, parsed):
+            results[index] = value
+    return results
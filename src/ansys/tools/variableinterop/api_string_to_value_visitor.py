@@ -204,6 +204,4 @@ class APIStringToValueVisitor(IVariableTypePseudoVisitor):
                 "Deserializing a file value requires a file scope and save context."
             )
         else:
-            return FileArrayValue.from_api_object(
-                json.loads(self._source), self._save_context, self._scope
-            )
+            return FileArrayValue.from_api_string(self._source, self._save_context, self._scope)
@@ -0,0 +1,441 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Defines save and load contexts that store file contents in a single archive."""
+from __future__ import annotations
+
+from abc import abstractmethod
+import hashlib
+import os
+from os import PathLike
+from pathlib import Path, PurePosixPath
+import shutil
+import tarfile
+import tempfile
+import threading
+from typing import IO, Dict, Final, Optional, Set, Tuple, Union
+from uuid import uuid4
+import zipfile
+
+from overrides import overrides
+
+from .isave_context import ILoadContext, ISaveContext
+from .utils.file_copy import DEFAULT_DIGEST_ALGORITHM, copy_stream_with_digest
+
+_COPY_BUFFER_SIZE: Final[int] = 1024 * 1024
+"""Size of the buffer used to stream file contents into and out of an archive."""
+
+
+def _check_member_name(content_id: str) -> str:
+    """
+    Check that a content ID can be used as the name of an archive member.
+
+    Parameters
+    ----------
+    content_id : str
+        Content ID to check.
+
+    Returns
+    -------
+    str
+        The content ID.
+
+    Raises
+    ------
+    ValueError
+        If the content ID is empty, absolute, or contains backslashes or ``..`` parts.
+    """
+    path = PurePosixPath(content_id)
+    if not content_id or "\\" in content_id or path.is_absolute() or ".." in path.parts:
+        raise ValueError(f"{content_id!r} cannot be used as the name of an archive member.")
+    return content_id
+
+
+class _HashingReader:
+    """Wraps a binary stream, hashing everything read from it."""
+
+    def __init__(self, stream: IO[bytes]):
+        self._stream: IO[bytes] = stream
+        self._hasher = hashlib.new(DEFAULT_DIGEST_ALGORITHM)
+
+    def read(self, size: int = -1) -> bytes:
+        data: bytes = self._stream.read(size)
+        self._hasher.update(data)
+        return data
+
+    @property
+    def digest(self) -> str:
+        """Digest of the data read so far in the form ``"<algorithm>:<hex digest>"``."""
+        return f"{DEFAULT_DIGEST_ALGORITHM}:{self._hasher.hexdigest()}"
+
+
+class _ArchiveSaveContext(ISaveContext):
+    """
+    Provides the common implementation of save contexts that write to an archive.
+
+    Each saved file becomes one member of the archive, named by its content ID. The
+    source file is read once and streamed directly into the archive, and the digest of
+    its contents is computed in the same pass. Saving contents with a known digest that
+    the archive already holds does not add another member.
+    """
+
+    def __init__(self, archive_path: Union[PathLike, str]):
+        self._archive_path: Path = Path(archive_path)
+        self._lock: threading.Lock = threading.Lock()
+        self._names: Set[str] = set()
+        self._digests: Dict[str, str] = {}
+        self._closed: bool = False
+
+    @property
+    def archive_path(self) -> Path:
+        """Path of the archive being written."""
+        return self._archive_path
+
+    @abstractmethod
+    def _add_member(self, source: Union[PathLike, str], name: str) -> str:
+        """
+        Stream a file into the archive.
+
+        Parameters
+        ----------
+        source : Union[PathLike, str]
+            File to add.
+        name : str
+            Name of the archive member.
+
+        Returns
+        -------
+        str
+            Digest of the file's contents, computed while it was added.
+        """
+        ...
+
+    @abstractmethod
+    def _close_archive(self) -> None:
+        """Finish writing the archive."""
+        ...
+
+    @overrides
+    def save_file(self, source: Union[PathLike, str], content_id: Optional[str] = None) -> str:
+        return self.save_file_with_digest(source, content_id, None)[0]
+
+    @overrides
+    def save_file_with_digest(
+        self, source: Union[PathLike, str], content_id: Optional[str], digest: Optional[str]
+    ) -> Tuple[str, Optional[str]]:
+        name: str = _check_member_name(content_id) if content_id is not None else str(uuid4())
+        with self._lock:
+            if self._closed:
+                raise ValueError("The save context is closed.")
+            if digest is not None and digest in self._digests:
+                return self._digests[digest], digest
+            if name not in self._names:
+                digest = self._add_member(source, name)
+                self._names.add(name)
+                self._digests.setdefault(digest, name)
+        return name, digest
+
+    @overrides
+    def flush(self) -> None:
+        # Members are written to the archive as soon as they are saved. The archive index
+        # is written when the context is closed.
+        pass
+
+    @overrides
+    def close(self) -> None:
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._close_archive()
+
+
+class ZipSaveContext(_ArchiveSaveContext):
+    """
+    Provides a save context that writes file contents to a single zip archive.
+
+    Each saved file becomes one member of the archive, named by its content ID. The
+    archive is complete once the context is closed.
+    """
+
+    def __init__(self, archive_path: Union[PathLike, str], compression: int = zipfile.ZIP_DEFLATED):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        archive_path : Union[PathLike, str]
+            Path of the archive to create. An existing file is overwritten.
+        compression : int, optional
+            Compression method used for the archive members, such as
+            ``zipfile.ZIP_STORED`` or ``zipfile.ZIP_DEFLATED``. The default is
+            ``zipfile.ZIP_DEFLATED``.
+        """
+        super().__init__(archive_path)
+        self._archive: zipfile.ZipFile = zipfile.ZipFile(
+            self._archive_path, "w", compression=compression
+        )
+
+    @overrides
+    def _add_member(self, source: Union[PathLike, str], name: str) -> str:
+        force_zip64: bool = os.stat(source).st_size * 1.05 > zipfile.ZIP64_LIMIT
+        with (
+            open(source, "rb") as src,
+            self._archive.open(name, "w", force_zip64=force_zip64) as dst,
+        ):
+            return copy_stream_with_digest(src, dst)[0]
+
+    @overrides
+    def _close_archive(self) -> None:
+        self._archive.close()
+
+
+class TarSaveContext(_ArchiveSaveContext):
+    """
+    Provides a save context that writes file contents to a single tar archive.
+
+    Each saved file becomes one member of the archive, named by its content ID. The
+    archive is complete once the context is closed.
+    """
+
+    def __init__(self, archive_path: Union[PathLike, str], compression: str = ""):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        archive_path : Union[PathLike, str]
+            Path of the archive to create. An existing file is overwritten.
+        compression : str, optional
+            Compression applied to the whole archive: ``""``, ``"gz"``, ``"bz2"``, or
+            ``"xz"``. The default is ``""``, which writes an uncompressed archive. Loading
+            members in random order is fastest from an uncompressed archive.
+        """
+        super().__init__(archive_path)
+        self._archive: tarfile.TarFile = tarfile.open(
+            self._archive_path, f"w:{compression}", dereference=True
+        )
+
+    @overrides
+    def _add_member(self, source: Union[PathLike, str], name: str) -> str:
+        with open(source, "rb") as src:
+            info: tarfile.TarInfo = self._archive.gettarinfo(arcname=name, fileobj=src)
+            info.mode = 0o644
+            info.uid = info.gid = 0
+            info.uname = info.gname = ""
+            reader: _HashingReader = _HashingReader(src)
+            self._archive.addfile(info, reader)
+            return reader.digest
+
+    @overrides
+    def _close_archive(self) -> None:
+        self._archive.close()
+
+
+class _ArchiveLoadContext(ILoadContext):
+    """
+    Provides the common implementation of load contexts that read from an archive.
+
+    The archive is opened when the first file is loaded. Each load extracts only the
+    member with the requested content ID, and loading the same content ID again returns
+    the file already extracted. Extracted files remain valid until the context is closed,
+    at which point they are deleted.
+    """
+
+    def __init__(
+        self,
+        archive_path: Union[PathLike, str],
+        extract_directory: Optional[Union[PathLike, str]] = None,
+    ):
+        self._archive_path: Path = Path(archive_path)
+        self._extract_directory: Optional[Path] = (
+            Path(extract_directory) if extract_directory is not None else None
+        )
+        self._owns_directory: bool = extract_directory is None
+        self._extracted: Dict[str, Path] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def archive_path(self) -> Path:
+        """Path of the archive being read."""
+        return self._archive_path
+
+    @abstractmethod
+    def _open_member(self, name: str) -> IO[bytes]:
+        """
+        Open an archive member for reading, opening the archive first if needed.
+
+        Parameters
+        ----------
+        name : str
+            Name of the archive member.
+
+        Returns
+        -------
+        IO[bytes]
+            Stream of the member's contents.
+
+        Raises
+        ------
+        KeyError
+            If the archive has no member with the given name.
+        """
+        ...
+
+    @abstractmethod
+    def _close_archive(self) -> None:
+        """Close the archive if it has been opened."""
+        ...
+
+    def _extract(self, name: str) -> Path:
+        if self._extract_directory is None:
+            self._extract_directory = Path(tempfile.mkdtemp(prefix="acvi-archive-"))
+        else:
+            self._extract_directory.mkdir(parents=True, exist_ok=True)
+        try:
+            member: IO[bytes] = self._open_member(name)
+        except KeyError:
+            raise FileNotFoundError(
+                f"The archive {self._archive_path} does not contain {name!r}."
+            ) from None
+        handle, temp_name = tempfile.mkstemp(dir=self._extract_directory)
+        try:
+            with member, os.fdopen(handle, "wb") as dst:
+                shutil.copyfileobj(member, dst, _COPY_BUFFER_SIZE)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+        return Path(temp_name)
+
+    @overrides
+    def load_file(self, content_id: Optional[str]) -> Optional[PathLike]:
+        if not content_id:
+            return None
+        with self._lock:
+            extracted: Optional[Path] = self._extracted.get(content_id)
+            if extracted is None:
+                extracted = self._extract(content_id)
+                self._extracted[content_id] = extracted
+            return extracted
+
+    @overrides
+    def flush(self) -> None:
+        pass
+
+    @overrides
+    def close(self) -> None:
+        with self._lock:
+            self._close_archive()
+            for extracted in self._extracted.values():
+                extracted.unlink(missing_ok=True)
+            self._extracted.clear()
+            if self._owns_directory and self._extract_directory is not None:
+                shutil.rmtree(self._extract_directory, ignore_errors=True)
+                self._extract_directory = None
+
+
+class ZipLoadContext(_ArchiveLoadContext):
+    """
+    Provides a load context that reads file contents from a single zip archive.
+
+    Only the archive's index is read when it is opened, so loading a file reads just that
+    file's member. Loaded files are extracted to a directory and remain valid until the
+    context is closed.
+    """
+
+    def __init__(
+        self,
+        archive_path: Union[PathLike, str],
+        extract_directory: Optional[Union[PathLike, str]] = None,
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        archive_path : Union[PathLike, str]
+            Path of the archive to read.
+        extract_directory : Optional[Union[PathLike, str]], optional
+            Directory to extract loaded files to. The default is ``None``, in which case a
+            temporary directory is created and deleted when the context is closed.
+        """
+        super().__init__(archive_path, extract_directory)
+        self._archive: Optional[zipfile.ZipFile] = None
+
+    @overrides
+    def _open_member(self, name: str) -> IO[bytes]:
+        if self._archive is None:
+            self._archive = zipfile.ZipFile(self._archive_path, "r")
+        return self._archive.open(name, "r")
+
+    @overrides
+    def _close_archive(self) -> None:
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+
+class TarLoadContext(_ArchiveLoadContext):
+    """
+    Provides a load context that reads file contents from a single tar archive.
+
+    Tar archives have no index, so the member headers are scanned once, when the first
+    file is loaded. Loaded files are extracted to a directory and remain valid until the
+    context is closed.
+    """
+
+    def __init__(
+        self,
+        archive_path: Union[PathLike, str],
+        extract_directory: Optional[Union[PathLike, str]] = None,
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        archive_path : Union[PathLike, str]
+            Path of the archive to read. Compressed archives are detected automatically.
+        extract_directory : Optional[Union[PathLike, str]], optional
+            Directory to extract loaded files to. The default is ``None``, in which case a
+            temporary directory is created and deleted when the context is closed.
+        """
+        super().__init__(archive_path, extract_directory)
+        self._archive: Optional[tarfile.TarFile] = None
+        self._members: Dict[str, tarfile.TarInfo] = {}
+
+    @overrides
+    def _open_member(self, name: str) -> IO[bytes]:
+        if self._archive is None:
+            self._archive = tarfile.open(self._archive_path, "r:*")
+            self._members = {
+                info.name: info for info in self._archive.getmembers() if info.isfile()
+            }
+        member: Optional[IO[bytes]] = self._archive.extractfile(self._members[name])
+        if member is None:
+            raise KeyError(name)
+        return member
+
+    @overrides
+    def _close_archive(self) -> None:
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+            self._members = {}
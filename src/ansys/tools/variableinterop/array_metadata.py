@@ -30,6 +30,8 @@ from .variable_type import VariableType
 class BooleanArrayMetadata(BooleanMetadata):
     """Provides metadata for the ``BooleanArrayValue`` variable type."""
 
+    __slots__ = ()
+
     @overrides
     def accept(self, visitor: IVariableMetadataVisitor[T]) -> T:
         return visitor.visit_boolean_array(self)
@@ -43,6 +45,8 @@ class BooleanArrayMetadata(BooleanMetadata):
 class IntegerArrayMetadata(IntegerMetadata):
     """Provides metadata for the ``IntegerArrayValue`` variable type."""
 
+    __slots__ = ()
+
     @overrides
     def accept(self, visitor: IVariableMetadataVisitor[T]) -> T:
         return visitor.visit_integer_array(self)
@@ -56,6 +60,8 @@ class IntegerArrayMetadata(IntegerMetadata):
 class RealArrayMetadata(RealMetadata):
     """Provides metadata for the ``RealArrayValue`` variable type."""
 
+    __slots__ = ()
+
     @overrides
     def accept(self, visitor: IVariableMetadataVisitor[T]) -> T:
         return visitor.visit_real_array(self)
@@ -69,6 +75,8 @@ class RealArrayMetadata(RealMetadata):
 class StringArrayMetadata(StringMetadata):
     """Provides metadata for the ``StringArrayValue`` variable type."""
 
+    __slots__ = ()
+
     @overrides
     def accept(self, visitor: IVariableMetadataVisitor[T]) -> T:
         return visitor.visit_string_array(self)
@@ -57,7 +57,7 @@ class BooleanArrayValue(CommonArrayValue[np.bool_]):
         if values is not None:
             return np.array(values, dtype=np.bool_).view(cls)
         elif shape_ is not None:
-            return super().__new__(cls, shape=shape_, dtype=np.bool_).view(cls)
+            return super().__new__(cls, shape=shape_, dtype=np.bool_)
         else:
             return np.zeros(shape=(), dtype=np.bool_).view(cls)
 
@@ -66,7 +66,7 @@ class BooleanArrayValue(CommonArrayValue[np.bool_]):
         return np.array_equal(self, other)
 
     @overrides
-    def clone(self) -> BooleanArrayValue:
+    def _unfrozen_copy(self) -> BooleanArrayValue:
         return np.copy(self).view(BooleanArrayValue)
 
     @overrides
@@ -167,7 +167,7 @@ class IntegerArrayValue(CommonArrayValue[np.int64]):
         if values is not None:
             return np.array(values, dtype=np.int64).view(cls)
         elif shape_ is not None:
-            return super().__new__(cls, shape=shape_, dtype=np.int64).view(cls)
+            return super().__new__(cls, shape=shape_, dtype=np.int64)
         else:
             return np.zeros(shape=(), dtype=np.int64).view(cls)
 
@@ -176,7 +176,7 @@ class IntegerArrayValue(CommonArrayValue[np.int64]):
         return np.array_equal(self, other)
 
     @overrides
-    def clone(self) -> IntegerArrayValue:
+    def _unfrozen_copy(self) -> IntegerArrayValue:
         return np.copy(self).view(IntegerArrayValue)
 
     @overrides
@@ -276,7 +276,7 @@ class RealArrayValue(CommonArrayValue[np.float64]):
         if values is not None:
             return np.array(values, dtype=np.float64).view(cls)
         elif shape_ is not None:
-            return super().__new__(cls, shape=shape_, dtype=np.float64).view(cls)
+            return super().__new__(cls, shape=shape_, dtype=np.float64)
         else:
             return np.zeros(shape=(), dtype=np.float64).view(cls)
 
@@ -285,7 +285,7 @@ class RealArrayValue(CommonArrayValue[np.float64]):
         return np.array_equal(self, other)
 
     @overrides
-    def clone(self) -> RealArrayValue:
+    def _unfrozen_copy(self) -> RealArrayValue:
         return np.copy(self).view(RealArrayValue)
 
     @overrides
@@ -397,7 +397,7 @@ class StringArrayValue(CommonArrayValue[np.str_]):
         if values is not None:
             return np.array(values, dtype=np.str_).view(cls)
         elif shape_ is not None:
-            return super().__new__(cls, shape=shape_, dtype=np.str_).view(cls)
+            return super().__new__(cls, shape=shape_, dtype=np.str_)
         else:
             return np.zeros(shape=(), dtype=np.str_).view(cls)
 
@@ -406,7 +406,7 @@ class StringArrayValue(CommonArrayValue[np.str_]):
         return np.array_equal(self, other)
 
     @overrides
-    def clone(self) -> StringArrayValue:
+    def _unfrozen_copy(self) -> StringArrayValue:
         return np.copy(self).view(StringArrayValue)
 
     @overrides
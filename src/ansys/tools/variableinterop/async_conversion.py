@@ -0,0 +1,285 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Provides awaitable variants of the conversions between values and strings.
+
+Conversions of large values are CPU-bound and would stall an event loop, so these
+functions run them on a worker thread, or optionally a worker process, once the value
+exceeds a size threshold. Smaller values are converted inline, where the cost of handing
+the work to a worker would exceed the conversion itself.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Optional, TypeVar
+
+from anyio import CapacityLimiter, to_process, to_thread
+import numpy as np
+
+from .api_serialization import from_api_string, to_api_string
+from .file_scope import FileScope
+from .isave_context import ILoadContext, ISaveContext
+from .variable_type import VariableType
+from .variable_value import IVariableValue
+
+R = TypeVar("R")
+
+DEFAULT_OFFLOAD_THRESHOLD: int = 1 << 14
+"""
+Size above which conversions are run off the event loop.
+
+The size of an array is its number of elements and the size of a string is its length.
+All other values have a size of one.
+"""
+
+_FILE_TYPES = (VariableType.FILE, VariableType.FILE_ARRAY)
+
+
+def _workload(value: Any) -> int:
+    """Get the size of a value, as compared against the offload threshold."""
+    if isinstance(value, np.ndarray):
+        return value.size
+    if isinstance(value, str):
+        return len(value)
+    return 1
+
+
+async def _run(
+    function: Callable[..., R],
+    *args: Any,
+    offload: bool,
+    use_process: bool,
+    limiter: Optional[CapacityLimiter],
+) -> R:
+    """
+    Run a function inline, on a worker thread, or on a worker process.
+
+    Parameters
+    ----------
+    function : Callable[..., R]
+        Function to run. Must be picklable if ``use_process`` is ``True``.
+    *args : Any
+        Positional arguments to the function.
+    offload : bool
+        Whether to run the function off the event loop.
+    use_process : bool
+        Whether to run the function on a worker process rather than a worker thread.
+    limiter : Optional[CapacityLimiter]
+        Limiter on the number of concurrent workers, or ``None`` for anyio's default.
+
+    Returns
+    -------
+    R
+        Result of the function.
+    """
+    if not offload:
+        return function(*args)
+    if use_process:
+        return await to_process.run_sync(function, *args, limiter=limiter)
+    return await to_thread.run_sync(function, *args, limiter=limiter)
+
+
+async def to_api_string_async(
+    value: IVariableValue,
+    save_context: Optional[ISaveContext] = None,
+    *,
+    threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    use_process: bool = False,
+    limiter: Optional[CapacityLimiter] = None,
+) -> str:
+    """
+    Convert a variable value to an API string without blocking the event loop.
+
+    File values converted with a save context are always converted on a worker thread,
+    since saving their contents performs blocking I/O.
+
+    Parameters
+    ----------
+    value : IVariableValue
+        Value to convert to an API string.
+    save_context : Optional[ISaveContext], optional
+        Save context to use for conversion. The default value is ``None``, which indicates
+        that you do not want to support file values.
+    threshold : int, optional
+        Size of value above which the conversion runs off the event loop.
+    use_process : bool, optional
+        Whether to run large conversions on a worker process rather than a worker thread.
+        File values are always converted on a thread.
+    limiter : Optional[CapacityLimiter], optional
+        Limiter on the number of concurrent workers. The default is ``None``, which uses
+        anyio's default limiter.
+
+    Returns
+    -------
+    str
+        Serialized form of the value.
+    """
+    if save_context is not None and value.variable_type in _FILE_TYPES:
+        return await _run(
+            to_api_string, value, save_context, offload=True, use_process=False, limiter=limiter
+        )
+    return await _run(
+        to_api_string,
+        value,
+        offload=_workload(value) > threshold,
+        use_process=use_process,
+        limiter=limiter,
+    )
+
+
+async def from_api_string_async(
+    var_type: VariableType,
+    source: str,
+    fscope: Optional[FileScope] = None,
+    load_context: Optional[ILoadContext] = None,
+    *,
+    threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    use_process: bool = False,
+    limiter: Optional[CapacityLimiter] = None,
+) -> IVariableValue:
+    """
+    Generate a value from an API string without blocking the event loop.
+
+    Parameters
+    ----------
+    var_type : VariableType
+        Variable type to generate.
+    source : str
+        Source string.
+    fscope : Optional[FileScope], optional
+        File scope to use to deserialize file variables. The default is ``None``,
+        which indictates that file variables are not needed.
+    load_context : Optional[ILoadContext], optional
+        Load context to read file contents from. The default is ``None``, which
+        indicates file variables are not needed.
+    threshold : int, optional
+        Length of source string above which the conversion runs off the event loop.
+    use_process : bool, optional
+        Whether to run large conversions on a worker process rather than a worker thread.
+        File values are always parsed on a thread, as they need the load context.
+    limiter : Optional[CapacityLimiter], optional
+        Limiter on the number of concurrent workers. The default is ``None``, which uses
+        anyio's default limiter.
+
+    Returns
+    -------
+    IVariableValue
+        Implementation of ``IVariableValue`` of the correct type with a value parsed from the
+        specified string.
+    """
+    return await _run(
+        from_api_string,
+        var_type,
+        source,
+        fscope,
+        load_context,
+        offload=_workload(source) > threshold,
+        use_process=use_process and var_type not in _FILE_TYPES,
+        limiter=limiter,
+    )
+
+
+async def to_display_string_async(
+    value: IVariableValue,
+    locale_name: str,
+    *,
+    threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    use_process: bool = False,
+    limiter: Optional[CapacityLimiter] = None,
+) -> str:
+    """
+    Get a display string for a value without blocking the event loop.
+
+    Parameters
+    ----------
+    value : IVariableValue
+        Value to format.
+    locale_name : str
+        Locale to format the value in.
+    threshold : int, optional
+        Size of value above which the conversion runs off the event loop.
+    use_process : bool, optional
+        Whether to run large conversions on a worker process rather than a worker thread.
+    limiter : Optional[CapacityLimiter], optional
+        Limiter on the number of concurrent workers. The default is ``None``, which uses
+        anyio's default limiter.
+
+    Returns
+    -------
+    str
+        Display string for the value.
+    """
+    return await _run(
+        _to_display_string,
+        value,
+        locale_name,
+        offload=_workload(value) > threshold,
+        use_process=use_process and value.variable_type not in _FILE_TYPES,
+        limiter=limiter,
+    )
+
+
+def _to_display_string(value: IVariableValue, locale_name: str) -> str:
+    """Call ``to_display_string`` as a module-level function that can be pickled."""
+    return value.to_display_string(locale_name)
+
+
+async def convert_async(
+    conversion: Callable[[IVariableValue], R],
+    value: IVariableValue,
+    *,
+    threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    use_process: bool = False,
+    limiter: Optional[CapacityLimiter] = None,
+) -> R:
+    """
+    Apply a value conversion without blocking the event loop.
+
+    This is intended for the conversions in ``scalar_value_conversion`` and
+    ``array_value_conversion``, such as ``to_real_array_value``.
+
+    Parameters
+    ----------
+    conversion : Callable[[IVariableValue], R]
+        Conversion to apply. Must be a module-level function if ``use_process`` is
+        ``True``.
+    value : IVariableValue
+        Value to convert.
+    threshold : int, optional
+        Size of value above which the conversion runs off the event loop.
+    use_process : bool, optional
+        Whether to run large conversions on a worker process rather than a worker thread.
+    limiter : Optional[CapacityLimiter], optional
+        Limiter on the number of concurrent workers. The default is ``None``, which uses
+        anyio's default limiter.
+
+    Returns
+    -------
+    R
+        Converted value.
+    """
+    return await _run(
+        conversion,
+        value,
+        offload=_workload(value) > threshold,
+        use_process=use_process,
+        limiter=limiter,
+    )
@@ -24,14 +24,12 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import copy
-from typing import Any, Dict, Type, TypeVar
+from typing import Any, Dict, Set
 
-from overrides import overrides
-
-from ansys.tools.variableinterop import exceptions
 import ansys.tools.variableinterop.ivariablemetadata_visitor as ivariablemetadata_visitor
 import ansys.tools.variableinterop.variable_type as variable_type_lib
 
+from .utils.memory_accounting import estimate_nbytes, instance_nbytes
 from .variable_value import IVariableValue
 
 
@@ -45,10 +43,14 @@ class CommonVariableMetadata(ABC):
     specific metadata as needed.
     """
 
+    # Many metadata instances may be held at once, so they are stored without a __dict__.
+    # The custom metadata slot is left empty until first accessed.
+    __slots__ = ("_description", "_custom_metadata")
+    _custom_metadata: Dict[str, IVariableValue]
+
     def __init__(self) -> None:
         """Initialize all members."""
         self._description: str = ""
-        self._custom_metadata: Dict[str, IVariableValue] = {}
 
     def __eq__(self, other):
         """Determine if the object is equal to the metadata."""
@@ -72,7 +74,7 @@ class CommonVariableMetadata(ABC):
             isinstance(other, CommonVariableMetadata)
             and self.variable_type == other.variable_type
             and self._description == other._description
-            and self._custom_metadata == other._custom_metadata
+            and getattr(self, "_custom_metadata", {}) == getattr(other, "_custom_metadata", {})
         )
         return equal
 
@@ -121,7 +123,46 @@ class CommonVariableMetadata(ABC):
     @property
     def custom_metadata(self) -> Dict[str, IVariableValue]:
         """Custom metadata stored in a dictionary."""
-        return self._custom_metadata
+        try:
+            return self._custom_metadata
+        except AttributeError:
+            self._custom_metadata = {}
+            return self._custom_metadata
+
+    def estimated_nbytes(self, include_file_contents: bool = False) -> int:
+        """
+        Estimate the memory used by this metadata.
+
+        Parameters
+        ----------
+        include_file_contents : bool, optional
+            Whether to count the size of the contents of file values, which are normally
+            stored on disk rather than in memory.
+
+        Returns
+        -------
+        int
+            Estimated size, in bytes.
+        """
+        return estimate_nbytes(self, include_file_contents)
+
+    def _estimate_nbytes(self, include_file_contents: bool, seen: Set[int]) -> int:
+        """
+        Estimate the memory used by this metadata, not counting objects already counted.
+
+        Parameters
+        ----------
+        include_file_contents : bool
+            Whether to count the size of the contents of file values.
+        seen : Set[int]
+            IDs of the objects already counted.
+
+        Returns
+        -------
+        int
+            Estimated size, in bytes.
+        """
+        return instance_nbytes(self, include_file_contents, seen)
 
     def get_default_value(self) -> IVariableValue:
         """
@@ -141,176 +182,9 @@ class CommonVariableMetadata(ABC):
           upper bound, use the upper bound.
         - If no value is valid, use the type's default value.
         """
-        from ansys.tools.variableinterop import (
-            array_metadata,
-            array_values,
-            file_array_metadata,
-            file_array_value,
-            file_metadata,
-            file_value,
-            scalar_metadata,
-            scalar_values,
-        )
+        from .default_value_visitors import METADATA_DEFAULT_VALUE_VISITOR
 
-        class __DefaultValueVisitor(
-            ivariablemetadata_visitor.IVariableMetadataVisitor[IVariableValue]
-        ):
-            """Implements the metadata visitor for getting the default value."""
-
-            @staticmethod
-            def __get_str_enumerated_default(
-                metadata: scalar_metadata.StringMetadata,
-            ) -> scalar_values.StringValue:
-                """
-                For the given ``StringMetadata`` value, use enumerated values to get the
-                default value to use for the associated variable.
-
-                Parameters
-                ----------
-                metadata : StringMetadata
-                    Metadata to use to generate the default value.
-
-                Returns
-                -------
-                StringValue
-                    Default value to use for the associated variable.
-                """
-                default_value: scalar_values.StringValue = scalar_values.StringValue()
-                if metadata.enumerated_values is not None and len(metadata.enumerated_values):
-                    if default_value not in metadata.enumerated_values:
-                        default_value = metadata.enumerated_values[0]
-                return default_value
-
-            M = TypeVar("M", scalar_metadata.IntegerMetadata, scalar_metadata.RealMetadata)
-            T = TypeVar("T", scalar_values.IntegerValue, scalar_values.RealValue)
-
-            @staticmethod
-            def __get_numeric_default(metadata: M, type_: Type[T]) -> T:
-                """
-                For a numeric metadata (``IntegerMetadata`` or ``RealMetadata`` type),
-                get the default value to use for the associated variable.
-
-                Parameters
-                ----------
-                metadata : M
-                    Metadata to use to generate the default value.
-                type_ : Type[T]
-                    Type of the default value to generate.
-
-                Returns
-                -------
-                T
-                    Default value to use for the associated variable.
-                """
-                default_value = type_()
-                if metadata.enumerated_values is not None and len(metadata.enumerated_values):
-                    # enumerated values are defined
-                    # if default value is not valid
-                    if (
-                        default_value not in metadata.enumerated_values
-                        or (
-                            metadata.lower_bound is not None
-                            and default_value < metadata.lower_bound
-                        )
-                        or (
-                            metadata.upper_bound is not None
-                            and metadata.upper_bound < default_value
-                        )
-                    ):
-                        # find the first enumerated value that is valid
-                        # if one does not exist, use default value anyway
-                        default_value = next(
-                            (
-                                e
-                                for e in metadata.enumerated_values
-                                if (metadata.lower_bound is None or metadata.lower_bound <= e)
-                                and (metadata.upper_bound is None or e <= metadata.upper_bound)
-                            ),
-                            default_value,
-                        )
-                else:
-                    # no enumerated values are defined
-                    # if default value is not valid
-                    if (
-                        metadata.lower_bound is not None and default_value < metadata.lower_bound
-                    ) or (
-                        metadata.upper_bound is not None and metadata.upper_bound < default_value
-                    ):
-                        # default is not valid.
-                        # if have a lower_bound
-                        if metadata.lower_bound is not None:
-                            # if lower_bound is valid, use it
-                            if (
-                                metadata.upper_bound is None
-                                or metadata.lower_bound <= metadata.upper_bound
-                            ):
-                                default_value = metadata.lower_bound
-                        # else if have an upper_bound, use it
-                        elif metadata.upper_bound is not None:
-                            default_value = metadata.upper_bound
-                        # else nothing is valid, just use default value
-                    # else default_value is valid, use it
-
-                return default_value
-
-            @overrides
-            def visit_integer(
-                self, metadata: scalar_metadata.IntegerMetadata
-            ) -> scalar_values.IntegerValue:
-                return self.__get_numeric_default(metadata, scalar_values.IntegerValue)
-
-            @overrides
-            def visit_real(self, metadata: scalar_metadata.RealMetadata) -> scalar_values.RealValue:
-                return self.__get_numeric_default(metadata, scalar_values.RealValue)
-
-            @overrides
-            def visit_boolean(
-                self, metadata: scalar_metadata.BooleanMetadata
-            ) -> scalar_values.BooleanValue:
-                return scalar_values.BooleanValue()
-
-            @overrides
-            def visit_string(
-                self, metadata: scalar_metadata.StringMetadata
-            ) -> scalar_values.StringValue:
-                return self.__get_str_enumerated_default(metadata)
-
-            @overrides
-            def visit_file(self, metadata: file_metadata.FileMetadata) -> file_value.FileValue:
-                return file_value.EMPTY_FILE
-
-            @overrides
-            def visit_integer_array(
-                self, metadata: array_metadata.IntegerArrayMetadata
-            ) -> array_values.IntegerArrayValue:
-                return array_values.IntegerArrayValue()
-
-            @overrides
-            def visit_real_array(
-                self, metadata: array_metadata.RealArrayMetadata
-            ) -> array_values.RealArrayValue:
-                return array_values.RealArrayValue()
-
-            @overrides
-            def visit_boolean_array(
-                self, metadata: array_metadata.BooleanArrayMetadata
-            ) -> array_values.BooleanArrayValue:
-                return array_values.BooleanArrayValue()
-
-            @overrides
-            def visit_string_array(
-                self, metadata: array_metadata.StringArrayMetadata
-            ) -> array_values.StringArrayValue:
-                return array_values.StringArrayValue()
-
-            @overrides
-            def visit_file_array(
-                self, metadata: file_array_metadata.FileArrayMetadata
-            ) -> file_array_value.FileArrayValue:
-                return file_array_value.FileArrayValue()
-
-        visitor = __DefaultValueVisitor()
-        return self.accept(visitor)
+        return self.accept(METADATA_DEFAULT_VALUE_VISITOR)
 
     def runtime_convert(self, source: IVariableValue) -> IVariableValue:
         """
@@ -326,64 +200,9 @@ class CommonVariableMetadata(ABC):
         IVariableValue
             Value converted to the appropriate type.
         """
-        from ansys.tools.variableinterop import (
-            array_value_conversion,
-            array_values,
-            file_array_value,
-            file_value,
-            scalar_value_conversion,
-            scalar_values,
-        )
+        from .default_value_visitors import RUNTIME_CONVERTER_VISITOR
 
-        class __RuntimeConvertVisitor(
-            ivariablemetadata_visitor.IVariableMetadataVisitor[IVariableValue]
-        ):
-            @overrides
-            def visit_integer(self, metadata) -> scalar_values.IntegerValue:
-                return scalar_value_conversion.to_integer_value(source)
-
-            @overrides
-            def visit_real(self, metadata) -> scalar_values.RealValue:
-                return scalar_value_conversion.to_real_value(source)
-
-            @overrides
-            def visit_boolean(self, metadata) -> scalar_values.BooleanValue:
-                return scalar_value_conversion.to_boolean_value(source)
-
-            @overrides
-            def visit_string(self, metadata) -> scalar_values.StringValue:
-                return scalar_value_conversion.to_string_value(source)
-
-            @overrides
-            def visit_file(self, metadata) -> file_value.FileValue:
-                raise exceptions.IncompatibleTypesException(
-                    source.variable_type, variable_type_lib.VariableType.FILE
-                )
-
-            @overrides
-            def visit_integer_array(self, metadata) -> array_values.IntegerArrayValue:
-                return array_value_conversion.to_integer_array_value(source)
-
-            @overrides
-            def visit_real_array(self, metadata) -> array_values.RealArrayValue:
-                return array_value_conversion.to_real_array_value(source)
-
-            @overrides
-            def visit_boolean_array(self, metadata) -> array_values.BooleanArrayValue:
-                return array_value_conversion.to_boolean_array_value(source)
-
-            @overrides
-            def visit_string_array(self, metadata) -> array_values.StringArrayValue:
-                return array_value_conversion.to_string_array_value(source)
-
-            @overrides
-            def visit_file_array(self, metadata) -> file_array_value.FileArrayValue:
-                raise exceptions.IncompatibleTypesException(
-                    source.variable_type, variable_type_lib.VariableType.FILE_ARRAY
-                )
-
-        visitor = __RuntimeConvertVisitor()
-        return self.accept(visitor)
+        return self.accept(RUNTIME_CONVERTER_VISITOR)(source)
 
     @property
     @abstractmethod
@@ -0,0 +1,420 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Defines the ``ContentAddressedFileScope`` class."""
+from __future__ import annotations
+
+import hashlib
+import os
+from os import PathLike
+from pathlib import Path
+import string
+import threading
+from typing import Dict, Final, Optional, Sequence, Set, Tuple, Union
+from uuid import uuid4
+
+from overrides import overrides
+
+from .file_scope import FileScope
+from .file_value import EMPTY_FILE, FileValue, LocalFileValue
+from .isave_context import ILoadContext, ISaveContext
+from .utils.content_sniffing import ContentSniffer
+from .utils.file_copy import FileCopyMethod, copy_file_with_digest
+
+
+class _BlobReferences:
+    """Bookkeeping for one blob shared by the scopes of this process."""
+
+    def __init__(self, kept: bool):
+        self.scopes: int = 0
+        self.kept: bool = kept
+
+
+_blob_references: Dict[Tuple[Path, str], _BlobReferences] = {}
+"""Blobs used by open scopes, by store directory and digest, so that scopes sharing a store
+agree on when to delete them."""
+_blob_references_lock = threading.Lock()
+
+
+class ContentAddressedFileScope(FileScope, ISaveContext, ILoadContext):
+    """
+    Provides a file scope that stores each distinct file content once.
+
+    File contents are stored as blobs in a local directory, named by the digest of
+    their content. Reading a file whose content is already in the store does not copy
+    it again, and ``FileValue`` instances with identical content share one blob.
+
+    This file scope also serves as a save and load context for the same blob store. The
+    content ID of a saved file is always its digest, so saving content that the store
+    already holds is a no-op. Blobs that were added to the store but never saved are
+    deleted once every scope in this process that uses them is closed. Blobs that were
+    saved, or that were already in the store, are kept so that they can be loaded later.
+    """
+
+    class ContentAddressedFileValue(LocalFileValue):
+        """Implementation of a ``FileValue`` instance used by this scope."""
+
+        __slots__ = ("__digest",)
+
+        def __init__(
+            self,
+            blob_path: PathLike,
+            digest: str,
+            hash_name: str,
+            original_path: Optional[PathLike] = None,
+            mime_type: Optional[str] = None,
+            encoding: Optional[str] = None,
+            file_size: Optional[int] = None,
+            copy_methods: Optional[Sequence[FileCopyMethod]] = None,
+        ) -> None:
+            """
+            Construct a new ``ContentAddressedFileValue`` instance.
+
+            Parameters
+            ----------
+            blob_path : PathLike
+                Path to the blob holding the file's contents.
+            digest : str
+                Hexadecimal digest of the file's contents.
+            hash_name : str
+                Name of the hash algorithm that computed the digest.
+            original_path : Optional[PathLike], optional
+                Path to the file that was read. The default value is ``None``, which
+                indicates that the original path is not known.
+            mime_type : Optional[str], optional
+                MIME type of the file. The default value is ``None``, which indicates that
+                the MIME type is not known or the file does not have one.
+            encoding : Optional[str], optional
+                Encoding of the file. The default value is ``None``, which indicates that
+                the file does not have a known text encoding.
+            file_size : Optional[int], optional
+                Size of the file in bytes. The default value is ``None``, which indicates
+                that the size is not known.
+            copy_methods : Optional[Sequence[FileCopyMethod]], optional
+                Methods to try, in order, when writing the contents to a file. The default
+                value is ``None``, in which case the default methods are used.
+            """
+            super().__init__(
+                original_path=original_path,
+                mime_type=mime_type,
+                encoding=encoding,
+                value_id=uuid4(),
+                file_size=file_size,
+                actual_content_file_name=blob_path,
+                copy_methods=copy_methods,
+            )
+            self.__digest: str = digest
+            self._record_digest(blob_path, f"{hash_name}:{digest}")
+
+        @property
+        def content_digest(self) -> str:
+            """Hexadecimal digest of the file's contents."""
+            return self.__digest
+
+        @overrides
+        def _has_content(self) -> bool:
+            return True
+
+        @overrides
+        def _send_actual_file(self, save_context: ISaveContext) -> str:
+            return self._save_content(save_context, self.actual_content_file_name, None)
+
+    _HASH_CHUNK_SIZE: Final[int] = 1024 * 1024
+    """Number of bytes read at a time when hashing a file."""
+
+    def __init__(
+        self,
+        blob_directory: Union[PathLike, str],
+        hash_name: str = "sha256",
+        copy_methods: Optional[Sequence[FileCopyMethod]] = None,
+        content_sniffer: Optional[ContentSniffer] = None,
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        blob_directory : Union[PathLike, str]
+            Directory in which blobs are stored. It is created if it does not exist. Blobs
+            saved by earlier scopes using the same directory are reused.
+        hash_name : str, optional
+            Name of the ``hashlib`` algorithm used to compute digests. The default is
+            ``"sha256"``.
+        copy_methods : Optional[Sequence[FileCopyMethod]], optional
+            Methods tried, in order, when ``FileValue`` instances write their contents to
+            a file. The default is ``None``, in which case the default methods are used.
+        content_sniffer : Optional[ContentSniffer], optional
+            Content sniffer used to detect the MIME type and encoding of files read without
+            them. The default is ``None``, in which case they are not detected.
+        """
+        super().__init__(copy_methods, content_sniffer)
+        self._blob_directory: Path = Path(blob_directory)
+        self._blob_directory.mkdir(parents=True, exist_ok=True)
+        self._hash_name: str = hash_name
+        self._digest_length: int = hashlib.new(hash_name).digest_size * 2
+        self._store_key: Path = self._blob_directory.resolve()
+        self._referenced_digests: Set[str] = set()
+
+    @property
+    def blob_directory(self) -> Path:
+        """Directory in which blobs are stored."""
+        return self._blob_directory
+
+    def blob_path(self, digest: str) -> Path:
+        """
+        Get the path of the blob for a digest.
+
+        The blob does not necessarily exist.
+
+        Parameters
+        ----------
+        digest : str
+            Hexadecimal digest of the content.
+
+        Returns
+        -------
+        Path
+            Path of the blob.
+        """
+        if len(digest) != self._digest_length or any(
+            char not in string.hexdigits for char in digest
+        ):
+            raise ValueError(f"'{digest}' is not a valid {self._hash_name} digest.")
+        digest = digest.lower()
+        return self._blob_directory / digest[:2] / digest
+
+    def compute_digest(self, source: Union[PathLike, str]) -> str:
+        """
+        Compute the digest of a file's contents.
+
+        Parameters
+        ----------
+        source : Union[PathLike, str]
+            Path to the file.
+
+        Returns
+        -------
+        str
+            Hexadecimal digest of the file's contents.
+        """
+        hasher = hashlib.new(self._hash_name)
+        with open(source, "rb") as in_file:
+            for chunk in iter(lambda: in_file.read(self._HASH_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def _digest_of_blob(self, source: Union[PathLike, str]) -> Optional[str]:
+        """
+        Get the digest of a file if it is a blob in this store.
+
+        Parameters
+        ----------
+        source : Union[PathLike, str]
+            Path to the file.
+
+        Returns
+        -------
+        Optional[str]
+            Digest of the blob, or ``None`` if the file is not a blob in this store.
+        """
+        source_path: Path = Path(source)
+        try:
+            if source_path == self.blob_path(source_path.name):
+                return source_path.name
+        except ValueError:
+            pass
+        return None
+
+    def _reference(self, digest: str, keep: bool = False) -> None:
+        """
+        Record that this scope uses a blob, so that other scopes do not delete it.
+
+        Must be called with the blob references lock held.
+
+        Parameters
+        ----------
+        digest : str
+            Hexadecimal digest of the blob's content.
+        keep : bool, optional
+            Whether the blob must be kept after all scopes using it are closed, because it
+            was saved. The default is ``False``.
+        """
+        digest = digest.lower()
+        key: Tuple[Path, str] = (self._store_key, digest)
+        references: Optional[_BlobReferences] = _blob_references.get(key)
+        if references is None:
+            # A blob that no open scope knows about was saved by an earlier scope.
+            references = _BlobReferences(kept=self.blob_path(digest).exists())
+            _blob_references[key] = references
+        if digest not in self._referenced_digests:
+            self._referenced_digests.add(digest)
+            references.scopes += 1
+        references.kept = references.kept or keep
+
+    def _store(self, source: Union[PathLike, str]) -> str:
+        """
+        Add a file's contents to the store unless the store already holds them.
+
+        Parameters
+        ----------
+        source : Union[PathLike, str]
+            Path to the file to store.
+
+        Returns
+        -------
+        str
+            Digest of the file's contents.
+        """
+        digest: Optional[str] = self._digest_of_blob(source)
+        if digest is not None:
+            with _blob_references_lock:
+                self._reference(digest)
+            return digest
+
+        # Copy under a temporary name while hashing, so that the source is read only once
+        # and a partially written blob is never visible under its digest.
+        temp_blob: Path = self._blob_directory / f".{uuid4().hex}.tmp"
+        try:
+            prefixed_digest, _ = copy_file_with_digest(source, temp_blob, self._hash_name)
+            digest = prefixed_digest.partition(":")[2]
+            blob: Path = self.blob_path(digest)
+            with _blob_references_lock:
+                self._reference(digest)
+                if not blob.exists():
+                    blob.parent.mkdir(exist_ok=True)
+                    os.replace(temp_blob, blob)
+        finally:
+            temp_blob.unlink(missing_ok=True)
+        return digest
+
+    def _create_value(
+        self,
+        digest: str,
+        original_path: Optional[PathLike],
+        mime_type: Optional[str],
+        encoding: Optional[str],
+    ) -> ContentAddressedFileScope.ContentAddressedFileValue:
+        blob: Path = self.blob_path(digest)
+        return ContentAddressedFileScope.ContentAddressedFileValue(
+            blob,
+            digest,
+            self._hash_name,
+            original_path,
+            mime_type,
+            encoding,
+            blob.stat().st_size,
+            self.copy_methods,
+        )
+
+    @overrides
+    def read_from_file(
+        self, to_read: PathLike, mime_type: Optional[str] = None, encoding: Optional[str] = None
+    ) -> FileValue:
+        mime_type, encoding = self._sniff_metadata(to_read, mime_type, encoding)
+        digest: str = self._store(to_read)
+        return self._create_value(digest, to_read, mime_type, encoding)
+
+    @overrides
+    def from_api_object(
+        self, api_object: Dict[str, Optional[str]], load_context: ILoadContext
+    ) -> FileValue:
+        if FileValue.CONTENTS_KEY in api_object:
+            content: Optional[PathLike] = load_context.load_file(
+                api_object.get(FileValue.CONTENTS_KEY)
+            )
+            if content is not None:
+                original_path: Optional[str] = api_object.get(FileValue.ORIGINAL_FILENAME_KEY)
+                return self._create_value(
+                    self._store(content),
+                    Path(original_path) if original_path else None,
+                    api_object.get(FileValue.MIMETYPE_KEY),
+                    api_object.get(FileValue.ENCODING_KEY),
+                )
+        return EMPTY_FILE
+
+    @overrides
+    def save_file(self, source: Union[PathLike, str], content_id: Optional[str] = None) -> str:
+        """
+        Save a file to the blob store.
+
+        The file is only copied if the store does not already hold its content.
+
+        Parameters
+        ----------
+        source : Union[PathLike, str]
+            File on disk to save.
+        content_id : Optional[str], optional
+            Ignored. Content is always identified by its digest.
+
+        Returns
+        -------
+        str
+            Digest of the file's contents, which can be used to load it.
+        """
+        digest: str = self._store(source)
+        with _blob_references_lock:
+            self._reference(digest, keep=True)
+        return digest
+
+    @overrides
+    def save_file_with_digest(
+        self, source: Union[PathLike, str], content_id: Optional[str], digest: Optional[str]
+    ) -> Tuple[str, Optional[str]]:
+        prefix: str = f"{self._hash_name}:"
+        if digest is not None and digest.startswith(prefix):
+            known: str = digest[len(prefix) :]
+            try:
+                blob: Path = self.blob_path(known)
+                with _blob_references_lock:
+                    if blob.exists():
+                        self._reference(known, keep=True)
+                        return known.lower(), digest
+            except ValueError:
+                pass
+        saved: str = self.save_file(source, content_id)
+        return saved, prefix + saved
+
+    @overrides
+    def load_file(self, content_id: Optional[str]) -> Optional[PathLike]:
+        if not content_id:
+            return None
+        blob: Path = self.blob_path(content_id)
+        if not blob.exists():
+            raise FileNotFoundError(f"The blob store does not contain content {content_id}.")
+        return blob
+
+    @overrides
+    def flush(self) -> None:
+        # Blobs are written as soon as they are saved, so there is nothing to flush.
+        pass
+
+    @overrides
+    def close(self) -> None:
+        with _blob_references_lock:
+            for digest in self._referenced_digests:
+                key: Tuple[Path, str] = (self._store_key, digest)
+                references: _BlobReferences = _blob_references[key]
+                references.scopes -= 1
+                if references.scopes == 0:
+                    del _blob_references[key]
+                    if not references.kept:
+                        self.blob_path(digest).unlink(missing_ok=True)
+            self._referenced_digests.clear()
@@ -0,0 +1,258 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Defines the ``ContentPinRegistry`` class."""
+from __future__ import annotations
+
+from pathlib import Path
+import threading
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from anyio import to_thread
+from overrides import overrides
+
+from .file_value import AsyncLocalFileContentContext, LocalFileContentContext
+
+_ASYNC_WAIT_STEP: float = 0.1
+"""Seconds a worker thread waits for a realization before checking for cancellation."""
+
+
+class _SharedPin:
+    """Bookkeeping for one realization of some content shared by several readers."""
+
+    def __init__(self) -> None:
+        self.context: Optional[LocalFileContentContext] = None
+        self.error: Optional[BaseException] = None
+        self.references: int = 1
+        self.done: threading.Event = threading.Event()
+
+
+class SharedFileContentContext(LocalFileContentContext, AsyncLocalFileContentContext):
+    """
+    Provides a local file content context that shares its file with other readers.
+
+    Exiting the context releases this reader's reference. The underlying context, which
+    may delete the file, is exited once every reader has released its reference.
+    """
+
+    def __init__(self, registry: ContentPinRegistry, key: str, pin: _SharedPin):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        registry : ContentPinRegistry
+            Registry that shares the realization.
+        key : str
+            Key of the realization in the registry.
+        pin : _SharedPin
+            Shared realization.
+        """
+        self._registry: ContentPinRegistry = registry
+        self._key: str = key
+        self._pin: _SharedPin = pin
+        self._released: bool = False
+
+    @property  # type: ignore
+    @overrides
+    def content_path(self) -> Path:
+        return self._pin.context.content_path  # type: ignore
+
+    @overrides
+    def keep_file_on_exit(self) -> None:
+        self._registry._keep(self._key, self._pin)
+
+    def _release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._registry._release(self._key, self._pin)
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit the context, releasing this reader's reference."""
+        self._release()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Asynchronously exit the context, releasing this reader's reference."""
+        self._release()
+
+
+class ContentPinRegistry:
+    """
+    Shares one local realization of each content among concurrent readers.
+
+    ``FileValue`` implementations whose contents are not stored locally can use a registry
+    to avoid fetching the same content several times when many readers request it at
+    once. The first reader of a key realizes the content, and readers that arrive while
+    it is doing so wait for the same realization instead of starting their own. The
+    realization is released once the last reader exits its context, so a reader that
+    arrives later realizes the content again.
+
+    Realizations are ``LocalFileContentContext`` instances, which the registry exits
+    synchronously. Instances are safe to use from several threads and event loops at
+    once.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new instance."""
+        self._pins: Dict[str, _SharedPin] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self.realizations: int = 0
+        """Number of times content was realized."""
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether content with the given key is realized or being realized."""
+        return key in self._pins
+
+    def __len__(self) -> int:
+        """Get the number of contents that are realized or being realized."""
+        return len(self._pins)
+
+    def _join(self, key: str) -> Tuple[_SharedPin, bool]:
+        with self._lock:
+            pin: Optional[_SharedPin] = self._pins.get(key)
+            if pin is not None:
+                pin.references += 1
+                return pin, False
+            pin = _SharedPin()
+            self._pins[key] = pin
+            self.realizations += 1
+            return pin, True
+
+    def _finish(
+        self,
+        key: str,
+        pin: _SharedPin,
+        context: Optional[LocalFileContentContext],
+        error: Optional[BaseException],
+    ) -> None:
+        with self._lock:
+            pin.context = context
+            pin.error = error
+            if error is not None and self._pins.get(key) is pin:
+                del self._pins[key]
+            pin.done.set()
+
+    @staticmethod
+    def _should_retry(pin: _SharedPin) -> bool:
+        # A realization that was cancelled, rather than one that failed, is retried by the
+        # readers that were waiting for it.
+        return pin.error is not None and not isinstance(pin.error, Exception)
+
+    def _result(self, key: str, pin: _SharedPin) -> SharedFileContentContext:
+        if pin.error is not None:
+            raise pin.error
+        return SharedFileContentContext(self, key, pin)
+
+    def pin(
+        self, key: str, realize: Callable[[], LocalFileContentContext]
+    ) -> SharedFileContentContext:
+        """
+        Get a context holding a local copy of some content, realizing it if needed.
+
+        Parameters
+        ----------
+        key : str
+            Key that uniquely identifies the content, such as the ``FileValue`` ID.
+        realize : Callable[[], LocalFileContentContext]
+            Function that realizes the content if no other reader already has.
+
+        Returns
+        -------
+        SharedFileContentContext
+            Context that shares the realization until it is exited.
+        """
+        while True:
+            pin, owner = self._join(key)
+            if owner:
+                try:
+                    context: LocalFileContentContext = realize()
+                except BaseException as error:
+                    self._finish(key, pin, None, error)
+                    raise
+                self._finish(key, pin, context, None)
+            else:
+                pin.done.wait()
+                if ContentPinRegistry._should_retry(pin):
+                    continue
+            return self._result(key, pin)
+
+    async def pin_async(
+        self, key: str, realize: Callable[[], Awaitable[LocalFileContentContext]]
+    ) -> SharedFileContentContext:
+        """
+        Get a context holding a local copy of some content, realizing it if needed.
+
+        Readers that wait for another reader's realization do so without blocking the
+        event loop.
+
+        Parameters
+        ----------
+        key : str
+            Key that uniquely identifies the content, such as the ``FileValue`` ID.
+        realize : Callable[[], Awaitable[LocalFileContentContext]]
+            Coroutine function that realizes the content if no other reader already has.
+
+        Returns
+        -------
+        SharedFileContentContext
+            Context that shares the realization until it is exited.
+        """
+        while True:
+            pin, owner = self._join(key)
+            if owner:
+                try:
+                    context: LocalFileContentContext = await realize()
+                except BaseException as error:
+                    self._finish(key, pin, None, error)
+                    raise
+                self._finish(key, pin, context, None)
+            else:
+                await self._wait_async(key, pin)
+                if ContentPinRegistry._should_retry(pin):
+                    continue
+            return self._result(key, pin)
+
+    async def _wait_async(self, key: str, pin: _SharedPin) -> None:
+        try:
+            # Wait on a worker thread in short steps, so that the wait can be cancelled.
+            while not pin.done.is_set():
+                await to_thread.run_sync(pin.done.wait, _ASYNC_WAIT_STEP)
+        except BaseException:
+            self._release(key, pin)
+            raise
+
+    def _release(self, key: str, pin: _SharedPin) -> None:
+        with self._lock:
+            pin.references -= 1
+            if pin.references > 0:
+                return
+            if self._pins.get(key) is pin:
+                del self._pins[key]
+        if pin.context is not None:
+            pin.context.__exit__(None, None, None)
+
+    def _keep(self, key: str, pin: _SharedPin) -> None:
+        # The caller takes over the file, so later readers must realize their own copy.
+        with self._lock:
+            if self._pins.get(key) is pin:
+                del self._pins[key]
+        if pin.context is not None:
+            pin.context.keep_file_on_exit()
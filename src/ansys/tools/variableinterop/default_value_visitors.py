@@ -0,0 +1,366 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Defines the stateless visitors used to construct default values and metadata and to
+convert values at runtime.
+
+Each visitor is instantiated once, at import time, and shared by every caller.
+"""
+from __future__ import annotations
+
+from typing import Callable, Type, TypeVar
+
+from overrides import overrides
+
+from . import array_value_conversion, exceptions, scalar_value_conversion
+from .array_metadata import (
+    BooleanArrayMetadata,
+    IntegerArrayMetadata,
+    RealArrayMetadata,
+    StringArrayMetadata,
+)
+from .array_values import BooleanArrayValue, IntegerArrayValue, RealArrayValue, StringArrayValue
+from .common_variable_metadata import CommonVariableMetadata
+from .file_array_metadata import FileArrayMetadata
+from .file_array_value import FileArrayValue
+from .file_metadata import FileMetadata
+from .file_value import EMPTY_FILE
+from .ivariable_type_pseudovisitor import IVariableTypePseudoVisitor
+from .ivariablemetadata_visitor import IVariableMetadataVisitor
+from .scalar_metadata import BooleanMetadata, IntegerMetadata, RealMetadata, StringMetadata
+from .scalar_values import BooleanValue, IntegerValue, RealValue, StringValue
+from .variable_type import VariableType
+from .variable_value import IVariableValue
+
+ValueConverter = Callable[[IVariableValue], IVariableValue]
+"""Function that converts a value to the type described by a metadata object."""
+
+
+class _TypeDefaultValueVisitor(IVariableTypePseudoVisitor[IVariableValue]):
+    """Provides the visitor that returns a default value for each type."""
+
+    @overrides
+    def visit_unknown(self) -> IVariableValue:
+        raise TypeError
+
+    @overrides
+    def visit_int(self) -> IVariableValue:
+        return IntegerValue(0)
+
+    @overrides
+    def visit_real(self) -> IVariableValue:
+        return RealValue()
+
+    @overrides
+    def visit_boolean(self) -> IVariableValue:
+        return BooleanValue()
+
+    @overrides
+    def visit_string(self) -> IVariableValue:
+        return StringValue()
+
+    @overrides
+    def visit_file(self) -> IVariableValue:
+        return EMPTY_FILE
+
+    @overrides
+    def visit_int_array(self) -> IVariableValue:
+        return IntegerArrayValue()
+
+    @overrides
+    def visit_real_array(self) -> IVariableValue:
+        return RealArrayValue()
+
+    @overrides
+    def visit_bool_array(self) -> IVariableValue:
+        return BooleanArrayValue()
+
+    @overrides
+    def visit_string_array(self) -> IVariableValue:
+        return StringArrayValue()
+
+    @overrides
+    def visit_file_array(self) -> IVariableValue:
+        return FileArrayValue()
+
+
+class _TypeDefaultMetadataVisitor(IVariableTypePseudoVisitor[CommonVariableMetadata]):
+    """Provides the visitor that returns a default metadata for each type."""
+
+    @overrides
+    def visit_unknown(self) -> CommonVariableMetadata:
+        raise TypeError
+
+    @overrides
+    def visit_int(self) -> CommonVariableMetadata:
+        return IntegerMetadata()
+
+    @overrides
+    def visit_real(self) -> CommonVariableMetadata:
+        return RealMetadata()
+
+    @overrides
+    def visit_boolean(self) -> CommonVariableMetadata:
+        return BooleanMetadata()
+
+    @overrides
+    def visit_string(self) -> CommonVariableMetadata:
+        return StringMetadata()
+
+    @overrides
+    def visit_file(self) -> CommonVariableMetadata:
+        return FileMetadata()
+
+    @overrides
+    def visit_int_array(self) -> CommonVariableMetadata:
+        return IntegerArrayMetadata()
+
+    @overrides
+    def visit_real_array(self) -> CommonVariableMetadata:
+        return RealArrayMetadata()
+
+    @overrides
+    def visit_bool_array(self) -> CommonVariableMetadata:
+        return BooleanArrayMetadata()
+
+    @overrides
+    def visit_string_array(self) -> CommonVariableMetadata:
+        return StringArrayMetadata()
+
+    @overrides
+    def visit_file_array(self) -> CommonVariableMetadata:
+        return FileArrayMetadata()
+
+
+def _get_str_enumerated_default(metadata: StringMetadata) -> StringValue:
+    """
+    For the given ``StringMetadata`` value, use enumerated values to get the default
+    value to use for the associated variable.
+
+    Parameters
+    ----------
+    metadata : StringMetadata
+        Metadata to use to generate the default value.
+
+    Returns
+    -------
+    StringValue
+        Default value to use for the associated variable.
+    """
+    default_value: StringValue = StringValue()
+    if metadata.enumerated_values is not None and len(metadata.enumerated_values):
+        if default_value not in metadata.enumerated_values:
+            default_value = metadata.enumerated_values[0]
+    return default_value
+
+
+M = TypeVar("M", IntegerMetadata, RealMetadata)
+T = TypeVar("T", IntegerValue, RealValue)
+
+
+def _get_numeric_default(metadata: M, type_: Type[T]) -> T:
+    """
+    For a numeric metadata (``IntegerMetadata`` or ``RealMetadata`` type), get the
+    default value to use for the associated variable.
+
+    Parameters
+    ----------
+    metadata : M
+        Metadata to use to generate the default value.
+    type_ : Type[T]
+        Type of the default value to generate.
+
+    Returns
+    -------
+    T
+        Default value to use for the associated variable.
+    """
+    default_value = type_()
+    if metadata.enumerated_values is not None and len(metadata.enumerated_values):
+        # enumerated values are defined
+        # if default value is not valid
+        if (
+            default_value not in metadata.enumerated_values
+            or (metadata.lower_bound is not None and default_value < metadata.lower_bound)
+            or (metadata.upper_bound is not None and metadata.upper_bound < default_value)
+        ):
+            # find the first enumerated value that is valid
+            # if one does not exist, use default value anyway
+            default_value = next(
+                (
+                    e
+                    for e in metadata.enumerated_values
+                    if (metadata.lower_bound is None or metadata.lower_bound <= e)
+                    and (metadata.upper_bound is None or e <= metadata.upper_bound)
+                ),
+                default_value,
+            )
+    else:
+        # no enumerated values are defined
+        # if default value is not valid
+        if (metadata.lower_bound is not None and default_value < metadata.lower_bound) or (
+            metadata.upper_bound is not None and metadata.upper_bound < default_value
+        ):
+            # default is not valid.
+            # if have a lower_bound
+            if metadata.lower_bound is not None:
+                # if lower_bound is valid, use it
+                if metadata.upper_bound is None or metadata.lower_bound <= metadata.upper_bound:
+                    default_value = metadata.lower_bound
+            # else if have an upper_bound, use it
+            elif metadata.upper_bound is not None:
+                default_value = metadata.upper_bound
+            # else nothing is valid, just use default value
+        # else default_value is valid, use it
+
+    return default_value
+
+
+class _MetadataDefaultValueVisitor(IVariableMetadataVisitor[IVariableValue]):
+    """Implements the metadata visitor for getting the default value."""
+
+    @overrides
+    def visit_integer(self, metadata: IntegerMetadata) -> IntegerValue:
+        return _get_numeric_default(metadata, IntegerValue)
+
+    @overrides
+    def visit_real(self, metadata: RealMetadata) -> RealValue:
+        return _get_numeric_default(metadata, RealValue)
+
+    @overrides
+    def visit_boolean(self, metadata: BooleanMetadata) -> BooleanValue:
+        return BooleanValue()
+
+    @overrides
+    def visit_string(self, metadata: StringMetadata) -> StringValue:
+        return _get_str_enumerated_default(metadata)
+
+    @overrides
+    def visit_file(self, metadata: FileMetadata) -> IVariableValue:
+        return EMPTY_FILE
+
+    @overrides
+    def visit_integer_array(self, metadata: IntegerArrayMetadata) -> IntegerArrayValue:
+        return IntegerArrayValue()
+
+    @overrides
+    def visit_real_array(self, metadata: RealArrayMetadata) -> RealArrayValue:
+        return RealArrayValue()
+
+    @overrides
+    def visit_boolean_array(self, metadata: BooleanArrayMetadata) -> BooleanArrayValue:
+        return BooleanArrayValue()
+
+    @overrides
+    def visit_string_array(self, metadata: StringArrayMetadata) -> StringArrayValue:
+        return StringArrayValue()
+
+    @overrides
+    def visit_file_array(self, metadata: FileArrayMetadata) -> FileArrayValue:
+        return FileArrayValue()
+
+
+def _incompatible_with(to_type: VariableType) -> ValueConverter:
+    """
+    Get a converter that rejects every source value.
+
+    Parameters
+    ----------
+    to_type : VariableType
+        Type that source values cannot be converted to.
+
+    Returns
+    -------
+    ValueConverter
+        Converter that raises ``IncompatibleTypesException`` for any source value.
+    """
+
+    def convert(source: IVariableValue) -> IVariableValue:
+        raise exceptions.IncompatibleTypesException(source.variable_type, to_type)
+
+    return convert
+
+
+_TO_FILE = _incompatible_with(VariableType.FILE)
+_TO_FILE_ARRAY = _incompatible_with(VariableType.FILE_ARRAY)
+
+
+class _RuntimeConverterVisitor(IVariableMetadataVisitor[ValueConverter]):
+    """
+    Implements the metadata visitor that selects the runtime conversion for a metadata.
+
+    The visitor returns the conversion function rather than a converted value, so that a
+    single instance can be shared regardless of the value being converted.
+    """
+
+    @overrides
+    def visit_integer(self, metadata: IntegerMetadata) -> ValueConverter:
+        return scalar_value_conversion.to_integer_value
+
+    @overrides
+    def visit_real(self, metadata: RealMetadata) -> ValueConverter:
+        return scalar_value_conversion.to_real_value
+
+    @overrides
+    def visit_boolean(self, metadata: BooleanMetadata) -> ValueConverter:
+        return scalar_value_conversion.to_boolean_value
+
+    @overrides
+    def visit_string(self, metadata: StringMetadata) -> ValueConverter:
+        return scalar_value_conversion.to_string_value
+
+    @overrides
+    def visit_file(self, metadata: FileMetadata) -> ValueConverter:
+        return _TO_FILE
+
+    @overrides
+    def visit_integer_array(self, metadata: IntegerArrayMetadata) -> ValueConverter:
+        return array_value_conversion.to_integer_array_value
+
+    @overrides
+    def visit_real_array(self, metadata: RealArrayMetadata) -> ValueConverter:
+        return array_value_conversion.to_real_array_value
+
+    @overrides
+    def visit_boolean_array(self, metadata: BooleanArrayMetadata) -> ValueConverter:
+        return array_value_conversion.to_boolean_array_value
+
+    @overrides
+    def visit_string_array(self, metadata: StringArrayMetadata) -> ValueConverter:
+        return array_value_conversion.to_string_array_value
+
+    @overrides
+    def visit_file_array(self, metadata: FileArrayMetadata) -> ValueConverter:
+        return _TO_FILE_ARRAY
+
+
+TYPE_DEFAULT_VALUE_VISITOR = _TypeDefaultValueVisitor()
+"""Shared visitor that constructs the default value for a ``VariableType``."""
+
+TYPE_DEFAULT_METADATA_VISITOR = _TypeDefaultMetadataVisitor()
+"""Shared visitor that constructs the default metadata for a ``VariableType``."""
+
+METADATA_DEFAULT_VALUE_VISITOR = _MetadataDefaultValueVisitor()
+"""Shared visitor that selects the default value satisfying a metadata object."""
+
+RUNTIME_CONVERTER_VISITOR = _RuntimeConverterVisitor()
+"""Shared visitor that selects the function converting values for a metadata object."""
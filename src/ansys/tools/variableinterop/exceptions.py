@@ -21,10 +21,9 @@
 # SOFTWARE.
 """Provides custom exception types."""
 
-from configparser import ConfigParser
-import os
 from typing import Optional, Union
 
+from .utils.locale_utils import Strings
 from .variable_type import VariableType
 
 
@@ -43,9 +42,7 @@ def _error(name: str, *args: object) -> str:
     -------
         Formatted error string.
     """
-    parser = ConfigParser()
-    parser.read(os.path.join(os.path.dirname(__file__), "strings.properties"))
-    return parser.get("Errors", name).format(*args)
+    return Strings.get("Errors", name, *args)
 
 
 class IncompatibleTypesException(BaseException):
@@ -85,6 +82,13 @@ class IncompatibleTypesException(BaseException):
         message: str = _error("ERROR_INCOMPATIBLE_TYPES", self.from_type_str, self.to_type_str)
         super().__init__(message)
 
+    def __reduce__(self):
+        """Reduce to a constructor call, so that the exception can cross processes."""
+        return type(self), (
+            self.from_type if self.from_type is not None else self.from_type_str,
+            self.to_type if self.to_type is not None else self.to_type_str,
+        )
+
 
 class FormatException(BaseException):
     """Indicates that the string used to create a variable value was incorrectly
@@ -95,6 +99,10 @@ class FormatException(BaseException):
         message: str = _error("ERROR_FORMAT")
         super().__init__(message)
 
+    def __reduce__(self):
+        """Reduce to a constructor call, so that the exception can cross processes."""
+        return type(self), ()
+
 
 class ValueDeserializationUnsupportedException(Exception):
     """Indicates that deserializing a value is not allowed."""
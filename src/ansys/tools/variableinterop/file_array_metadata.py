@@ -30,6 +30,8 @@ from .variable_type import VariableType
 class FileArrayMetadata(FileMetadata):
     """Provides metadata for the ``FileArray`` variable type."""
 
+    __slots__ = ()
+
     @property  # type: ignore
     @overrides
     def variable_type(self) -> VariableType:
@@ -22,9 +22,12 @@
 """Defines the ``FileArrayValue`` class."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import io
 import json
-from typing import Any, Dict, Optional, TypeVar, cast
+from typing import Any, Callable, List, Optional, Sequence, TextIO, Tuple, TypeVar, cast
 
+from anyio import CapacityLimiter, create_task_group, to_thread
 import numpy as np
 from numpy.typing import ArrayLike
 from overrides import overrides
@@ -39,6 +42,141 @@ from .variable_type import VariableType
 from .variable_value import CommonArrayValue
 
 T = TypeVar("T")
+R = TypeVar("R")
+
+_JSON_ENCODER: json.JSONEncoder = json.JSONEncoder()
+"""Encoder producing the same output as ``json.dumps`` with default arguments."""
+
+_JSON_DECODER: json.JSONDecoder = json.JSONDecoder()
+
+
+class _ApiStringReader:
+    """
+    Incrementally parses the API string of a file array.
+
+    The nested lists are parsed a token at a time, and each element is converted to a
+    ``FileValue`` instance as soon as it is parsed, so neither the whole text nor the
+    whole nested list of element API objects needs to be held in memory.
+    """
+
+    _WHITESPACE: str = " \t\n\r"
+
+    def __init__(
+        self,
+        read: Callable[[int], str],
+        initial: str,
+        convert: Callable[[Any], FileValue],
+        chunk_size: int,
+    ):
+        self._read: Callable[[int], str] = read
+        self._buffer: str = initial
+        self._pos: int = 0
+        self._exhausted: bool = False
+        self._convert: Callable[[Any], FileValue] = convert
+        self._chunk_size: int = chunk_size
+
+    def _fill(self) -> bool:
+        """Read more text into the buffer, returning whether there was any."""
+        if self._exhausted:
+            return False
+        chunk: str = self._read(self._chunk_size)
+        if not chunk:
+            self._exhausted = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Get the next character that is not whitespace, or ``""`` at the end."""
+        while True:
+            while self._pos < len(self._buffer):
+                if self._buffer[self._pos] not in _ApiStringReader._WHITESPACE:
+                    return self._buffer[self._pos]
+                self._pos += 1
+            if not self._fill():
+                return ""
+
+    def _syntax_error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def _decode_value(self) -> Any:
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # The value may just be cut off at the end of the buffer.
+                if self._fill():
+                    continue
+                raise
+            if end == len(self._buffer) and not self._exhausted and self._fill():
+                # A number may continue in the next chunk.
+                continue
+            self._pos = end
+            return value
+
+    def read(self) -> FileArrayValue:
+        if self._peek() != "[":
+            raise ValueError("The serialized value was not deserialized as a list.")
+
+        elements: List[FileValue] = []
+        dims: List[Optional[int]] = []
+        counts: List[int] = []
+        element_depth: Optional[int] = None
+        max_depth: int = 0
+        expect_item: bool = True
+        while True:
+            char: str = self._peek()
+            if char == "":
+                raise self._syntax_error("Unterminated array")
+            if char == "]":
+                if expect_item and counts[-1] > 0:
+                    raise self._syntax_error("Expecting value")
+                self._pos += 1
+                level: int = len(counts) - 1
+                count: int = counts.pop()
+                if len(dims) <= level:
+                    dims.extend([None] * (level + 1 - len(dims)))
+                if dims[level] is None:
+                    dims[level] = count
+                elif dims[level] != count:
+                    raise TypeError(_error("ERROR_JAGGED_FILE_ARRAY", list))
+                if not counts:
+                    break
+                expect_item = False
+            elif char == ",":
+                if expect_item:
+                    raise self._syntax_error("Expecting value")
+                self._pos += 1
+                expect_item = True
+            elif not expect_item:
+                raise self._syntax_error("Expecting ',' delimiter")
+            elif char == "[":
+                if element_depth is not None and len(counts) >= element_depth:
+                    raise TypeError(_error("ERROR_JAGGED_FILE_ARRAY", list))
+                self._pos += 1
+                if counts:
+                    counts[-1] += 1
+                counts.append(0)
+                max_depth = max(max_depth, len(counts))
+                expect_item = True
+            else:
+                if element_depth is None:
+                    element_depth = len(counts)
+                    if max_depth > element_depth:
+                        raise TypeError(_error("ERROR_JAGGED_FILE_ARRAY", list))
+                elif len(counts) != element_depth:
+                    raise TypeError(_error("ERROR_JAGGED_FILE_ARRAY", type(self._decode_value())))
+                counts[-1] += 1
+                elements.append(self._convert(self._decode_value()))
+                expect_item = False
+
+        if self._peek() != "":
+            raise self._syntax_error("Extra data")
+        shape: Tuple[int, ...] = tuple(
+            cast(List[int], dims if element_depth is None else dims[:element_depth])
+        )
+        return FileArrayValue._from_results(elements, shape)
 
 
 class FileArrayValue(CommonArrayValue[FileValue]):
@@ -54,7 +192,7 @@ class FileArrayValue(CommonArrayValue[FileValue]):
     def __new__(cls, shape_: ArrayLike = (), values: ArrayLike = None):
         if values is not None:
             return np.array(values, dtype=FileValue).view(cls)
-        return super().__new__(cls, shape=shape_, dtype=FileValue).view(cls)
+        return super().__new__(cls, shape=shape_, dtype=FileValue)
 
     @overrides
     def __eq__(self, other):
@@ -69,8 +207,176 @@ class FileArrayValue(CommonArrayValue[FileValue]):
     def variable_type(self) -> VariableType:
         return VariableType.FILE_ARRAY
 
+    @staticmethod
+    def _map_elements(
+        action: Callable[[Any], R], items: Sequence[Any], max_workers: int
+    ) -> List[R]:
+        """
+        Apply an action to each item, using a thread pool if more than one worker is
+        allowed.
+
+        Parameters
+        ----------
+        action : Callable[[Any], R]
+            Action to apply.
+        items : Sequence[Any]
+            Items to apply the action to.
+        max_workers : int
+            Maximum number of items processed at once.
+
+        Returns
+        -------
+        List[R]
+            Results, in the same order as the items.
+        """
+        if max_workers < 1:
+            raise ValueError("At least one worker is required.")
+        if max_workers == 1 or len(items) <= 1:
+            return [action(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(action, items))
+
+    @staticmethod
+    async def _map_elements_async(
+        action: Callable[[Any], R], items: Sequence[Any], max_concurrency: int
+    ) -> List[R]:
+        """
+        Apply an action to each item in worker threads without blocking the event loop.
+
+        Parameters
+        ----------
+        action : Callable[[Any], R]
+            Action to apply.
+        items : Sequence[Any]
+            Items to apply the action to.
+        max_concurrency : int
+            Maximum number of items processed at once.
+
+        Returns
+        -------
+        List[R]
+            Results, in the same order as the items.
+        """
+        if max_concurrency < 1:
+            raise ValueError("At least one worker is required.")
+        results: List[Any] = [None] * len(items)
+        errors: List[BaseException] = []
+        limiter = CapacityLimiter(max_concurrency)
+
+        async with create_task_group() as task_group:
+
+            async def run(index: int, item: Any) -> None:
+                try:
+                    results[index] = await to_thread.run_sync(action, item, limiter=limiter)
+                except Exception as error:
+                    # Surface the first failure as is rather than as an exception group.
+                    errors.append(error)
+                    task_group.cancel_scope.cancel()
+
+            for index, item in enumerate(items):
+                task_group.start_soon(run, index, item)
+
+        if errors:
+            raise errors[0]
+        return results
+
+    def _reshape_results(self, results: List[Any]) -> Any:
+        """Arrange results for the flattened elements back into this array's shape."""
+        shaped = np.empty(len(results), dtype=object)
+        shaped[:] = results
+        return shaped.reshape(self.shape).tolist()
+
+    def to_api_object(self, context: ISaveContext, max_workers: int = 1) -> Any:
+        """
+        Convert this value to an API object, which is a nested list of file API objects.
+
+        Each element may save its content with the save context, so elements can be
+        processed concurrently in a thread pool. The save context must then be safe to use
+        from several threads at once.
+
+        Parameters
+        ----------
+        context : ISaveContext
+            Context used for saving.
+        max_workers : int, optional
+            Maximum number of elements processed at once. The default is ``1``, in which case
+            the elements are processed one at a time on the calling thread.
+
+        Returns
+        -------
+        Any
+            Nested list with the same shape as this array.
+        """
+        return self._reshape_results(
+            self._map_elements(
+                lambda item: cast(FileValue, item).to_api_object(context),
+                self.ravel().tolist(),
+                max_workers,
+            )
+        )
+
+    async def to_api_object_async(self, context: ISaveContext, max_concurrency: int = 8) -> Any:
+        """
+        Convert this value to an API object without blocking the event loop.
+
+        Elements are processed concurrently in worker threads. The save context must be
+        safe to use from several threads at once.
+
+        Parameters
+        ----------
+        context : ISaveContext
+            Context used for saving.
+        max_concurrency : int, optional
+            Maximum number of elements processed at once. The default is ``8``.
+
+        Returns
+        -------
+        Any
+            Nested list with the same shape as this array.
+        """
+        return self._reshape_results(
+            await self._map_elements_async(
+                lambda item: cast(FileValue, item).to_api_object(context),
+                self.ravel().tolist(),
+                max_concurrency,
+            )
+        )
+
+    def write_api_string(self, stream: TextIO, context: Optional[ISaveContext] = None) -> None:
+        """
+        Write the API string of this value to a text stream, one element at a time.
+
+        The text written is the same as the ``to_api_string`` method returns, but the
+        nested list of element API objects is never built.
+
+        Parameters
+        ----------
+        stream : TextIO
+            Stream to write to.
+        context : ISaveContext
+            Context used for saving.
+        """
+        if context is None:
+            raise ValueError(_error("ERROR_FILE_NO_CONTEXT"))
+        elements: np.ndarray = self.ravel()
+
+        def write(dimension: int, index: int) -> int:
+            if dimension == self.ndim:
+                element: FileValue = elements[index]
+                stream.write(_JSON_ENCODER.encode(element.to_api_object(context)))
+                return index + 1
+            stream.write("[")
+            for position in range(self.shape[dimension]):
+                if position:
+                    stream.write(", ")
+                index = write(dimension + 1, index)
+            stream.write("]")
+            return index
+
+        write(0, 0)
+
     @overrides
-    def to_api_string(self, context: Optional[ISaveContext] = None) -> str:
+    def to_api_string(self, context: Optional[ISaveContext] = None, max_workers: int = 1) -> str:
         """
         Convert this value to an API string.
 
@@ -78,6 +384,35 @@ class FileArrayValue(CommonArrayValue[FileValue]):
         ----------
         context : ISaveContext
             Context used for saving.
+        max_workers : int, optional
+            Maximum number of elements saved at once. The default is ``1``, in which case
+            the elements are saved one at a time on the calling thread.
+
+        Returns
+        -------
+        str
+            String appropriate for use in files and APIs.
+        """
+        if context is None:
+            raise ValueError(_error("ERROR_FILE_NO_CONTEXT"))
+        if max_workers == 1:
+            stream: io.StringIO = io.StringIO()
+            self.write_api_string(stream, context)
+            return stream.getvalue()
+        return json.dumps(self.to_api_object(context, max_workers))
+
+    async def to_api_string_async(
+        self, context: Optional[ISaveContext] = None, max_concurrency: int = 8
+    ) -> str:
+        """
+        Convert this value to an API string without blocking the event loop.
+
+        Parameters
+        ----------
+        context : ISaveContext
+            Context used for saving.
+        max_concurrency : int, optional
+            Maximum number of elements saved at once. The default is ``8``.
 
         Returns
         -------
@@ -86,14 +421,34 @@ class FileArrayValue(CommonArrayValue[FileValue]):
         """
         if context is None:
             raise ValueError(_error("ERROR_FILE_NO_CONTEXT"))
+        return json.dumps(await self.to_api_object_async(context, max_concurrency))
+
+    @staticmethod
+    def _api_object_elements(value: Any) -> np.ndarray:
+        """Get the element API objects of a deserialized API object as an array."""
+        if not isinstance(value, list):
+            raise ValueError("The serialized value was not deserialized as a list.")
+        return np.asarray(value, dtype="object")
 
-        def elem_to_api_obj(item: FileValue) -> Dict[str, Optional[str]]:
-            return item.to_api_object(cast(ISaveContext, context))
+    @staticmethod
+    def _api_object_to_element(item: Any, context: ILoadContext, scope: FileScope) -> FileValue:
+        """Transform an individual API object to an element."""
+        if isinstance(item, dict):
+            return scope.from_api_object(item, context)
+        else:
+            raise TypeError(_error("ERROR_JAGGED_FILE_ARRAY", type(item)))
 
-        return json.dumps(np.vectorize(elem_to_api_obj)(self).tolist())
+    @staticmethod
+    def _from_results(results: List[FileValue], shape: Any) -> FileArrayValue:
+        """Create a new value from the elements in flattened order."""
+        array: FileArrayValue = FileArrayValue(shape)
+        array.ravel()[:] = results
+        return array
 
     @staticmethod
-    def from_api_object(value: Any, context: ILoadContext, scope: FileScope) -> FileArrayValue:
+    def from_api_object(
+        value: Any, context: ILoadContext, scope: FileScope, max_workers: int = 1
+    ) -> FileArrayValue:
         """
         Initialize a new ``FileArrayValue`` type from a list of API strings.
 
@@ -105,26 +460,129 @@ class FileArrayValue(CommonArrayValue[FileValue]):
             Load context to initialize the value with.
         scope : FileScope
             Scope to initialize the value in.
+        max_workers : int, optional
+            Maximum number of elements loaded at once. The default is ``1``, in which case
+            the elements are loaded one at a time on the calling thread. The load context
+            and scope must be safe to use from several threads at once if more than one
+            worker is allowed.
 
         Returns
         -------
         FileArrayValue
             New ``FileArrayValue`` type initialized from the value.
         """
-        if isinstance(value, list):
-            # Define a function for transforming individual API objects to elements.
-            def api_obj_to_elem(item: Any) -> FileValue:
-                if isinstance(item, dict):
-                    return scope.from_api_object(item, context)
-                else:
-                    raise TypeError(_error("ERROR_JAGGED_FILE_ARRAY", type(item)))
-
-            # Construct the item.
-            return FileArrayValue(
-                values=np.vectorize(api_obj_to_elem)(np.asarray(value, dtype="object"))
-            )
-        else:
-            raise ValueError("The serialized value was not deserialized as a list.")
+        elements: np.ndarray = FileArrayValue._api_object_elements(value)
+        return FileArrayValue._from_results(
+            FileArrayValue._map_elements(
+                lambda item: FileArrayValue._api_object_to_element(item, context, scope),
+                elements.ravel().tolist(),
+                max_workers,
+            ),
+            elements.shape,
+        )
+
+    @staticmethod
+    def from_api_string(value: str, context: ILoadContext, scope: FileScope) -> FileArrayValue:
+        """
+        Initialize a new ``FileArrayValue`` type from an API string.
+
+        Each element is loaded as soon as it is parsed, so the nested list of element API
+        objects is never built.
+
+        Parameters
+        ----------
+        value : str
+            API string to parse.
+        context : ILoadContext
+            Load context to initialize the value with.
+        scope : FileScope
+            Scope to initialize the value in.
+
+        Returns
+        -------
+        FileArrayValue
+            New ``FileArrayValue`` type initialized from the API string.
+        """
+        return _ApiStringReader(
+            lambda size: "",
+            value,
+            lambda item: FileArrayValue._api_object_to_element(item, context, scope),
+            0,
+        ).read()
+
+    @staticmethod
+    def read_api_string(
+        stream: TextIO,
+        context: ILoadContext,
+        scope: FileScope,
+        chunk_size: int = 64 * 1024,
+    ) -> FileArrayValue:
+        """
+        Initialize a new ``FileArrayValue`` type from an API string read from a text stream.
+
+        The stream is read in chunks and each element is loaded as soon as it is parsed,
+        so neither the whole API string nor the nested list of element API objects is held
+        in memory.
+
+        Parameters
+        ----------
+        stream : TextIO
+            Stream to read the API string from. It is read to its end.
+        context : ILoadContext
+            Load context to initialize the value with.
+        scope : FileScope
+            Scope to initialize the value in.
+        chunk_size : int, optional
+            Number of characters read from the stream at a time. The default is ``65536``.
+
+        Returns
+        -------
+        FileArrayValue
+            New ``FileArrayValue`` type initialized from the API string.
+        """
+        return _ApiStringReader(
+            stream.read,
+            "",
+            lambda item: FileArrayValue._api_object_to_element(item, context, scope),
+            chunk_size,
+        ).read()
+
+    @staticmethod
+    async def from_api_object_async(
+        value: Any, context: ILoadContext, scope: FileScope, max_concurrency: int = 8
+    ) -> FileArrayValue:
+        """
+        Initialize a new ``FileArrayValue`` type from a list of API strings without
+        blocking the event loop.
+
+        Elements are loaded concurrently in worker threads. The load context and scope
+        must be safe to use from several threads at once.
+
+        Parameters
+        ----------
+        value : Any
+            Value to use.
+        context : ILoadContext
+            Load context to initialize the value with.
+        scope : FileScope
+            Scope to initialize the value in.
+        max_concurrency : int, optional
+            Maximum number of elements loaded at once. The default is ``8``.
+
+        Returns
+        -------
+        FileArrayValue
+            New ``FileArrayValue`` type initialized from the value.
+        """
+        elements: np.ndarray = FileArrayValue._api_object_elements(value)
+        return FileArrayValue._from_results(
+            await FileArrayValue._map_elements_async(
+                lambda item: FileArrayValue._api_object_to_element(item, context, scope),
+                elements.ravel().tolist(),
+                max_concurrency,
+            ),
+            elements.shape,
+        )
 
     @overrides
     def to_display_string(self, locale_name: str) -> str:
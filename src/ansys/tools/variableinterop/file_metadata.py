@@ -36,6 +36,8 @@ T = TypeVar("T")
 class FileMetadata(CommonVariableMetadata):
     """Provides metadata for the ``File`` variable type."""
 
+    __slots__ = ()
+
     @overrides
     def __eq__(self, other):
         return self.equals(other)
@@ -26,12 +26,15 @@ from abc import ABC, abstractmethod
 from contextlib import AbstractContextManager
 from os import PathLike
 from types import TracebackType
-from typing import Dict, Optional, Type
+from typing import Dict, Optional, Sequence, Tuple, Type
 
 from overrides import overrides
 
+from .content_pin_registry import ContentPinRegistry
 from .file_value import FileValue
 from .isave_context import ILoadContext
+from .utils.content_sniffing import ContentSniffer, SniffedContent
+from .utils.file_copy import FileCopyMethod
 
 
 class FileScope(AbstractContextManager, ABC):
@@ -50,9 +53,87 @@ class FileScope(AbstractContextManager, ABC):
     automatically called when the ``with`` block is exited.
     """
 
-    def __init__(self):
-        """Initialize a new instance."""
-        pass
+    def __init__(
+        self,
+        copy_methods: Optional[Sequence[FileCopyMethod]] = None,
+        content_sniffer: Optional[ContentSniffer] = None,
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        copy_methods : Optional[Sequence[FileCopyMethod]], optional
+            Methods that ``FileValue`` instances created by this scope try, in order, when
+            writing their contents to a file. The default is ``None``, in which case the
+            default methods are used.
+        content_sniffer : Optional[ContentSniffer], optional
+            Content sniffer used to detect the MIME type and encoding of files read without
+            them. The default is ``None``, in which case they are not detected.
+        """
+        self._copy_methods: Optional[Sequence[FileCopyMethod]] = copy_methods
+        self._content_sniffer: Optional[ContentSniffer] = content_sniffer
+        self._pin_registry: ContentPinRegistry = ContentPinRegistry()
+
+    @property
+    def copy_methods(self) -> Optional[Sequence[FileCopyMethod]]:
+        """
+        Methods used to copy the contents of ``FileValue`` instances created by this
+        scope.
+
+        A value of ``None`` indicates that the default methods are used.
+        """
+        return self._copy_methods
+
+    @property
+    def pin_registry(self) -> ContentPinRegistry:
+        """
+        Registry that ``FileValue`` instances created by this scope can use to share local
+        copies of their contents among concurrent readers.
+        """
+        return self._pin_registry
+
+    @property
+    def content_sniffer(self) -> Optional[ContentSniffer]:
+        """
+        Content sniffer used to detect the MIME type and encoding of files read without
+        them.
+
+        A value of ``None`` indicates that they are not detected.
+        """
+        return self._content_sniffer
+
+    def _sniff_metadata(
+        self, to_read: PathLike, mime_type: Optional[str], encoding: Optional[str]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Fill in a missing MIME type or encoding using the content sniffer.
+
+        Parameters
+        ----------
+        to_read : PathLike
+            File being read.
+        mime_type : Optional[str]
+            MIME type given by the caller.
+        encoding : Optional[str]
+            Encoding given by the caller.
+
+        Returns
+        -------
+        Tuple[Optional[str], Optional[str]]
+            MIME type and encoding. Values given by the caller are returned unchanged, as
+            are missing values when there is no content sniffer or the file cannot be read.
+        """
+        if self._content_sniffer is None or (mime_type is not None and encoding is not None):
+            return mime_type, encoding
+        try:
+            sniffed: SniffedContent = self._content_sniffer.sniff(to_read)
+        except OSError:
+            return mime_type, encoding
+        return (
+            mime_type if mime_type is not None else sniffed.mime_type,
+            encoding if encoding is not None else sniffed.encoding,
+        )
 
     @overrides
     def __exit__(
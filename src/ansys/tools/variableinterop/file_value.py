@@ -23,27 +23,60 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from configparser import ConfigParser
-from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    ExitStack,
+    asynccontextmanager,
+    contextmanager,
+)
+import functools
 import json
+import mmap
+import os
 from os import PathLike, path
-from typing import Callable, Dict, Final, Optional, TypeVar, Union, cast
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Final,
+    Iterator,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 from uuid import UUID, uuid4
 
-from anyio import Path, open_file
-from anyio.streams.file import FileReadStream, FileWriteStream
+from anyio import Path, open_file, to_thread
 from overrides import overrides
 
 from .exceptions import _error
 from .isave_context import ISaveContext
 from .ivariable_visitor import IVariableValueVisitor
+from .utils.content_sniffing import DEFAULT_CONTENT_SNIFFER, SniffedContent
+from .utils.file_copy import FileCopyMethod, copy_file, copy_file_with_digest
+from .utils.locale_utils import Strings, _strings_parser
 from .variable_type import VariableType
 from .variable_value import IVariableValue
 
 T = TypeVar("T")
 
-RESOURCE_PARSER = ConfigParser()
-RESOURCE_PARSER.read(path.join(path.dirname(__file__), "strings.properties"))
+
+def _is_text_mimetype(mimetype: str) -> bool:
+    return mimetype.startswith("text/") or mimetype.startswith("application/json")
+
+
+def __getattr__(name: str) -> Any:
+    # RESOURCE_PARSER used to be read when this module was imported. It is now the parser
+    # shared with Strings, which reads strings.properties on first use only.
+    if name == "RESOURCE_PARSER":
+        return _strings_parser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class AsyncLocalFileContentContext(AbstractAsyncContextManager, ABC):
@@ -138,6 +171,20 @@ class FileValue(IVariableValue, ABC):
     To create instances, use the ``FileScope`` class.
     """
 
+    # Many file values may be held at once, so they are stored without a __dict__.
+    __slots__ = (
+        "_id",
+        "_mime_type",
+        "_file_encoding",
+        "_original_path",
+        "_bom",
+        "_size",
+        "_copy_methods",
+        "_digest",
+        "_digest_stamp",
+        "_frozen",
+    )
+
     def __init__(
         self,
         original_path: Optional[PathLike] = None,
@@ -145,6 +192,7 @@ class FileValue(IVariableValue, ABC):
         encoding: Optional[str] = None,
         value_id: Optional[UUID] = None,
         file_size: Optional[int] = None,
+        copy_methods: Optional[Sequence[FileCopyMethod]] = None,
     ):
         """
         Initialize a new instance.
@@ -167,6 +215,10 @@ class FileValue(IVariableValue, ABC):
             Size of the file in bytes. The default value is ``None``, which indicates that
             the file size is not known. A file size of ``None`` does not indicate that the file
             is zero bytes.
+        copy_methods : Optional[Sequence[FileCopyMethod]], optional
+            Methods the ``write_file`` method tries, in order, to copy the file's contents.
+            The default is ``None``, in which case the default methods are used. File scopes
+            typically pass their own setting.
         """
         self._id: UUID = uuid4() if (value_id is None) else value_id
         self._mime_type: str = "" if (mime_type is None) else mime_type
@@ -174,6 +226,9 @@ class FileValue(IVariableValue, ABC):
         self._original_path: Optional[PathLike] = original_path
         self._bom: str = ""
         self._size: Optional[int] = file_size
+        self._copy_methods: Optional[Sequence[FileCopyMethod]] = copy_methods
+        self._digest: Optional[str] = None
+        self._digest_stamp: Optional[Tuple[int, int]] = None
 
     @overrides
     def __eq__(self, other):
@@ -195,13 +250,17 @@ class FileValue(IVariableValue, ABC):
     @overrides
     def to_display_string(self, locale_name: str) -> str:
         if self._has_content():
-            return RESOURCE_PARSER.get("DisplayFormats", "FILE_CONTENTS_FORMAT").format(
-                self._original_path
-                if self._original_path
-                else RESOURCE_PARSER.get("DisplayFormats", "FILE_LOCATION_UNKNOWN")
+            return Strings.get(
+                "DisplayFormats",
+                "FILE_CONTENTS_FORMAT",
+                (
+                    self._original_path
+                    if self._original_path
+                    else Strings.get("DisplayFormats", "FILE_LOCATION_UNKNOWN")
+                ),
             )
         else:
-            return RESOURCE_PARSER.get("DisplayFormats", "FILE_EMPTY")
+            return Strings.get("DisplayFormats", "FILE_EMPTY")
 
     BINARY_MIMETYPE: Final[str] = "application/octet-stream"
 
@@ -218,8 +277,14 @@ class FileValue(IVariableValue, ABC):
 
     SIZE_KEY: Final[str] = "size"
 
+    DIGEST_KEY: Final[str] = "contentDigest"
+    """JSON key for API serialization representing the digest of the file's contents."""
+
     _DEFAULT_EXT = ".tmp"
 
+    DEFAULT_CHUNK_SIZE: Final[int] = 1024 * 1024
+    """Default size of the chunks produced by the ``iter_chunks`` methods."""
+
     @property
     def mime_type(self) -> str:
         """MIME type of the file."""
@@ -263,6 +328,65 @@ class FileValue(IVariableValue, ABC):
         """
         return self._size
 
+    @overrides
+    def _estimate_nbytes(self, include_file_contents: bool, seen: Set[int]) -> int:
+        size = super()._estimate_nbytes(include_file_contents, seen)
+        if include_file_contents:
+            size += self.file_size or 0
+        return size
+
+    @property
+    def digest(self) -> Optional[str]:
+        """
+        Digest of the file's contents if known.
+
+        The digest has the form ``"<algorithm>:<hex digest>"``. It is computed as a side
+        effect of copying the contents, for example when the file is saved or by the
+        ``write_file`` method if requested, so a value of ``None`` only indicates that it
+        has not been computed yet.
+        """
+        return self._digest
+
+    @staticmethod
+    def _stamp(content_path: PathLike) -> Tuple[int, int]:
+        stat: os.stat_result = os.stat(content_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def _record_digest(self, content_path: PathLike, digest: str) -> None:
+        """
+        Record the digest of the contents of the local file holding this value's contents.
+
+        Parameters
+        ----------
+        content_path : PathLike
+            Local file the digest was computed from.
+        digest : str
+            Digest of the file's contents.
+        """
+        self._digest_stamp = FileValue._stamp(content_path)
+        self._digest = digest
+        if self._size is None:
+            self._size = self._digest_stamp[0]
+
+    def _current_digest(self, content_path: PathLike) -> Optional[str]:
+        """
+        Get the recorded digest if the local file has not changed since it was recorded.
+
+        Parameters
+        ----------
+        content_path : PathLike
+            Local file holding this value's contents.
+
+        Returns
+        -------
+        Optional[str]
+            Recorded digest, or ``None`` if no digest is recorded or the file's size or
+            modification time changed since.
+        """
+        if self._digest is None or self._digest_stamp != FileValue._stamp(content_path):
+            return None
+        return self._digest
+
     @staticmethod
     def read_bom(filename: str) -> str:
         """
@@ -294,29 +418,48 @@ class FileValue(IVariableValue, ABC):
             else:
                 return "None"
 
-    async def write_file(self, file_name: PathLike) -> None:
+    async def write_file(
+        self,
+        file_name: PathLike,
+        copy_methods: Optional[Sequence[FileCopyMethod]] = None,
+        record_digest: bool = False,
+    ) -> None:
         """
         Write the file's contents to a new file.
 
+        The contents are copied in a worker thread so that the event loop is not blocked.
+        They are copied by the operating system when possible, unless ``record_digest`` is
+        ``True`` and the digest of the contents is not known yet. In that case, the contents
+        are copied in user space and their digest is computed and recorded in the same pass.
+
         Parameters
         ----------
         file_name : PathLike
             Path to the file to create.
+        copy_methods : Optional[Sequence[FileCopyMethod]], optional
+            Methods to try, in order, to copy the contents. The default is ``None``, in which
+            case the methods this value was created with are used. Include
+            ``FileCopyMethod.HARDLINK`` only if neither file will be modified afterward.
+        record_digest : bool, optional
+            Whether to compute and record the digest of the contents if it is not known yet.
+            The default is ``False``.
 
         Returns
         -------
         None
         """
-        # make the file
-        Path(file_name).open("w").close()
+        if copy_methods is None:
+            copy_methods = self._copy_methods
 
-        # copy the contents from the actual content file
         async with await self.get_reference_to_actual_content_file_async() as local_pin:
-            file: Optional[PathLike] = local_pin.content_path
-            async with await FileReadStream.from_path(file) as in_stream:
-                async with await FileWriteStream.from_path(file_name) as out_stream:
-                    async for chunk in in_stream:
-                        await out_stream.send(chunk)
+            file: PathLike = cast(PathLike, local_pin.content_path)
+            if record_digest and self._current_digest(file) is None:
+                digest, _ = await to_thread.run_sync(copy_file_with_digest, file, file_name)
+                self._record_digest(file, digest)
+            else:
+                await to_thread.run_sync(
+                    functools.partial(copy_file, file, file_name, copy_methods)
+                )
 
     @abstractmethod
     async def get_reference_to_actual_content_file_async(
@@ -394,7 +537,7 @@ class FileValue(IVariableValue, ABC):
             ``True`` if the MIME type starts with text or is an application (JSON),
             ``False`` otherwise.
         """
-        return str(mimetype).startswith("text/") or str(mimetype).startswith("application/json")
+        return _is_text_mimetype(str(mimetype))
 
     @property
     def is_text_based(self) -> Optional[bool]:
@@ -417,7 +560,8 @@ class FileValue(IVariableValue, ABC):
         ----------
         encoding : Optional[str], optional
             Encoding to use when reading. The default is ``None``, in which case the
-            current locale's encoding is used.
+            encoding is detected from the byte order mark, then taken from the
+            ``file_encoding`` property, and otherwise is the current locale's encoding.
 
         Returns
         -------
@@ -426,10 +570,198 @@ class FileValue(IVariableValue, ABC):
         """
         async with await self.get_reference_to_actual_content_file_async() as local_pin:
             file: Optional[PathLike] = local_pin.content_path
-            async with await open_file(file=file, encoding=encoding) as f:
+            detected: Optional[str] = await self._detect_encoding_async(file, encoding)
+            async with await open_file(file=file, encoding=detected) as f:
                 contents = await f.read()
                 return contents
 
+    def _detect_encoding(self, content_path: PathLike, encoding: Optional[str]) -> Optional[str]:
+        """
+        Choose the encoding used to read the content as text.
+
+        Parameters
+        ----------
+        content_path : PathLike
+            Path to the local copy of the content.
+        encoding : Optional[str]
+            Encoding requested by the caller, which takes precedence when specified.
+
+        Returns
+        -------
+        Optional[str]
+            Encoding indicated by the byte order mark if there is one, otherwise the
+            encoding of this file. ``None`` indicates that the current locale's encoding
+            should be used.
+        """
+        if encoding is not None:
+            return encoding
+        return self._encoding_from_sniff(DEFAULT_CONTENT_SNIFFER.sniff(content_path))
+
+    async def _detect_encoding_async(
+        self, content_path: Optional[PathLike], encoding: Optional[str]
+    ) -> Optional[str]:
+        """
+        Choose the encoding used to read the content as text without blocking.
+
+        Parameters
+        ----------
+        content_path : Optional[PathLike]
+            Path to the local copy of the content.
+        encoding : Optional[str]
+            Encoding requested by the caller, which takes precedence when specified.
+
+        Returns
+        -------
+        Optional[str]
+            Encoding indicated by the byte order mark if there is one, otherwise the
+            encoding of this file. ``None`` indicates that the current locale's encoding
+            should be used.
+        """
+        if encoding is not None or content_path is None:
+            return encoding
+        return self._encoding_from_sniff(await DEFAULT_CONTENT_SNIFFER.sniff_async(content_path))
+
+    def _encoding_from_sniff(self, sniffed: SniffedContent) -> Optional[str]:
+        return sniffed.encoding if sniffed.bom_length else self._file_encoding
+
+    def iter_chunks(
+        self,
+        size: int = DEFAULT_CHUNK_SIZE,
+        binary: bool = False,
+        encoding: Optional[str] = None,
+    ) -> Iterator[Union[str, bytes]]:
+        """
+        Iterate over the contents of the file in chunks.
+
+        Only one chunk is held in memory at a time, so this method is suitable for files
+        that are too large for the ``get_contents`` method. The local copy of the content
+        stays pinned until the iteration finishes or the iterator is closed.
+
+        Parameters
+        ----------
+        size : int, optional
+            Maximum size of each chunk, in characters for text or in bytes for binary
+            content. The default is ``DEFAULT_CHUNK_SIZE``.
+        binary : bool, optional
+            Whether to produce ``bytes`` chunks instead of ``str`` chunks. The default is
+            ``False``.
+        encoding : Optional[str], optional
+            Encoding to use when reading text. The default is ``None``, in which case the
+            encoding is detected from the byte order mark, then taken from the
+            ``file_encoding`` property, and otherwise is the current locale's encoding.
+
+        Returns
+        -------
+        Iterator[Union[str, bytes]]
+            Chunks of the file's contents.
+        """
+        with self.get_reference_to_actual_content_file() as local_pin:
+            file: Optional[PathLike] = local_pin.content_path
+            if file is None:
+                return
+            if binary:
+                with open(file, "rb") as binary_file:
+                    yield from iter(functools.partial(binary_file.read, size), b"")
+            else:
+                with open(file, encoding=self._detect_encoding(file, encoding)) as text_file:
+                    yield from iter(functools.partial(text_file.read, size), "")
+
+    async def iter_chunks_async(
+        self,
+        size: int = DEFAULT_CHUNK_SIZE,
+        binary: bool = False,
+        encoding: Optional[str] = None,
+    ) -> AsyncIterator[Union[str, bytes]]:
+        """
+        Asynchronously iterate over the contents of the file in chunks.
+
+        Only one chunk is held in memory at a time. The local copy of the content stays
+        pinned until the iteration finishes or the iterator is closed.
+
+        Parameters
+        ----------
+        size : int, optional
+            Maximum size of each chunk, in characters for text or in bytes for binary
+            content. The default is ``DEFAULT_CHUNK_SIZE``.
+        binary : bool, optional
+            Whether to produce ``bytes`` chunks instead of ``str`` chunks. The default is
+            ``False``.
+        encoding : Optional[str], optional
+            Encoding to use when reading text. The default is ``None``, in which case the
+            encoding is detected from the byte order mark, then taken from the
+            ``file_encoding`` property, and otherwise is the current locale's encoding.
+
+        Returns
+        -------
+        AsyncIterator[Union[str, bytes]]
+            Chunks of the file's contents.
+        """
+        async with await self.get_reference_to_actual_content_file_async() as local_pin:
+            file: Optional[PathLike] = local_pin.content_path
+            if file is None:
+                return
+            if binary:
+                async with await open_file(file, "rb") as binary_file:
+                    while binary_chunk := await binary_file.read(size):
+                        yield binary_chunk
+            else:
+                detected: Optional[str] = await self._detect_encoding_async(file, encoding)
+                async with await open_file(file, encoding=detected) as text_file:
+                    while text_chunk := await text_file.read(size):
+                        yield text_chunk
+
+    @staticmethod
+    @contextmanager
+    def _map_file(file: Optional[PathLike]) -> Iterator[memoryview]:
+        """Map a local file into memory as a read-only ``memoryview``."""
+        if file is None or path.getsize(file) == 0:
+            # Empty files cannot be mapped.
+            yield memoryview(b"")
+            return
+        with open(file, "rb") as mapped_file:
+            with mmap.mmap(mapped_file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+                view = memoryview(mapping)
+                try:
+                    yield view
+                finally:
+                    view.release()
+
+    @contextmanager
+    def map_contents(self) -> Iterator[memoryview]:
+        """
+        Map the contents of the file into memory.
+
+        The contents are paged in by the operating system as they are accessed, so large
+        files can be processed without reading them entirely. The returned view is
+        read-only and is only valid inside the ``with`` block, during which the local copy
+        of the content stays pinned.
+
+        Returns
+        -------
+        Iterator[memoryview]
+            Context manager producing a read-only view of the file's bytes.
+        """
+        with self.get_reference_to_actual_content_file() as local_pin:
+            with FileValue._map_file(local_pin.content_path) as view:
+                yield view
+
+    @asynccontextmanager
+    async def map_contents_async(self) -> AsyncIterator[memoryview]:
+        """
+        Map the contents of the file into memory, realizing them asynchronously.
+
+        The returned view is read-only and is only valid inside the ``async with``
+        block, during which the local copy of the content stays pinned.
+
+        Returns
+        -------
+        AsyncIterator[memoryview]
+            Context manager producing a read-only view of the file's bytes.
+        """
+        async with await self.get_reference_to_actual_content_file_async() as local_pin:
+            with FileValue._map_file(local_pin.content_path) as view:
+                yield view
+
     @abstractmethod
     def _has_content(self) -> bool:
         """
@@ -464,12 +796,71 @@ class FileValue(IVariableValue, ABC):
         api_obj: Dict[str, Optional[str]] = self.to_api_object(cast(ISaveContext, context))
         return json.dumps(api_obj)
 
+    def _save_content(
+        self,
+        save_context: ISaveContext,
+        content_path: Optional[PathLike],
+        content_id: Optional[str],
+    ) -> str:
+        """
+        Save the local file holding this value's contents, recording their digest.
+
+        If the digest of the contents is already known, the save context may skip the save
+        when it already holds the same contents. If the save context computes the digest,
+        it is recorded on this value.
+
+        Parameters
+        ----------
+        save_context : ISaveContext
+            Save context to save the contents to.
+        content_path : Optional[PathLike]
+            Local file holding this value's contents, or ``None`` if there is no such file.
+        content_id : Optional[str]
+            Content ID to request from the save context.
+
+        Returns
+        -------
+        str
+            Content ID returned by the save context.
+        """
+        if content_path is None:
+            return save_context.save_file("", content_id)
+        known_digest: Optional[str] = self._current_digest(content_path)
+        if known_digest is None:
+            # Any recorded digest is of contents that have changed since.
+            self._digest = None
+        saved_id, digest = save_context.save_file_with_digest(
+            content_path, content_id, known_digest
+        )
+        if digest is not None and digest != known_digest:
+            self._record_digest(content_path, digest)
+        return saved_id
+
+    def _content_fingerprint(self) -> Optional[str]:
+        """
+        Get a fingerprint that changes whenever the contents of this file change.
+
+        Save contexts remember the content ID issued for each ``FileValue`` instance, and
+        the ``to_api_object`` method reuses it as long as the fingerprint is unchanged.
+
+        Returns
+        -------
+        Optional[str]
+            Fingerprint of the contents, or ``None`` if the contents never change for the
+            lifetime of this value, which is the default.
+        """
+        return None
+
     def _send_actual_file(self, save_context: ISaveContext) -> str:
-        name: Union[PathLike, str] = ""
-        with self.get_reference_to_actual_content_file() as local_pin:
-            if local_pin.content_path is not None:
-                name = cast(PathLike, local_pin)
-            return save_context.save_file(name, str(self.id))
+        with ExitStack() as stack:
+            local_pin = stack.enter_context(self.get_reference_to_actual_content_file())
+            content_path: Optional[PathLike] = local_pin.content_path
+            saved_id: str = self._save_content(save_context, content_path, str(self.id))
+            if content_path is not None:
+                # The save context may still be reading the file, so let it decide when
+                # the local copy can go.
+                save_context.release_when_saved(content_path, stack.pop_all().close)
+            return saved_id
 
     def to_api_object(self, save_context: ISaveContext) -> Dict[str, Optional[str]]:
         """
@@ -487,7 +878,11 @@ class FileValue(IVariableValue, ABC):
         """
         obj: Dict[str, Optional[str]] = {}
         if self._has_content():
-            content_marker: str = self._send_actual_file(save_context)
+            fingerprint: Optional[str] = self._content_fingerprint()
+            content_marker: Optional[str] = save_context.get_saved_content_id(self.id, fingerprint)
+            if content_marker is None:
+                content_marker = self._send_actual_file(save_context)
+                save_context.set_saved_content_id(self.id, fingerprint, content_marker)
             obj[FileValue.CONTENTS_KEY] = content_marker
 
         if self._original_path:
@@ -496,8 +891,13 @@ class FileValue(IVariableValue, ABC):
             obj[FileValue.MIMETYPE_KEY] = self._mime_type
         if self._file_encoding:
             obj[FileValue.ENCODING_KEY] = self._file_encoding
-        if not (self._size is None):
-            obj[FileValue.SIZE_KEY] = str(self._size)
+        size: Optional[int] = self.file_size
+        if not (size is None):
+            obj[FileValue.SIZE_KEY] = str(size)
+        # The digest is checked against the local file whenever the contents are saved,
+        # and a reused content ID means the contents have not changed since.
+        if self._digest is not None:
+            obj[FileValue.DIGEST_KEY] = self._digest
         return obj
 
     # TODO: Async get_contents
@@ -538,6 +938,8 @@ class LocalFileValue(FileValue, ABC):
     nothing on enter or exit but still allows access to the actual content path.
     """
 
+    __slots__ = ("__actual_content_file_name",)
+
     def __init__(
         self,
         original_path: Optional[PathLike] = None,
@@ -546,6 +948,7 @@ class LocalFileValue(FileValue, ABC):
         value_id: Optional[UUID] = None,
         file_size: Optional[int] = None,
         actual_content_file_name: Optional[PathLike] = None,
+        copy_methods: Optional[Sequence[FileCopyMethod]] = None,
     ):
         """
         Initialize a new instance.
@@ -568,6 +971,11 @@ class LocalFileValue(FileValue, ABC):
             Size of the file in bytes. The default value is `None`, which indicates that
             the file size is not known. A size of `None` does not indicate that the file
             is zero bytes.
+        actual_content_file_name : Optional[PathLike], optional
+            Path to the local file holding the contents. The default is ``None``.
+        copy_methods : Optional[Sequence[FileCopyMethod]], optional
+            Methods the ``write_file`` method tries, in order, to copy the file's contents.
+            The default is ``None``, in which case the default methods are used.
         """
         super().__init__(
             original_path=original_path,
@@ -575,6 +983,7 @@ class LocalFileValue(FileValue, ABC):
             value_id=value_id,
             mime_type=mime_type,
             file_size=file_size,
+            copy_methods=copy_methods,
         )
         self.__actual_content_file_name = actual_content_file_name
 
@@ -590,6 +999,18 @@ class LocalFileValue(FileValue, ABC):
         """
         return self.__actual_content_file_name
 
+    @overrides
+    def _content_fingerprint(self) -> Optional[str]:
+        # The local file may be changed in place, so fingerprint it by size and
+        # modification time.
+        if self.actual_content_file_name is None:
+            return None
+        try:
+            size, mtime_ns = FileValue._stamp(self.actual_content_file_name)
+        except OSError:
+            return None
+        return f"{size}:{mtime_ns}"
+
     @overrides
     async def get_reference_to_actual_content_file_async(
         self, progress_callback: Optional[Callable[[int], None]] = None
@@ -611,6 +1032,8 @@ class EmptyFileValue(LocalFileValue):
     ``ansys.tools.variableinterop.EMPTY_FILE``.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """
         Construct a new instance.
@@ -630,7 +1053,12 @@ class EmptyFileValue(LocalFileValue):
         return None
 
     @overrides
-    async def write_file(self, file_name: PathLike) -> None:
+    async def write_file(
+        self,
+        file_name: PathLike,
+        copy_methods: Optional[Sequence[FileCopyMethod]] = None,
+        record_digest: bool = False,
+    ) -> None:
         # TODO: Research correct exception to throw
         raise NotImplementedError()
 
@@ -0,0 +1,541 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Provides opt-in instrumentation of conversions, serialization and file I/O.
+
+Instrumentation is off by default and costs nothing while off: enabling it replaces the
+instrumented functions and methods with timing wrappers, and disabling it puts the
+originals back. Each call made while it is on is reported to every registered sink as an
+``OperationRecord``.
+
+Functions are replaced in every module of this package that refers to them. Code outside
+the package that imported an instrumented function by name before instrumentation was
+enabled keeps calling the original and is not measured.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+import contextvars
+import functools
+import inspect
+import logging
+import os
+import sys
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+from overrides import overrides
+
+_PACKAGE = __name__.rpartition(".")[0]
+
+Measure = Callable[[Tuple[Any, ...], Any], Tuple[int, int]]
+"""Gets the element count and size in bytes of a call from its arguments and result."""
+
+
+class OperationRecord(NamedTuple):
+    """Describes a single call of an instrumented operation."""
+
+    operation: str
+    """Name of the operation, such as ``"to_api_string"``."""
+    seconds: float
+    """Time spent in the call, in seconds."""
+    elements: int
+    """Number of values or array elements processed."""
+    nbytes: int
+    """
+    Size of the data processed, in bytes.
+
+    For API strings and display strings, this is the number of characters.
+    """
+    error: Optional[BaseException]
+    """Exception raised by the call, or ``None`` if it succeeded."""
+
+
+class InstrumentationSink(ABC):
+    """Receives the records of instrumented operations."""
+
+    @abstractmethod
+    def record(self, record: OperationRecord) -> None:
+        """
+        Receive the record of a call.
+
+        This method is called on the thread that made the call and must be thread-safe.
+
+        Parameters
+        ----------
+        record : OperationRecord
+            Record of the call.
+        """
+        ...
+
+
+class OperationStats(NamedTuple):
+    """Accumulated statistics of one operation."""
+
+    calls: int
+    """Number of calls."""
+    errors: int
+    """Number of calls that raised an exception."""
+    seconds: float
+    """Total time spent in calls, in seconds."""
+    elements: int
+    """Total number of values or array elements processed."""
+    nbytes: int
+    """Total size of the data processed, in bytes."""
+
+
+class StatsSink(InstrumentationSink):
+    """Accumulates statistics per operation in memory."""
+
+    def __init__(self) -> None:
+        """Initialize a new instance with no statistics."""
+        self._lock = threading.Lock()
+        self._stats: Dict[str, List[Any]] = {}
+
+    @overrides
+    def record(self, record: OperationRecord) -> None:
+        with self._lock:
+            stats = self._stats.get(record.operation)
+            if stats is None:
+                stats = self._stats[record.operation] = [0, 0, 0.0, 0, 0]
+            stats[0] += 1
+            if record.error is not None:
+                stats[1] += 1
+            stats[2] += record.seconds
+            stats[3] += record.elements
+            stats[4] += record.nbytes
+
+    def snapshot(self) -> Dict[str, OperationStats]:
+        """
+        Get the statistics accumulated so far.
+
+        Returns
+        -------
+        Dict[str, OperationStats]
+            Statistics for each operation that has been called.
+        """
+        with self._lock:
+            return {name: OperationStats(*stats) for name, stats in self._stats.items()}
+
+    def reset(self) -> None:
+        """Discard the statistics accumulated so far."""
+        with self._lock:
+            self._stats.clear()
+
+
+class LoggingSink(InstrumentationSink):
+    """Writes each record to a logger."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        logger : Optional[logging.Logger], optional
+            Logger to write to. The default is ``None``, which uses this module's logger.
+        level : int, optional
+            Level to log records at.
+        """
+        self._logger = logger if logger is not None else logging.getLogger(__name__)
+        self._level = level
+
+    @overrides
+    def record(self, record: OperationRecord) -> None:
+        if self._logger.isEnabledFor(self._level):
+            self._logger.log(
+                self._level,
+                "%s took %.6f s for %d elements, %d bytes%s",
+                record.operation,
+                record.seconds,
+                record.elements,
+                record.nbytes,
+                "" if record.error is None else f" and raised {type(record.error).__name__}",
+            )
+
+
+class CallbackSink(InstrumentationSink):
+    """Passes each record to a function."""
+
+    def __init__(self, callback: Callable[[OperationRecord], None]):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        callback : Callable[[OperationRecord], None]
+            Function to call with each record. It is called on the thread that made the
+            instrumented call and must be thread-safe.
+        """
+        self._callback = callback
+
+    @overrides
+    def record(self, record: OperationRecord) -> None:
+        self._callback(record)
+
+
+def _elements(value: Any) -> int:
+    """Count the elements of a value."""
+    if isinstance(value, np.ndarray):
+        return value.size
+    return 0 if value is None else 1
+
+
+def _nbytes(value: Any) -> int:
+    """Get the size of a value, counting strings by characters."""
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        return value.nbytes
+    return 0
+
+
+def _path_size(path: Any) -> int:
+    """Get the size of a file, or ``0`` if it cannot be determined."""
+    try:
+        return os.stat(path).st_size if path is not None else 0
+    except (OSError, TypeError, ValueError):
+        return 0
+
+
+def _measure_to_string(args: Tuple[Any, ...], result: Any) -> Tuple[int, int]:
+    return _elements(args[0]), _nbytes(result)
+
+
+def _measure_from_string(args: Tuple[Any, ...], result: Any) -> Tuple[int, int]:
+    return _elements(result), _nbytes(args[1])
+
+
+def _measure_parsed_string(args: Tuple[Any, ...], result: Any) -> Tuple[int, int]:
+    return _elements(result), _nbytes(args[0])
+
+
+def _measure_conversion(args: Tuple[Any, ...], result: Any) -> Tuple[int, int]:
+    return _elements(args[0]), _nbytes(args[0])
+
+
+def _measure_coercion(args: Tuple[Any, ...], result: Any) -> Tuple[int, int]:
+    return _elements(result), _nbytes(result)
+
+
+def _measure_file_value(args: Tuple[Any, ...], result: Any) -> Tuple[int, int]:
+    return 1, args[0].file_size or 0
+
+
+def _measure_file_contents(args: Tuple[Any, ...], result: Any) -> Tuple[int, int]:
+    return 1, _nbytes(result)
+
+
+def _measure_saved_file(args: Tuple[Any, ...], result: Any) -> Tuple[int, int]:
+    return 1, _path_size(args[1])
+
+
+def _measure_loaded_file(args: Tuple[Any, ...], result: Any) -> Tuple[int, int]:
+    return (0, 0) if result is None else (1, _path_size(result))
+
+
+_FUNCTIONS: Sequence[Tuple[str, str, str, Measure]] = (
+    ("api_serialization", "to_api_string", "to_api_string", _measure_to_string),
+    ("api_serialization", "from_api_string", "from_api_string", _measure_from_string),
+    *(
+        ("scalar_value_conversion", name, name, _measure_conversion)
+        for name in ("to_boolean_value", "to_integer_value", "to_real_value", "to_string_value")
+    ),
+    *(
+        ("array_value_conversion", name, name, _measure_conversion)
+        for name in (
+            "to_boolean_array_value",
+            "to_integer_array_value",
+            "to_real_array_value",
+            "to_string_array_value",
+        )
+    ),
+    (
+        "utils.implicit_coercion",
+        "implicit_coerce_single",
+        "implicit_coerce_single",
+        _measure_coercion,
+    ),
+)
+"""Module, function name, operation name and measure of each instrumented function."""
+
+_METHODS: Sequence[Tuple[str, str, str, str, Measure]] = (
+    ("variable_value", "IVariableValue", "to_api_string", "to_api_string", _measure_to_string),
+    (
+        "variable_value",
+        "IVariableValue",
+        "from_api_string",
+        "from_api_string",
+        _measure_parsed_string,
+    ),
+    (
+        "variable_value",
+        "IVariableValue",
+        "to_display_string",
+        "to_display_string",
+        _measure_to_string,
+    ),
+    ("file_value", "FileValue", "write_file", "write_file", _measure_file_value),
+    ("file_value", "FileValue", "get_contents", "get_contents", _measure_file_contents),
+    ("isave_context", "ISaveContext", "save_file", "save_file", _measure_saved_file),
+    ("isave_context", "ISaveContext", "save_file_with_digest", "save_file", _measure_saved_file),
+    ("isave_context", "ILoadContext", "load_file", "load_file", _measure_loaded_file),
+)
+"""
+Module, base class, method name, operation name and measure of each instrumented method.
+
+The method is instrumented on the base class and on every subclass that overrides it.
+Static methods, such as the ``from_api_string`` method of each value type, are instrumented
+as static methods.
+"""
+
+_active_operations: contextvars.ContextVar[FrozenSet[str]] = contextvars.ContextVar(
+    "_active_operations", default=frozenset()
+)
+"""Operations already being measured, so that nested calls are not counted twice."""
+
+_lock = threading.RLock()
+_sinks: Tuple[InstrumentationSink, ...] = ()
+_installed: List[Tuple[Any, str, Any]] = []
+
+
+def _publish(record: OperationRecord) -> None:
+    """Send a record to every sink."""
+    for sink in _sinks:
+        sink.record(record)
+
+
+def _wrap(function: Callable, operation: str, measure: Measure) -> Callable:
+    """
+    Wrap a function in one that reports each call.
+
+    Parameters
+    ----------
+    function : Callable
+        Function to wrap. May be a coroutine function.
+    operation : str
+        Name of the operation to report calls as.
+    measure : Measure
+        Function that measures a call.
+
+    Returns
+    -------
+    Callable
+        Wrapper for the function.
+    """
+
+    def report(args: Tuple[Any, ...], result: Any, error: Any, seconds: float) -> None:
+        try:
+            elements, nbytes = measure(args, result) if error is None else (0, 0)
+        except Exception:
+            elements, nbytes = 0, 0
+        _publish(OperationRecord(operation, seconds, elements, nbytes, error))
+
+    if inspect.iscoroutinefunction(function):
+
+        @functools.wraps(function)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            active = _active_operations.get()
+            if operation in active:
+                return await function(*args, **kwargs)
+            token = _active_operations.set(active | {operation})
+            start = time.perf_counter()
+            try:
+                result = await function(*args, **kwargs)
+            except BaseException as error:
+                report(args, None, error, time.perf_counter() - start)
+                raise
+            finally:
+                _active_operations.reset(token)
+            report(args, result, None, time.perf_counter() - start)
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        active = _active_operations.get()
+        if operation in active:
+            return function(*args, **kwargs)
+        token = _active_operations.set(active | {operation})
+        start = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as error:
+            report(args, None, error, time.perf_counter() - start)
+            raise
+        finally:
+            _active_operations.reset(token)
+        report(args, result, None, time.perf_counter() - start)
+        return result
+
+    return wrapper
+
+
+def _subclasses(cls: type) -> Iterator[type]:
+    """Iterate over a class and all of its subclasses, each once."""
+    seen = set()
+    pending = [cls]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        yield current
+        pending.extend(current.__subclasses__())
+
+
+def _install() -> None:
+    """Replace every instrumented function and method with its wrapper."""
+    # The package loads its submodules lazily. Load them all so that every subclass is
+    # wrapped and the package namespace does not keep hold of a wrapper once uninstalled.
+    package = sys.modules[_PACKAGE]
+    for name in package.__all__:
+        getattr(package, name)
+    package_modules = [
+        module
+        for name, module in list(sys.modules.items())
+        if module is not None and (name == _PACKAGE or name.startswith(_PACKAGE + "."))
+    ]
+    for module_name, function_name, operation, measure in _FUNCTIONS:
+        module = sys.modules.get(f"{_PACKAGE}.{module_name}")
+        if module is None:
+            module = __import__(f"{_PACKAGE}.{module_name}", fromlist=[function_name])
+        original = getattr(module, function_name)
+        wrapper = _wrap(original, operation, measure)
+        for holder in package_modules:
+            for attribute, value in list(vars(holder).items()):
+                if value is original:
+                    _installed.append((holder, attribute, original))
+                    setattr(holder, attribute, wrapper)
+        if getattr(module, function_name) is not wrapper:
+            _installed.append((module, function_name, original))
+            setattr(module, function_name, wrapper)
+
+    for module_name, class_name, method_name, operation, measure in _METHODS:
+        module = __import__(f"{_PACKAGE}.{module_name}", fromlist=[class_name])
+        for cls in _subclasses(getattr(module, class_name)):
+            original = cls.__dict__.get(method_name)
+            if original is None or getattr(original, "__isabstractmethod__", False):
+                continue
+            if isinstance(original, staticmethod):
+                wrapper = staticmethod(_wrap(original.__func__, operation, measure))
+            else:
+                wrapper = _wrap(original, operation, measure)
+            _installed.append((cls, method_name, original))
+            setattr(cls, method_name, wrapper)
+
+
+def _uninstall() -> None:
+    """Put back every function and method replaced by ``_install``."""
+    while _installed:
+        holder, attribute, original = _installed.pop()
+        setattr(holder, attribute, original)
+
+
+def enable_instrumentation(*sinks: InstrumentationSink) -> None:
+    """
+    Start reporting instrumented operations to sinks.
+
+    If instrumentation is already enabled, the sinks are added to those already
+    registered.
+
+    Instrumentation is global to the process. Enabling it imports every submodule of this
+    package, then replaces the instrumented functions in all of the package's modules and
+    the instrumented methods on their base classes and on every subclass that overrides
+    them, including subclasses defined outside this package. All threads and event loops
+    are therefore measured, not only the caller. Classes defined after instrumentation is
+    enabled are not instrumented until it is disabled and enabled again.
+
+    Parameters
+    ----------
+    *sinks : InstrumentationSink
+        Sinks to report operations to.
+    """
+    global _sinks
+    if not sinks:
+        raise ValueError("At least one sink is required.")
+    with _lock:
+        if not _installed:
+            _install()
+        _sinks = _sinks + tuple(sink for sink in sinks if sink not in _sinks)
+
+
+def disable_instrumentation(*sinks: InstrumentationSink) -> None:
+    """
+    Stop reporting instrumented operations to sinks.
+
+    When no sinks remain, the original functions and methods are restored.
+
+    Parameters
+    ----------
+    *sinks : InstrumentationSink
+        Sinks to stop reporting to. If none are given, all sinks are removed.
+    """
+    global _sinks
+    with _lock:
+        _sinks = tuple(sink for sink in _sinks if sinks and sink not in sinks)
+        if not _sinks:
+            _uninstall()
+
+
+def instrumentation_enabled() -> bool:
+    """
+    Determine whether instrumentation is enabled.
+
+    Returns
+    -------
+    bool
+        ``True`` if any sink is registered, ``False`` otherwise.
+    """
+    return bool(_sinks)
+
+
+@contextmanager
+def instrumented(*sinks: InstrumentationSink) -> Iterator[None]:
+    """
+    Report instrumented operations to sinks for the duration of a ``with`` block.
+
+    Parameters
+    ----------
+    *sinks : InstrumentationSink
+        Sinks to report operations to.
+    """
+    enable_instrumentation(*sinks)
+    try:
+        yield
+    finally:
+        disable_instrumentation(*sinks)
@@ -26,7 +26,8 @@ from abc import ABC, abstractmethod
 from contextlib import AbstractContextManager
 from os import PathLike
 from types import TracebackType
-from typing import Optional, Type, Union
+from typing import Callable, Dict, Optional, Tuple, Type, Union
+from uuid import UUID
 
 from overrides import overrides
 
@@ -77,6 +78,108 @@ class ISaveContext(AbstractContextManager, ABC):
         """
         ...
 
+    def save_file_with_digest(
+        self, source: Union[PathLike, str], content_id: Optional[str], digest: Optional[str]
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Save a file to the save medium, taking advantage of the digest of its contents.
+
+        Implementations that copy file contents can compute the digest while copying and
+        skip the copy entirely if they already hold content with the given digest. The
+        default implementation calls ``save_file`` and returns the given digest.
+
+        Parameters
+        ----------
+        source : Union[PathLike, str]
+            File on disk to send or include in the save.
+        content_id : Optional[str]
+            Unique ID for the file, or ``None`` to generate one, as for ``save_file``.
+        digest : Optional[str]
+            Digest of the file's contents in the form ``"<algorithm>:<hex digest>"``, or
+            ``None`` if it is not known.
+
+        Returns
+        -------
+        Tuple[str, Optional[str]]
+            ID of the saved contents and the digest of the contents, if known. The ID may
+            differ from ``content_id`` when content with the same digest was already saved.
+        """
+        return self.save_file(source, content_id), digest
+
+    def release_when_saved(self, source: Union[PathLike, str], release: Callable[[], None]) -> None:
+        """
+        Call a function once a file passed to ``save_file`` is no longer needed.
+
+        Callers use this to keep a file that only exists for the save, such as a pinned
+        local copy of remote contents, in place until the contents are stored. The default
+        implementation calls ``release`` at once, as it assumes that ``save_file`` has
+        finished reading the file when it returns. Implementations that save files later
+        must call it once they are done with the file.
+
+        Parameters
+        ----------
+        source : Union[PathLike, str]
+            File previously passed to ``save_file``.
+        release : Callable[[], None]
+            Function that releases the file.
+        """
+        release()
+
+    def get_saved_content_id(
+        self, value_id: UUID, fingerprint: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Get the content ID previously issued for a ``FileValue`` instance saved to this
+        context.
+
+        Parameters
+        ----------
+        value_id : UUID
+            ID of the ``FileValue`` instance.
+        fingerprint : Optional[str], optional
+            Fingerprint of the value's contents, such as the size and modification time of
+            its local file. The default is ``None``, which indicates that the contents are
+            identified by the value's ID alone.
+
+        Returns
+        -------
+        Optional[str]
+            Content ID recorded for the value with the same fingerprint, or ``None`` if the
+            value has not been saved to this context or its fingerprint changed since.
+        """
+        saved: Optional[Tuple[Optional[str], str]] = self.__saved_content_ids().get(value_id)
+        if saved is None or saved[0] != fingerprint:
+            return None
+        return saved[1]
+
+    def set_saved_content_id(
+        self, value_id: UUID, fingerprint: Optional[str], content_id: str
+    ) -> None:
+        """
+        Record the content ID issued for a ``FileValue`` instance saved to this context.
+
+        Parameters
+        ----------
+        value_id : UUID
+            ID of the ``FileValue`` instance.
+        fingerprint : Optional[str]
+            Fingerprint of the value's contents, or ``None`` if the contents are identified
+            by the value's ID alone.
+        content_id : str
+            Content ID issued by the ``save_file`` method.
+        """
+        self.__saved_content_ids()[value_id] = (fingerprint, content_id)
+
+    def __saved_content_ids(self) -> Dict[UUID, Tuple[Optional[str], str]]:
+        # Implementations need not call a base initializer, so the map is created lazily.
+        saved: Optional[Dict[UUID, Tuple[Optional[str], str]]] = getattr(
+            self, "_saved_content_ids", None
+        )
+        if saved is None:
+            saved = {}
+            self._saved_content_ids = saved
+        return saved
+
     # TODO: What stream API to use?
     # TODO: Async?
 
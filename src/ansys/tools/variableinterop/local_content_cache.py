@@ -0,0 +1,333 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Defines the ``LocalContentCache`` class."""
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import os
+from os import PathLike
+from pathlib import Path
+import tempfile
+import threading
+from typing import Awaitable, Callable, Optional, Union
+from uuid import uuid4
+import weakref
+
+from overrides import overrides
+
+from .file_value import AsyncLocalFileContentContext, LocalFileContentContext
+
+
+class _CacheEntry:
+    """Bookkeeping for one locally realized copy of some content."""
+
+    def __init__(self, content_path: Path, size: int):
+        self.content_path: Path = content_path
+        self.size: int = size
+        self.pins: int = 0
+
+
+class CachedFileContentContext(LocalFileContentContext, AsyncLocalFileContentContext):
+    """
+    Provides a local file content context whose file is held in a ``LocalContentCache``
+    instance.
+
+    While the context is open, the cache entry is pinned and cannot be evicted. Exiting
+    the context releases the pin but leaves the file in the cache for later use.
+    """
+
+    def __init__(self, cache: LocalContentCache, key: str, content_path: Path):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        cache : LocalContentCache
+            Cache holding the file.
+        key : str
+            Key of the cache entry.
+        content_path : Path
+            Path to the cached file.
+        """
+        self._cache: LocalContentCache = cache
+        self._key: str = key
+        self._content_path: Path = content_path
+        self._released: bool = False
+
+    @property  # type: ignore
+    @overrides
+    def content_path(self) -> Path:
+        return self._content_path
+
+    @overrides
+    def keep_file_on_exit(self) -> None:
+        # Hand the file over to the caller: the cache forgets it and never deletes it.
+        self._cache._detach(self._key)
+        self._released = True
+
+    def _release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._cache._unpin(self._key)
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit the context, releasing the pin on the cache entry."""
+        self._release()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Asynchronously exit the context, releasing the pin on the cache entry."""
+        self._release()
+
+
+class LocalContentCache:
+    """
+    Provides a size-bounded cache of file contents realized on the local disk.
+
+    This class is intended for ``FileValue`` implementations whose contents are not
+    stored locally. Instead of fetching the contents into a temporary file every time a
+    local copy is requested, they can fetch it into the cache once and hand out
+    ``CachedFileContentContext`` instances for it.
+
+    Entries are evicted in least-recently-used order once the total size of the cached
+    files exceeds the configured limit. Entries that are pinned by an open context are
+    never evicted, so the cache may temporarily exceed its limit if all entries are in
+    use.
+
+    Each instance stores its files in a subdirectory of its own, which is deleted when the
+    cache is closed or garbage collected. Files handed over by ``keep_file_on_exit``
+    belong to the caller and are not deleted, so the subdirectory remains while any
+    exist.
+    """
+
+    def __init__(self, cache_directory: Union[PathLike, str], max_bytes: int):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        cache_directory : Union[PathLike, str]
+            Directory in which the subdirectory holding the cached files is created. It is
+            created if it does not exist.
+        max_bytes : int
+            Maximum total size of the cached files in bytes.
+        """
+        if max_bytes < 0:
+            raise ValueError("The maximum cache size cannot be negative.")
+        parent: Path = Path(cache_directory)
+        parent.mkdir(parents=True, exist_ok=True)
+        self._cache_directory: Path = Path(tempfile.mkdtemp(prefix="cache-", dir=parent))
+        self._max_bytes: int = max_bytes
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._finalizer: weakref.finalize = weakref.finalize(
+            self, LocalContentCache._remove_files, self._entries, self._cache_directory
+        )
+        self._total_bytes: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self.hits: int = 0
+        """Number of pins that were satisfied by an already cached file."""
+        self.misses: int = 0
+        """Number of pins that required the content to be fetched."""
+
+    @property
+    def cache_directory(self) -> Path:
+        """Subdirectory of this instance in which cached files are stored."""
+        return self._cache_directory
+
+    @staticmethod
+    def _remove_files(entries: OrderedDict[str, _CacheEntry], cache_directory: Path) -> None:
+        for entry in entries.values():
+            entry.content_path.unlink(missing_ok=True)
+        entries.clear()
+        try:
+            cache_directory.rmdir()
+        except OSError:
+            # Files kept by callers, or temporary files of fetches still in progress.
+            pass
+
+    def close(self) -> None:
+        """
+        Delete all cached files and the subdirectory holding them.
+
+        Contexts obtained from the cache must be exited first. The cache cannot be used
+        once it is closed.
+        """
+        with self._lock:
+            self._finalizer()
+            self._total_bytes = 0
+
+    def __enter__(self) -> LocalContentCache:
+        """Enter a context that closes the cache on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the cache."""
+        self.close()
+
+    @property
+    def max_bytes(self) -> int:
+        """Maximum total size of the cached files in bytes."""
+        return self._max_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the cached files in bytes."""
+        return self._total_bytes
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether the content with the given key is cached."""
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """Get the number of cached files."""
+        return len(self._entries)
+
+    def _path_for(self, key: str, suffix: str) -> Path:
+        # Keys are arbitrary strings, so hash them to get a safe file name. Every
+        # realization also gets a unique name, so that a file handed over by
+        # keep_file_on_exit is never overwritten by a later fetch of the same content.
+        key_hash: str = hashlib.sha256(key.encode()).hexdigest()
+        return self._cache_directory / f"{key_hash}.{uuid4().hex}{suffix}"
+
+    def _try_pin(self, key: str) -> Optional[CachedFileContentContext]:
+        with self._lock:
+            entry: Optional[_CacheEntry] = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            entry.pins += 1
+            self._entries.move_to_end(key)
+            return CachedFileContentContext(self, key, entry.content_path)
+
+    def _add_and_pin(self, key: str, fetched: Path, content_path: Path) -> CachedFileContentContext:
+        with self._lock:
+            entry: Optional[_CacheEntry] = self._entries.get(key)
+            if entry is not None:
+                # Another caller fetched the same content first; use its copy.
+                fetched.unlink(missing_ok=True)
+            else:
+                os.replace(fetched, content_path)
+                entry = _CacheEntry(content_path, content_path.stat().st_size)
+                self._entries[key] = entry
+                self._total_bytes += entry.size
+            entry.pins += 1
+            self._entries.move_to_end(key)
+            self._evict()
+            return CachedFileContentContext(self, key, entry.content_path)
+
+    def pin(
+        self, key: str, fetch: Callable[[Path], None], suffix: str = ""
+    ) -> LocalFileContentContext:
+        """
+        Get a context holding a local copy of some content, fetching it if needed.
+
+        Parameters
+        ----------
+        key : str
+            Key that uniquely identifies the content, such as the ``FileValue`` ID.
+        fetch : Callable[[Path], None]
+            Function called with a path to write the content to if it is not cached.
+        suffix : str, optional
+            Suffix, such as a file extension, for the cached file. The default is ``""``.
+
+        Returns
+        -------
+        LocalFileContentContext
+            Context that keeps the cached file from being evicted until it is exited.
+        """
+        if not self._finalizer.alive:
+            raise ValueError("The cache is closed.")
+        context: Optional[CachedFileContentContext] = self._try_pin(key)
+        if context is not None:
+            return context
+        fetched: Path = self._path_for(key, ".tmp")
+        try:
+            fetch(fetched)
+            return self._add_and_pin(key, fetched, self._path_for(key, suffix))
+        finally:
+            fetched.unlink(missing_ok=True)
+
+    async def pin_async(
+        self, key: str, fetch: Callable[[Path], Awaitable[None]], suffix: str = ""
+    ) -> AsyncLocalFileContentContext:
+        """
+        Get a context holding a local copy of some content, fetching it if needed.
+
+        Parameters
+        ----------
+        key : str
+            Key that uniquely identifies the content, such as the ``FileValue`` ID.
+        fetch : Callable[[Path], Awaitable[None]]
+            Coroutine function called with a path to write the content to if it is not
+            cached.
+        suffix : str, optional
+            Suffix, such as a file extension, for the cached file. The default is ``""``.
+
+        Returns
+        -------
+        AsyncLocalFileContentContext
+            Context that keeps the cached file from being evicted until it is exited.
+        """
+        if not self._finalizer.alive:
+            raise ValueError("The cache is closed.")
+        context: Optional[CachedFileContentContext] = self._try_pin(key)
+        if context is not None:
+            return context
+        fetched: Path = self._path_for(key, ".tmp")
+        try:
+            await fetch(fetched)
+            return self._add_and_pin(key, fetched, self._path_for(key, suffix))
+        finally:
+            fetched.unlink(missing_ok=True)
+
+    def _unpin(self, key: str) -> None:
+        with self._lock:
+            entry: Optional[_CacheEntry] = self._entries.get(key)
+            if entry is not None:
+                entry.pins -= 1
+                self._evict()
+
+    def _detach(self, key: str) -> None:
+        with self._lock:
+            entry: Optional[_CacheEntry] = self._entries.pop(key, None)
+            if entry is not None:
+                self._total_bytes -= entry.size
+
+    def _evict(self) -> None:
+        # Must be called with the lock held.
+        if self._total_bytes <= self._max_bytes:
+            return
+        for key in [key for key, entry in self._entries.items() if entry.pins == 0]:
+            entry = self._entries.pop(key)
+            entry.content_path.unlink(missing_ok=True)
+            self._total_bytes -= entry.size
+            if self._total_bytes <= self._max_bytes:
+                return
+
+    def clear(self) -> None:
+        """Delete all cached files that are not pinned."""
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry.pins == 0]:
+                entry = self._entries.pop(key)
+                entry.content_path.unlink(missing_ok=True)
+                self._total_bytes -= entry.size
@@ -22,10 +22,12 @@
 """Defines the ``NonManagingFileScope`` class."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import os
 from os import PathLike
 from pathlib import Path
-from typing import Dict, Optional, Union, cast
+import stat
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union, cast
 from uuid import uuid4
 
 from overrides import overrides
@@ -33,6 +35,31 @@ from overrides import overrides
 from .file_scope import FileScope
 from .file_value import EMPTY_FILE, FileValue, LocalFileValue
 from .isave_context import ILoadContext, ISaveContext
+from .utils.content_sniffing import ContentSniffer
+from .utils.file_copy import FileCopyMethod
+
+
+def _regular_file_size(to_read: Union[PathLike, str, os.DirEntry]) -> Optional[int]:
+    """
+    Get the size of a regular file with a single ``stat`` call.
+
+    Parameters
+    ----------
+    to_read : Union[PathLike, str, os.DirEntry]
+        Path to the file or a directory entry for it.
+
+    Returns
+    -------
+    Optional[int]
+        Size of the file in bytes, or ``None`` if it does not exist or is not a regular file.
+    """
+    try:
+        st: os.stat_result = (
+            to_read.stat() if isinstance(to_read, os.DirEntry) else os.stat(to_read)
+        )
+    except OSError:
+        return None
+    return st.st_size if stat.S_ISREG(st.st_mode) else None
 
 
 class NonManagingFileScope(FileScope, ISaveContext, ILoadContext):
@@ -54,12 +81,20 @@ class NonManagingFileScope(FileScope, ISaveContext, ILoadContext):
     class NonManagingFileValue(LocalFileValue):
         """Implementation of a ``FileValue`` instance used by this scope."""
 
+        __slots__ = ("_size_pending",)
+
         @overrides
         def _has_content(self) -> bool:
             return bool(self._original_path)
 
         def __init__(
-            self, to_read: PathLike, mime_type: Optional[str] = None, encoding: Optional[str] = None
+            self,
+            to_read: PathLike,
+            mime_type: Optional[str] = None,
+            encoding: Optional[str] = None,
+            copy_methods: Optional[Sequence[FileCopyMethod]] = None,
+            file_size: Optional[int] = None,
+            lazy_file_size: bool = False,
         ) -> None:
             """
             Construct a new ``NonManagingFileValue`` instance.
@@ -74,15 +109,24 @@ class NonManagingFileScope(FileScope, ISaveContext, ILoadContext):
             encoding : Optional[str], optional
                 Encoding of the file. The default value is `None`, which indicates that the
                 file does not have a known text encoding (for example, because it is a binary file).
+            copy_methods : Optional[Sequence[FileCopyMethod]], optional
+                Methods to try, in order, when writing the contents to a file. The default
+                value is ``None``, in which case the default methods are used.
+            file_size : Optional[int], optional
+                Size of the file in bytes, if the caller already knows it. The default
+                value is ``None``, in which case the size is read from the file system.
+            lazy_file_size : bool, optional
+                Whether to defer reading the size from the file system until the
+                ``file_size`` property is first accessed. The default value is ``False``.
             """
-            size: Optional[int] = None
+            size: Optional[int] = file_size
             # TODO: The tests use a lot of non-existent files, so this prevents
             # it from crashing in those cases. This may not be what we want in an API
             # though? Probably would be better to not let you create a FileValue to a
             # non-existent file?
-            if os.path.isfile(to_read):
-                st = os.stat(to_read)
-                size = st.st_size
+            if size is None and not lazy_file_size:
+                size = _regular_file_size(to_read)
+            self._size_pending: bool = size is None and lazy_file_size
             super().__init__(
                 original_path=to_read,
                 mime_type=mime_type,
@@ -90,17 +134,141 @@ class NonManagingFileScope(FileScope, ISaveContext, ILoadContext):
                 value_id=uuid4(),
                 file_size=size,
                 actual_content_file_name=to_read,
+                copy_methods=copy_methods,
             )
 
+        @property  # type: ignore
+        @overrides
+        def file_size(self) -> Optional[int]:
+            if self._size_pending:
+                self._size_pending = False
+                if self._size is None:
+                    self._size = _regular_file_size(cast(PathLike, self.actual_content_file_name))
+            return self._size
+
         @overrides
         def _send_actual_file(self, save_context: ISaveContext) -> str:
-            return save_context.save_file(str(self.actual_content_file_name), None)
+            return self._save_content(save_context, self.actual_content_file_name, None)
+
+    def __init__(
+        self,
+        copy_methods: Optional[Sequence[FileCopyMethod]] = None,
+        lazy_file_size: bool = False,
+        content_sniffer: Optional[ContentSniffer] = None,
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        copy_methods : Optional[Sequence[FileCopyMethod]], optional
+            Methods that ``FileValue`` instances created by this scope try, in order, when
+            writing their contents to a file. The default is ``None``, in which case the
+            default methods are used.
+        lazy_file_size : bool, optional
+            Whether ``FileValue`` instances created by this scope read their size from the
+            file system only when the ``file_size`` property is first accessed, rather than
+            when they are created. The default is ``False``.
+        content_sniffer : Optional[ContentSniffer], optional
+            Content sniffer used to detect the MIME type and encoding of files read without
+            them. The default is ``None``, in which case they are not detected.
+        """
+        super().__init__(copy_methods, content_sniffer)
+        self._lazy_file_size: bool = lazy_file_size
+
+    @property
+    def lazy_file_size(self) -> bool:
+        """Whether ``FileValue`` instances created by this scope read their size lazily."""
+        return self._lazy_file_size
 
     @overrides
     def read_from_file(
         self, to_read: PathLike, mime_type: Optional[str], encoding: Optional[str]
     ) -> FileValue:
-        return NonManagingFileScope.NonManagingFileValue(to_read, mime_type, encoding)
+        mime_type, encoding = self._sniff_metadata(to_read, mime_type, encoding)
+        return NonManagingFileScope.NonManagingFileValue(
+            to_read, mime_type, encoding, self.copy_methods, lazy_file_size=self._lazy_file_size
+        )
+
+    def read_from_files(
+        self,
+        paths: Iterable[Union[PathLike, str]],
+        mime_type: Optional[str] = None,
+        encoding: Optional[str] = None,
+        max_workers: int = 8,
+    ) -> List[FileValue]:
+        """
+        Create ``FileValue`` instances for many files at once.
+
+        The file sizes, and the MIME types and encodings if this scope has a content
+        sniffer, are read from the file system in parallel, unless this scope reads sizes
+        lazily. A path that is a directory is replaced by the regular files directly
+        inside it, in name order. Subdirectories are not searched.
+
+        Parameters
+        ----------
+        paths : Iterable[Union[PathLike, str]]
+            Paths to the files and directories to read.
+        mime_type : Optional[str], optional
+            MIME type of all the files. The default value is ``None``, which indicates that
+            the MIME type is not known.
+        encoding : Optional[str], optional
+            Encoding of all the files. The default value is ``None``, which indicates that
+            the files do not have a known text encoding.
+        max_workers : int, optional
+            Maximum number of threads that read file sizes at once. The default is ``8``.
+
+        Returns
+        -------
+        List[FileValue]
+            ``FileValue`` instances in the order of the given paths.
+        """
+
+        def metadata(
+            to_read: Union[PathLike, str], entry: Union[PathLike, str, os.DirEntry]
+        ) -> Tuple[Optional[int], Optional[str], Optional[str]]:
+            size: Optional[int] = None if self._lazy_file_size else _regular_file_size(entry)
+            return (size, *self._sniff_metadata(cast(PathLike, to_read), mime_type, encoding))
+
+        # Each file is reported with a path of the same type as the one it was given by, as
+        # in read_from_file, and is read through its directory entry if it has one.
+        files: List[Union[PathLike, str]] = []
+        entries: List[Union[PathLike, str, os.DirEntry]] = []
+        for to_read in paths:
+            if os.path.isdir(to_read):
+                with os.scandir(to_read) as scanned:
+                    for entry in sorted(
+                        (entry for entry in scanned if entry.is_file()),
+                        key=lambda entry: entry.name,
+                    ):
+                        files.append(
+                            entry.path if isinstance(to_read, str) else Path(to_read, entry.name)
+                        )
+                        entries.append(entry)
+            else:
+                files.append(to_read)
+                entries.append(to_read)
+
+        gathered: List[Tuple[Optional[int], Optional[str], Optional[str]]]
+        if self._lazy_file_size and self.content_sniffer is None:
+            gathered = [(None, mime_type, encoding)] * len(files)
+        elif max_workers == 1 or len(files) < 2:
+            gathered = [metadata(file, entry) for file, entry in zip(files, entries)]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                gathered = list(executor.map(metadata, files, entries))
+
+        return [
+            NonManagingFileScope.NonManagingFileValue(
+                cast(PathLike, file),
+                file_mime_type,
+                file_encoding,
+                self.copy_methods,
+                file_size=size,
+                lazy_file_size=self._lazy_file_size,
+            )
+            for file, (size, file_mime_type, file_encoding) in zip(files, gathered)
+        ]
 
     def to_api_string_file_store(self, file_var: FileValue) -> str:
         """
@@ -138,6 +306,7 @@ class NonManagingFileScope(FileScope, ISaveContext, ILoadContext):
                     content,
                     api_object.get(FileValue.MIMETYPE_KEY),
                     api_object.get(FileValue.ENCODING_KEY),
+                    self.copy_methods,
                 )
             else:
                 return EMPTY_FILE
@@ -34,6 +34,8 @@ from .ivariablemetadata_visitor import IVariableMetadataVisitor, T
 class NumericMetadata(CommonVariableMetadata, ABC):
     """Provides a generic base for all numeric metadata implementations."""
 
+    __slots__ = ("_units", "_display_format")
+
     @overrides
     def __init__(self) -> None:
         super().__init__()
@@ -0,0 +1,315 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Provides process-parallel deserialization of large API strings.
+
+Parsing API strings is CPU-bound and holds the GIL, so these functions distribute the
+work across processes. Small inputs are parsed in the calling process, since starting
+workers and transferring results costs more than they save.
+"""
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from math import prod
+import os
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .api_serialization import _types_and_sources, from_api_string, from_api_strings
+from .array_values import BooleanArrayValue, IntegerArrayValue, RealArrayValue, StringArrayValue
+from .exceptions import FormatException
+from .file_scope import FileScope
+from .isave_context import ILoadContext
+from .utils.array_to_from_string_util import ArrayToFromStringUtil
+from .variable_type import VariableType
+from .variable_value import CommonArrayValue, IVariableValue
+
+PARALLEL_PARSE_THRESHOLD: int = 1 << 20
+"""Length, in characters, above which a single array API string is parsed in parallel."""
+
+_MIN_CHUNK_LENGTH: int = 1 << 16
+"""Smallest piece of an array API string that is worth sending to a worker."""
+
+_DEFAULT_BATCH_CHUNK_SIZE: int = 1024
+"""Number of values of a batch sent to a worker at a time."""
+
+_ARRAY_TYPES: Dict[VariableType, Callable[..., CommonArrayValue]] = {
+    VariableType.INTEGER_ARRAY: IntegerArrayValue,
+    VariableType.REAL_ARRAY: RealArrayValue,
+    VariableType.BOOLEAN_ARRAY: BooleanArrayValue,
+    VariableType.STRING_ARRAY: StringArrayValue,
+}
+"""Array types that can be parsed in pieces, and the class of their values."""
+
+_FILE_TYPES = (VariableType.FILE, VariableType.FILE_ARRAY)
+
+_QUOTED_OR_COMMA = re.compile(r'"(?:[^"\\]|\\.)*"|,')
+"""Matches either a complete quoted value or a comma outside of quotes."""
+
+
+def _parse_array_piece(var_type: VariableType, piece: str) -> np.ndarray:
+    """
+    Parse part of the element list of an array API string.
+
+    This function runs in worker processes.
+
+    Parameters
+    ----------
+    var_type : VariableType
+        Array type being parsed.
+    piece : str
+        Comma-separated elements, without braces or bounds.
+
+    Returns
+    -------
+    np.ndarray
+        One-dimensional array of the parsed elements.
+    """
+    # Wrapping the piece in braces keeps the parser from mistaking braces inside
+    # quoted elements for the braces around the list.
+    return from_api_string(var_type, "{" + piece + "}").view(np.ndarray)
+
+
+def _parse_batch(var_types: List[VariableType], sources: List[str]) -> List[IVariableValue]:
+    """
+    Parse part of a batch of API strings.
+
+    This function runs in worker processes.
+    """
+    return from_api_strings(var_types, sources)
+
+
+def _split_elements(elements: str, pieces: int) -> List[str]:
+    """
+    Split an element list into pieces at commas that are outside of quoted values.
+
+    Parameters
+    ----------
+    elements : str
+        Comma-separated elements.
+    pieces : int
+        Number of pieces wanted. Fewer are returned if there are not enough commas.
+
+    Returns
+    -------
+    List[str]
+        Pieces of the element list, not including the commas split at.
+    """
+    target_length = len(elements) // pieces
+    split_points: List[int] = []
+    next_target = target_length
+    if '"' not in elements:
+        while len(split_points) < pieces - 1:
+            comma = elements.find(",", next_target)
+            if comma < 0:
+                break
+            split_points.append(comma)
+            next_target = comma + target_length
+    else:
+        for match in _QUOTED_OR_COMMA.finditer(elements):
+            if len(split_points) == pieces - 1:
+                break
+            if match.start() >= next_target and match.group() == ",":
+                split_points.append(match.start())
+                next_target = match.start() + target_length
+
+    result: List[str] = []
+    start = 0
+    for comma in split_points:
+        result.append(elements[start:comma])
+        start = comma + 1
+    result.append(elements[start:])
+    return result
+
+
+def _ends_with_comma(piece: str) -> bool:
+    """Determine whether a piece ends with a comma, or has no elements at all."""
+    stripped = piece.rstrip()
+    return stripped == "" or stripped[-1] == ","
+
+
+def from_api_string_parallel(
+    var_type: VariableType,
+    source: str,
+    *,
+    threshold: int = PARALLEL_PARSE_THRESHOLD,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> IVariableValue:
+    """
+    Generate a value from an API string, parsing large arrays on multiple processes.
+
+    The element list of an array API string longer than ``threshold`` is split at
+    top-level commas and the pieces are parsed concurrently. The parsed pieces are
+    reassembled into a single array with the shape given by the string's bounds. Other
+    strings are parsed in the calling process, exactly as by ``from_api_string``.
+
+    Parameters
+    ----------
+    var_type : VariableType
+        Variable type to generate. File types are not supported.
+    source : str
+        Source string.
+    threshold : int, optional
+        Length, in characters, above which an array API string is parsed in parallel.
+    max_workers : Optional[int], optional
+        Number of worker processes to start when ``executor`` is not given. The default
+        is the number of processors on the machine.
+    executor : Optional[Executor], optional
+        Executor to run the parsing on. The default is ``None``, which starts a process
+        pool for the duration of the call. Reusing an executor across calls avoids the
+        cost of starting the workers each time.
+
+    Returns
+    -------
+    IVariableValue
+        Implementation of ``IVariableValue`` of the correct type with a value parsed from the
+        specified string.
+    """
+    create_array = _ARRAY_TYPES.get(var_type)
+    if create_array is None or not isinstance(source, str) or len(source) <= threshold:
+        return from_api_string(var_type, source)
+
+    lengths: Optional[Tuple[int, ...]] = None
+    match = ArrayToFromStringUtil._array_with_bounds_pattern.search(source)
+    if match is not None:
+        try:
+            lengths = tuple(int(b) for b in match.group("boundList").split(","))
+        except ValueError:
+            # Let the serial parser report the malformed bounds.
+            return from_api_string(var_type, source)
+        elements = match.group("valueList")
+    else:
+        match = ArrayToFromStringUtil._array_with_curly_braces_pattern.search(source)
+        elements = match.group("valueList") if match is not None else source
+
+    workers = max_workers or os.cpu_count() or 1
+    pieces = _split_elements(elements, max(1, min(workers * 4, len(elements) // _MIN_CHUNK_LENGTH)))
+    # A comma before a split point must be followed by an element, and in a bounded
+    # array so must the last one, or the serial parser would reject the string.
+    checked = pieces if lengths is not None else pieces[:-1]
+    if any(_ends_with_comma(piece) for piece in checked):
+        raise FormatException
+
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(_parse_array_piece, [var_type] * len(pieces), pieces))
+    else:
+        parsed = list(executor.map(_parse_array_piece, [var_type] * len(pieces), pieces))
+
+    values = np.concatenate(parsed)
+    if lengths is not None:
+        if values.size != prod(lengths):
+            raise FormatException
+        values = values.reshape(lengths)
+    return create_array(values=values)
+
+
+def from_api_strings_parallel(
+    pairs_or_types: Union[Iterable[Tuple[VariableType, str]], Iterable[VariableType], VariableType],
+    sources: Optional[Iterable[str]] = None,
+    fscope: Optional[FileScope] = None,
+    load_context: Optional[ILoadContext] = None,
+    *,
+    chunk_size: int = _DEFAULT_BATCH_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[IVariableValue]:
+    """
+    Generate a batch of values from API strings, distributing them across processes.
+
+    The batch is split into runs of ``chunk_size`` values, each of which is parsed by
+    ``from_api_strings`` on a worker. File values are parsed in the calling process,
+    since file scopes and load contexts cannot be shared with workers.
+
+    Parameters
+    ----------
+    pairs_or_types : Union[Iterable[Tuple[VariableType, str]], Iterable[VariableType], VariableType]
+        If ``sources`` is ``None``, the variable type and source string of each value.
+        Otherwise, either the variable type of each string in ``sources`` or a single
+        variable type shared by all of them.
+    sources : Optional[Iterable[str]], optional
+        Source strings. The default is ``None``, which indicates that ``pairs_or_types``
+        holds the source strings.
+    fscope : Optional[FileScope], optional
+        File scope to use to deserialize file variables. The default is ``None``,
+        which indictates that file variables are not needed.
+    load_context : Optional[ILoadContext], optional
+        Load context to read file contents from. The default is ``None``, which
+        indicates file variables are not needed.
+    chunk_size : int, optional
+        Number of values sent to a worker at a time.
+    max_workers : Optional[int], optional
+        Number of worker processes to start when ``executor`` is not given. The default
+        is the number of processors on the machine.
+    executor : Optional[Executor], optional
+        Executor to run the parsing on. The default is ``None``, which starts a process
+        pool for the duration of the call if the batch is larger than one chunk.
+
+    Returns
+    -------
+    List[IVariableValue]
+        Implementation of ``IVariableValue`` of the correct type for each source string,
+        in the order of the source strings.
+    """
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be positive.")
+    var_types, source_list = _types_and_sources(pairs_or_types, sources)
+    file_indices = [i for i, var_type in enumerate(var_types) if var_type in _FILE_TYPES]
+    if not file_indices:
+        other_indices = list(range(len(var_types)))
+    else:
+        file_set = set(file_indices)
+        other_indices = [i for i in range(len(var_types)) if i not in file_set]
+
+    results: List[IVariableValue] = [None] * len(source_list)  # type: ignore
+    if file_indices:
+        files = from_api_strings(
+            [var_types[i] for i in file_indices],
+            [source_list[i] for i in file_indices],
+            fscope,
+            load_context,
+        )
+        for index, value in zip(file_indices, files):
+            results[index] = value
+
+    runs = [other_indices[i : i + chunk_size] for i in range(0, len(other_indices), chunk_size)]
+    if len(runs) <= 1 and executor is None:
+        parsed_runs = [
+            from_api_strings([var_types[i] for i in run], [source_list[i] for i in run])
+            for run in runs
+        ]
+    else:
+        run_types = [[var_types[i] for i in run] for run in runs]
+        run_sources = [[source_list[i] for i in run] for run in runs]
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                parsed_runs = list(pool.map(_parse_batch, run_types, run_sources))
+        else:
+            parsed_runs = list(executor.map(_parse_batch, run_types, run_sources))
+
+    for run, parsed in zip(runs, parsed_runs):
+        for index, value in zip(run, parsed):
+            results[index] = value
+    return results
@@ -31,12 +31,15 @@ from .ivariablemetadata_visitor import IVariableMetadataVisitor, T
 from .numeric_metadata import NumericMetadata
 from .scalar_values import IntegerValue, RealValue, StringValue
 from .utils.implicit_coercion import implicit_coerce
+from .value_interning import intern_strings
 from .variable_type import VariableType
 
 
 class BooleanMetadata(CommonVariableMetadata):
     """Provides metadata for ``BOOLEAN`` and ``BOOLEAN_ARRAY`` variable types."""
 
+    __slots__ = ()
+
     @overrides
     def __eq__(self, other):
         return self.equals(other)
@@ -59,13 +62,17 @@ class BooleanMetadata(CommonVariableMetadata):
 class IntegerMetadata(NumericMetadata):
     """Provides metadata for ``INTEGER`` and ``INTEGER_ARRAY`` variable types."""
 
+    # The enumerated values and aliases slots are left empty until first accessed, so that
+    # instances without any do not each allocate two lists.
+    __slots__ = ("_lower_bound", "_upper_bound", "_enumerated_values", "_enumerated_aliases")
+    _enumerated_values: List[IntegerValue]
+    _enumerated_aliases: List[str]
+
     @overrides
     def __init__(self) -> None:
         super().__init__()
         self._lower_bound: Optional[IntegerValue] = None
         self._upper_bound: Optional[IntegerValue] = None
-        self._enumerated_values: List[IntegerValue] = []
-        self._enumerated_aliases: List[str] = []
 
     @overrides
     def __eq__(self, other):
@@ -140,7 +147,11 @@ class IntegerMetadata(NumericMetadata):
         List[IntegerValue]
             List of enumerated values.
         """
-        return self._enumerated_values
+        try:
+            return self._enumerated_values
+        except AttributeError:
+            self._enumerated_values = []
+            return self._enumerated_values
 
     @enumerated_values.setter
     def enumerated_values(self, value: List[IntegerValue]) -> None:
@@ -166,7 +177,11 @@ class IntegerMetadata(NumericMetadata):
         List[str]
             List of enumerated aliases.
         """
-        return self._enumerated_aliases
+        try:
+            return self._enumerated_aliases
+        except AttributeError:
+            self._enumerated_aliases = []
+            return self._enumerated_aliases
 
     @enumerated_aliases.setter
     def enumerated_aliases(self, value: List[str]) -> None:
@@ -187,8 +202,9 @@ class IntegerMetadata(NumericMetadata):
             and super().equals(other)
             and self._lower_bound == other._lower_bound
             and self._upper_bound == other._upper_bound
-            and self._enumerated_values == other._enumerated_values
-            and self._enumerated_aliases == other._enumerated_aliases
+            and getattr(self, "_enumerated_values", []) == getattr(other, "_enumerated_values", [])
+            and getattr(self, "_enumerated_aliases", [])
+            == getattr(other, "_enumerated_aliases", [])
         )
         return equal
 
@@ -196,13 +212,17 @@ class IntegerMetadata(NumericMetadata):
 class RealMetadata(NumericMetadata):
     """Provides metadata for ``REAL`` and ``REAL_ARRAY`` variable types."""
 
+    # The enumerated values and aliases slots are left empty until first accessed, so that
+    # instances without any do not each allocate two lists.
+    __slots__ = ("_lower_bound", "_upper_bound", "_enumerated_values", "_enumerated_aliases")
+    _enumerated_values: List[RealValue]
+    _enumerated_aliases: List[str]
+
     @overrides
     def __init__(self) -> None:
         super().__init__()
         self._lower_bound: Optional[RealValue] = None
         self._upper_bound: Optional[RealValue] = None
-        self._enumerated_values: List[RealValue] = []
-        self._enumerated_aliases: List[str] = []
 
     @overrides
     def __eq__(self, other):
@@ -277,7 +297,11 @@ class RealMetadata(NumericMetadata):
         List[RealValue]
            List of enumerated values.
         """
-        return self._enumerated_values
+        try:
+            return self._enumerated_values
+        except AttributeError:
+            self._enumerated_values = []
+            return self._enumerated_values
 
     @enumerated_values.setter
     def enumerated_values(self, value: List[RealValue]) -> None:
@@ -303,7 +327,11 @@ class RealMetadata(NumericMetadata):
         List[str]
             List of enumerated aliases.
         """
-        return self._enumerated_aliases
+        try:
+            return self._enumerated_aliases
+        except AttributeError:
+            self._enumerated_aliases = []
+            return self._enumerated_aliases
 
     @enumerated_aliases.setter
     def enumerated_aliases(self, value: List[str]) -> None:
@@ -324,8 +352,9 @@ class RealMetadata(NumericMetadata):
             and super().equals(other)
             and self._lower_bound == other._lower_bound
             and self._upper_bound == other._upper_bound
-            and self._enumerated_values == other._enumerated_values
-            and self._enumerated_aliases == other._enumerated_aliases
+            and getattr(self, "_enumerated_values", []) == getattr(other, "_enumerated_values", [])
+            and getattr(self, "_enumerated_aliases", [])
+            == getattr(other, "_enumerated_aliases", [])
         )
         return equal
 
@@ -333,11 +362,11 @@ class RealMetadata(NumericMetadata):
 class StringMetadata(CommonVariableMetadata):
     """Provides common metadata for ``STRING`` and ``STRING_ARRAY`` variable types."""
 
-    @overrides
-    def __init__(self) -> None:
-        super().__init__()
-        self._enumerated_values: List[StringValue] = []
-        self._enumerated_aliases: List[str] = []
+    # The enumerated values and aliases slots are left empty until first accessed, so that
+    # instances without any do not each allocate two lists.
+    __slots__ = ("_enumerated_values", "_enumerated_aliases")
+    _enumerated_values: List[StringValue]
+    _enumerated_aliases: List[str]
 
     @overrides
     def __eq__(self, other):
@@ -364,7 +393,11 @@ class StringMetadata(CommonVariableMetadata):
         List[StringValue]
             List of enumerated values.
         """
-        return self._enumerated_values
+        try:
+            return self._enumerated_values
+        except AttributeError:
+            self._enumerated_values = []
+            return self._enumerated_values
 
     @enumerated_values.setter
     def enumerated_values(self, value: List[StringValue]) -> None:
@@ -374,8 +407,10 @@ class StringMetadata(CommonVariableMetadata):
         Parameters
         ----------
         value : List[StringValue]
-            List of values to set.
+            List of values to set. If value interning is enabled, they are registered so
+            that equal ``StringValue`` instances constructed later are shared.
         """
+        intern_strings(value)
         self._enumerated_values = value
 
     @property
@@ -390,7 +425,11 @@ class StringMetadata(CommonVariableMetadata):
         List[str]
             List of enumerated aliases.
         """
-        return self._enumerated_aliases
+        try:
+            return self._enumerated_aliases
+        except AttributeError:
+            self._enumerated_aliases = []
+            return self._enumerated_aliases
 
     @enumerated_aliases.setter
     def enumerated_aliases(self, value: List[str]) -> None:
@@ -409,7 +448,8 @@ class StringMetadata(CommonVariableMetadata):
         equal: bool = (
             isinstance(other, StringMetadata)
             and super().equals(other)
-            and self._enumerated_values == other._enumerated_values
-            and self._enumerated_aliases == other._enumerated_aliases
+            and getattr(self, "_enumerated_values", []) == getattr(other, "_enumerated_values", [])
+            and getattr(self, "_enumerated_aliases", [])
+            == getattr(other, "_enumerated_aliases", [])
         )
         return equal
@@ -36,6 +36,12 @@ from .utils.locale_utils import LocaleUtils
 from .variable_type import VariableType
 from .variable_value import IVariableValue
 
+_interned_integers: Optional[Dict[int, IntegerValue]] = None
+"""Shared integer values, set while value interning is enabled."""
+
+_interned_strings: Optional[Dict[str, StringValue]] = None
+"""Shared string values, set while value interning is enabled."""
+
 
 class BooleanValue(IVariableValue):
     """
@@ -86,6 +92,27 @@ class BooleanValue(IVariableValue):
                 pass
             raise ValueError
 
+    def __new__(cls, source: object = None) -> BooleanValue:
+        """
+        Get the ``BooleanValue`` instance for a source value.
+
+        ``BooleanValue`` instances cannot be modified, so constructing one returns one of
+        two shared, frozen instances, one for ``True`` and one for ``False``. Use the
+        :meth:`thaw` method to get an instance that is not shared. Subclasses always get a
+        new instance.
+
+        Parameters
+        ----------
+        source : object
+            Source value. See the ``__init__`` method for the supported types.
+        """
+        value = BooleanValue._to_numpy_bool(source)
+        if cls is BooleanValue and _BOOLEAN_SINGLETONS:
+            return _BOOLEAN_SINGLETONS[bool(value)]
+        instance = super().__new__(cls)
+        instance.__value = value
+        return instance
+
     def __init__(self, source: object = None):
         """
         Construct a ``BooleanValue`` variable type from various source types.
@@ -102,15 +129,19 @@ class BooleanValue(IVariableValue):
 
             Any other option raises an exception.
         """
-        self.__value: np.bool_
+        # The value is set by __new__, which may return an already initialized instance.
+
+    @staticmethod
+    def _to_numpy_bool(source: object) -> np.bool_:
+        """Convert a source value to a NumPy Boolean per interchange specifications."""
         if source is None:
-            self.__value = np.False_
+            return np.False_
         elif isinstance(source, (bool, np.bool_)):
-            self.__value = np.bool_(source)
+            return np.bool_(source)
         elif isinstance(source, IVariableValue):
             from ansys.tools.variableinterop.scalar_value_conversion import to_boolean_value
 
-            self.__value = np.bool_(to_boolean_value(source))
+            return np.bool_(to_boolean_value(source))
         elif isinstance(
             source,
             (
@@ -127,9 +158,9 @@ class BooleanValue(IVariableValue):
                 np.ulonglong,
             ),
         ):
-            self.__value = np.bool_(source != 0)
+            return np.bool_(source != 0)
         elif isinstance(source, (float, np.half, np.float16, np.single, np.double, np.longdouble)):
-            self.__value = np.bool_(source != 0.0)
+            return np.bool_(source != 0.0)
         else:
             raise IncompatibleTypesException(type(source).__name__, VariableType.BOOLEAN)
 
@@ -254,6 +285,17 @@ class BooleanValue(IVariableValue):
     def accept(self, visitor: IVariableValueVisitor[T]) -> T:
         return visitor.visit_boolean(self)
 
+    @overrides
+    def _unfrozen_copy(self) -> BooleanValue:
+        # Bypass __new__, which would return the shared, frozen instance.
+        duplicate: BooleanValue = object.__new__(type(self))
+        duplicate.__value = self.__value
+        return duplicate
+
+    def __reduce__(self):
+        """Reduce to a constructor call so that copies reuse the shared instances."""
+        return type(self), (bool(self.__value),)
+
     @property  # type: ignore
     @overrides
     def variable_type(self) -> VariableType:
@@ -334,6 +376,13 @@ class BooleanValue(IVariableValue):
         return result
 
 
+_BOOLEAN_SINGLETONS: Dict[bool, BooleanValue] = {}
+"""Shared, frozen ``BooleanValue`` instances, keyed by their value."""
+_BOOLEAN_SINGLETONS.update(
+    {value: cast(BooleanValue, BooleanValue(value).freeze()) for value in (False, True)}
+)
+
+
 class IntegerValue(np.int64, IVariableValue):
     """
     Stores a value as an ``IntegerValue`` variable type.
@@ -367,6 +416,12 @@ class IntegerValue(np.int64, IVariableValue):
         arg : Any
             Argument to construct the instance from.
         """
+        # Read the table once, as interning may be disabled concurrently.
+        integers: Optional[Dict[int, IntegerValue]] = _interned_integers
+        if integers is not None and type(arg) in (int, np.int64) and cls is IntegerValue:
+            interned = integers.get(arg)
+            if interned is not None:
+                return interned
 
         if isinstance(arg, IVariableValue):
             # Constructing from an IVariableValue is handled specially.
@@ -392,6 +447,20 @@ class IntegerValue(np.int64, IVariableValue):
     def accept(self, visitor: IVariableValueVisitor[T]) -> T:
         return visitor.visit_integer(self)
 
+    @overrides
+    def _unfrozen_copy(self) -> IntegerValue:
+        return IntegerValue(self)
+
+    def __reduce__(self):
+        """Reduce to a constructor call, so that unpickling gives a ``IntegerValue``."""
+        return type(self), (int(self),), self.__dict__ or None
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the attributes saved by ``__reduce__``, such as whether it is frozen."""
+        if not self.is_frozen:
+            # Unpickling may give a shared, interned instance, which must not be modified.
+            self.__dict__.update(state)
+
     @property  # type: ignore
     @overrides
     def variable_type(self) -> VariableType:
@@ -512,6 +581,20 @@ class RealValue(np.float64, IVariableValue):
     def accept(self, visitor: IVariableValueVisitor[T]) -> T:
         return visitor.visit_real(self)
 
+    @overrides
+    def _unfrozen_copy(self) -> RealValue:
+        return RealValue(self)
+
+    def __reduce__(self):
+        """Reduce to a constructor call, so that unpickling gives a ``RealValue``."""
+        return type(self), (float(self),), self.__dict__ or None
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the attributes saved by ``__reduce__``, such as whether it is frozen."""
+        if not self.is_frozen:
+            # Unpickling may give a shared, interned instance, which must not be modified.
+            self.__dict__.update(state)
+
     @property  # type: ignore
     @overrides
     def variable_type(self) -> VariableType:
@@ -600,10 +683,46 @@ class StringValue(np.str_, IVariableValue):
     naturally to the analogous NumPy type.
     """
 
+    def __new__(cls, *args: Any, **kwargs: Any):
+        """
+        Create a new instance.
+
+        Takes the same arguments as ``numpy.str_``. If value interning is enabled and the
+        string was registered with ``intern_strings``, the shared, frozen instance is
+        returned instead.
+        """
+        # Read the table once, as interning may be disabled concurrently.
+        strings: Optional[Dict[str, StringValue]] = _interned_strings
+        if (
+            strings is not None
+            and len(args) == 1
+            and not kwargs
+            and type(args[0]) in (str, np.str_)
+            and cls is StringValue
+        ):
+            interned = strings.get(args[0])
+            if interned is not None:
+                return interned
+        return super().__new__(cls, *args, **kwargs)
+
     @overrides
     def accept(self, visitor: IVariableValueVisitor[T]) -> T:
         return visitor.visit_string(self)
 
+    @overrides
+    def _unfrozen_copy(self) -> StringValue:
+        return StringValue(self)
+
+    def __reduce__(self):
+        """Reduce to a constructor call, so that unpickling gives a ``StringValue``."""
+        return type(self), (str(self),), self.__dict__ or None
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the attributes saved by ``__reduce__``, such as whether it is frozen."""
+        if not self.is_frozen:
+            # Unpickling may give a shared, interned instance, which must not be modified.
+            self.__dict__.update(state)
+
     @property  # type: ignore
     @overrides
     def variable_type(self) -> VariableType:
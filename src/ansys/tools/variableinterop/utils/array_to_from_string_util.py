@@ -22,7 +22,7 @@
 """Defines the ``ArrayToFromStringUtil`` class."""
 from math import prod
 import re
-from typing import Any, Callable, List, Match, Optional, Tuple
+from typing import Any, Callable, List, Match, Optional, Pattern, Tuple
 
 import numpy as np
 from numpy.typing import NDArray
@@ -52,6 +52,16 @@ class ArrayToFromStringUtil:
     #
     _unquoted_value_regex: str = r'^\s*(?P<value>[^,"]*[^,"\s])\s*(?P<comma>,?)(?P<rest>.*)$'
 
+    # Compiled forms of the patterns above, shared by every parse.
+    _array_with_curly_braces_pattern: Pattern[str] = re.compile(
+        _array_with_curly_braces_regex, flags=re.IGNORECASE
+    )
+    _array_with_bounds_pattern: Pattern[str] = re.compile(
+        _array_with_bounds_regex, flags=re.IGNORECASE
+    )
+    _quoted_value_pattern: Pattern[str] = re.compile(_quoted_value_regex, flags=re.IGNORECASE)
+    _unquoted_value_pattern: Pattern[str] = re.compile(_unquoted_value_regex)
+
     @staticmethod
     def value_to_string(value: NDArray, stringify_action: Callable) -> str:
         """
@@ -112,9 +122,7 @@ class ArrayToFromStringUtil:
         value_str: str
 
         # check for bounds string
-        match: Optional[Match[str]] = re.search(
-            ArrayToFromStringUtil._array_with_bounds_regex, value, flags=re.IGNORECASE
-        )
+        match: Optional[Match[str]] = ArrayToFromStringUtil._array_with_bounds_pattern.search(value)
         if match is not None:  # There are bounds
             value_str = match.groupdict()["valueList"]
 
@@ -141,9 +149,7 @@ class ArrayToFromStringUtil:
             array = create_action(np.reshape(converted_list, lengths).tolist())
 
         else:  # No bounds
-            match = re.search(
-                ArrayToFromStringUtil._array_with_curly_braces_regex, value, flags=re.IGNORECASE
-            )
+            match = ArrayToFromStringUtil._array_with_curly_braces_pattern.search(value)
             if match is not None:
                 value_str = match.groupdict()["valueList"]
             else:
@@ -175,9 +181,7 @@ class ArrayToFromStringUtil:
         Optional[Match[str]]
             Regex match object or None if no match is found.
         """
-        match: Optional[Match[str]] = re.search(
-            ArrayToFromStringUtil._quoted_value_regex, value_str, flags=re.IGNORECASE
-        )
+        match: Optional[Match[str]] = ArrayToFromStringUtil._quoted_value_pattern.search(value_str)
         if match is None:
-            match = re.search(ArrayToFromStringUtil._unquoted_value_regex, value_str)
+            match = ArrayToFromStringUtil._unquoted_value_pattern.search(value_str)
         return match
@@ -0,0 +1,177 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides a cached service that detects the encoding and MIME type of files."""
+from __future__ import annotations
+
+import codecs
+from collections import OrderedDict
+import mimetypes
+import os
+from os import PathLike
+import threading
+from typing import Final, NamedTuple, Optional, Tuple, Union
+
+from anyio import to_thread
+
+
+class SniffedContent(NamedTuple):
+    """Describes what was detected about a file's contents."""
+
+    encoding: Optional[str]
+    """
+    Python codec that decodes the file, or ``None`` if it does not appear to be text.
+
+    Codecs detected from a byte order mark skip the mark when decoding.
+    """
+    bom_length: int
+    """Length of the byte order mark at the beginning of the file, or ``0`` if none."""
+    mime_type: str
+    """MIME type guessed from the file's extension or, failing that, its contents."""
+
+
+_BOMS: Final[Tuple[Tuple[bytes, str], ...]] = (
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+"""Byte order marks and the codecs that decode them, longest marks first."""
+
+
+class ContentSniffer:
+    """
+    Detects the encoding, byte order mark, and MIME type of files, caching the results.
+
+    Results are cached by path, modification time, and size, so a file is only read again
+    after it changes. Only the beginning of the file is read. The cache holds a bounded
+    number of entries and discards the least recently used ones first. Instances are safe
+    to use from several threads at once.
+    """
+
+    def __init__(self, max_entries: int = 4096, sample_size: int = 512):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Maximum number of results to cache. The default is ``4096``.
+        sample_size : int, optional
+            Number of bytes read from the beginning of each file. The default is ``512``.
+        """
+        self._max_entries: int = max_entries
+        self._sample_size: int = sample_size
+        self._entries: OrderedDict[Tuple[str, int, int], SniffedContent] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of cached results."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Discard all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def _examine(self, file_name: str) -> SniffedContent:
+        with open(file_name, "rb") as file:
+            sample: bytes = file.read(self._sample_size)
+        for bom, codec in _BOMS:
+            if sample.startswith(bom):
+                guessed: Optional[str] = mimetypes.guess_type(file_name)[0]
+                return SniffedContent(codec, len(bom), guessed or "text/plain")
+
+        is_utf8: bool = b"\x00" not in sample
+        if is_utf8:
+            try:
+                # The sample may end in the middle of a character.
+                codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+            except UnicodeDecodeError:
+                is_utf8 = False
+        mime_type: Optional[str] = mimetypes.guess_type(file_name)[0]
+        if mime_type is None:
+            mime_type = "text/plain" if is_utf8 else "application/octet-stream"
+        return SniffedContent("utf-8" if is_utf8 else None, 0, mime_type)
+
+    def sniff(self, file_name: Union[PathLike, str]) -> SniffedContent:
+        """
+        Detect the encoding, byte order mark, and MIME type of a file.
+
+        Parameters
+        ----------
+        file_name : Union[PathLike, str]
+            Path to the file.
+
+        Returns
+        -------
+        SniffedContent
+            What was detected about the file.
+
+        Raises
+        ------
+        OSError
+            If the file cannot be read.
+        """
+        name: str = os.fspath(file_name)
+        stat: os.stat_result = os.stat(name)
+        key: Tuple[str, int, int] = (name, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            result: Optional[SniffedContent] = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                return result
+        result = self._examine(name)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    async def sniff_async(self, file_name: Union[PathLike, str]) -> SniffedContent:
+        """
+        Detect the encoding, byte order mark, and MIME type of a file asynchronously.
+
+        The file system is accessed in a worker thread so that the event loop is not
+        blocked.
+
+        Parameters
+        ----------
+        file_name : Union[PathLike, str]
+            Path to the file.
+
+        Returns
+        -------
+        SniffedContent
+            What was detected about the file.
+
+        Raises
+        ------
+        OSError
+            If the file cannot be read.
+        """
+        return await to_thread.run_sync(self.sniff, file_name)
+
+
+DEFAULT_CONTENT_SNIFFER: Final[ContentSniffer] = ContentSniffer()
+"""Content sniffer shared by ``FileValue`` instances."""
@@ -0,0 +1,264 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides operating-system-accelerated strategies for copying file contents."""
+from __future__ import annotations
+
+from enum import Enum
+import errno
+import hashlib
+import os
+from os import PathLike
+import shutil
+from typing import BinaryIO, Callable, Dict, Final, Optional, Sequence, Tuple, Union
+from uuid import uuid4
+
+
+class FileCopyMethod(Enum):
+    """Provides an enumeration of the ways file contents can be copied."""
+
+    HARDLINK = 0
+    """
+    Create a hard link to the source instead of copying the data.
+
+    Hard links only work when the source and destination are on the same filesystem.
+    Because the destination shares its data with the source, modifying either file
+    modifies both. For this reason, this method is never used unless it is requested
+    explicitly.
+    """
+    COPY_FILE_RANGE = 1
+    """
+    Copy the data in the kernel with ``os.copy_file_range``.
+
+    On filesystems that support it, the kernel shares the data blocks between the
+    files (a reflink) instead of copying them.
+    """
+    SENDFILE = 2
+    """Copy the data in the kernel with ``os.sendfile``."""
+    STREAM = 3
+    """Copy the data in user space using a large buffer. This method works everywhere."""
+
+
+DEFAULT_COPY_METHODS: Final[Tuple[FileCopyMethod, ...]] = (
+    FileCopyMethod.COPY_FILE_RANGE,
+    FileCopyMethod.SENDFILE,
+    FileCopyMethod.STREAM,
+)
+"""Copy methods tried, in order, when none are specified."""
+
+_KERNEL_COPY_CHUNK: Final[int] = 1 << 30
+"""Maximum number of bytes requested from a single kernel copy call."""
+
+_STREAM_BUFFER_SIZE: Final[int] = 8 * 1024 * 1024
+"""Size of the buffer used by the ``STREAM`` copy method."""
+
+DEFAULT_DIGEST_ALGORITHM: Final[str] = "sha256"
+"""Hash algorithm used for content digests when none is specified."""
+
+
+def __copy_with_hardlink(source: Union[PathLike, str], destination: Union[PathLike, str]) -> None:
+    # Link under a temporary name first so that an existing destination is only
+    # replaced once the link is known to work.
+    destination = os.fspath(destination)
+    temp_name: str = os.path.join(
+        os.path.dirname(destination), f".{os.path.basename(destination)}.{uuid4().hex}.tmp"
+    )
+    os.link(source, temp_name)
+    try:
+        os.replace(temp_name, destination)
+    except OSError:
+        os.remove(temp_name)
+        raise
+
+
+def __copy_with_copy_file_range(
+    source: Union[PathLike, str], destination: Union[PathLike, str]
+) -> None:
+    if not hasattr(os, "copy_file_range"):
+        raise OSError(errno.ENOSYS, "copy_file_range is not supported on this platform.")
+    with open(source, "rb") as in_file, open(destination, "wb") as out_file:
+        while os.copy_file_range(in_file.fileno(), out_file.fileno(), _KERNEL_COPY_CHUNK) > 0:
+            pass
+
+
+def __copy_with_sendfile(source: Union[PathLike, str], destination: Union[PathLike, str]) -> None:
+    if not hasattr(os, "sendfile"):
+        raise OSError(errno.ENOSYS, "sendfile is not supported on this platform.")
+    with open(source, "rb") as in_file, open(destination, "wb") as out_file:
+        offset: int = 0
+        while True:
+            sent: int = os.sendfile(out_file.fileno(), in_file.fileno(), offset, _KERNEL_COPY_CHUNK)
+            if sent == 0:
+                break
+            offset += sent
+
+
+def __copy_with_stream(source: Union[PathLike, str], destination: Union[PathLike, str]) -> None:
+    with open(source, "rb") as in_file, open(destination, "wb") as out_file:
+        shutil.copyfileobj(in_file, out_file, _STREAM_BUFFER_SIZE)
+
+
+def __unlink_if_shares_source(
+    source: Union[PathLike, str], destination: Union[PathLike, str]
+) -> None:
+    # A destination that is a hard link to the source must be unlinked before it is
+    # reopened for writing. Otherwise, truncating it would also truncate the source.
+    try:
+        same_file: bool = os.path.samefile(source, destination)
+    except OSError:
+        return
+    if same_file:
+        if os.path.realpath(source) == os.path.realpath(destination):
+            raise shutil.SameFileError(f"{source!s} and {destination!s} are the same file.")
+        os.remove(destination)
+
+
+__copy_actions: Dict[
+    FileCopyMethod, Callable[[Union[PathLike, str], Union[PathLike, str]], None]
+] = {
+    FileCopyMethod.HARDLINK: __copy_with_hardlink,
+    FileCopyMethod.COPY_FILE_RANGE: __copy_with_copy_file_range,
+    FileCopyMethod.SENDFILE: __copy_with_sendfile,
+    FileCopyMethod.STREAM: __copy_with_stream,
+}
+"""Map of each copy method to the function that implements it."""
+
+
+def copy_file(
+    source: Union[PathLike, str],
+    destination: Union[PathLike, str],
+    methods: Optional[Sequence[FileCopyMethod]] = None,
+) -> FileCopyMethod:
+    """
+    Copy the contents of a file, using the fastest method that works.
+
+    Each method is tried in order. If a method fails, for example because the
+    platform or filesystem does not support it, the next method is tried. Any existing
+    destination file is overwritten.
+
+    Parameters
+    ----------
+    source : Union[PathLike, str]
+        Path to the file to copy.
+    destination : Union[PathLike, str]
+        Path to the file to create or overwrite.
+    methods : Optional[Sequence[FileCopyMethod]], optional
+        Methods to try, in order. The default is ``None``, in which case
+        ``DEFAULT_COPY_METHODS`` is used.
+
+    Returns
+    -------
+    FileCopyMethod
+        Method that copied the file.
+
+    Raises
+    ------
+    shutil.SameFileError
+        If the source and destination are the same file.
+    OSError
+        If no method could copy the file. The error raised by the last method tried
+        is raised.
+    """
+    if methods is None:
+        methods = DEFAULT_COPY_METHODS
+    if len(methods) == 0:
+        raise ValueError("At least one copy method must be specified.")
+
+    __unlink_if_shares_source(source, destination)
+    last_error: Optional[OSError] = None
+    for method in methods:
+        try:
+            __copy_actions[method](source, destination)
+            return method
+        except OSError as error:
+            last_error = error
+    raise last_error  # type: ignore
+
+
+def copy_stream_with_digest(
+    source: BinaryIO, destination: BinaryIO, hash_name: str = DEFAULT_DIGEST_ALGORITHM
+) -> Tuple[str, int]:
+    """
+    Copy the contents of a binary stream, computing their digest and size as they are copied.
+
+    Parameters
+    ----------
+    source : BinaryIO
+        Stream to read until its end.
+    destination : BinaryIO
+        Stream to write to.
+    hash_name : str, optional
+        Name of a hash algorithm supported by ``hashlib``. The default is ``"sha256"``.
+
+    Returns
+    -------
+    Tuple[str, int]
+        Digest of the contents in the form ``"<algorithm>:<hex digest>"`` and the number of
+        bytes copied.
+    """
+    hasher = hashlib.new(hash_name)
+    size: int = 0
+    buffer: bytearray = bytearray(_STREAM_BUFFER_SIZE)
+    view: memoryview = memoryview(buffer)
+    while True:
+        count: Optional[int] = source.readinto(view)  # type: ignore
+        if not count:
+            break
+        hasher.update(view[:count])
+        destination.write(view[:count])
+        size += count
+    return f"{hash_name}:{hasher.hexdigest()}", size
+
+
+def copy_file_with_digest(
+    source: Union[PathLike, str],
+    destination: Union[PathLike, str],
+    hash_name: str = DEFAULT_DIGEST_ALGORITHM,
+) -> Tuple[str, int]:
+    """
+    Copy the contents of a file, computing their digest and size in the same pass.
+
+    The contents are copied in user space so that each block is read only once. Any
+    existing destination file is overwritten.
+
+    Parameters
+    ----------
+    source : Union[PathLike, str]
+        Path to the file to copy.
+    destination : Union[PathLike, str]
+        Path to the file to create or overwrite.
+    hash_name : str, optional
+        Name of a hash algorithm supported by ``hashlib``. The default is ``"sha256"``.
+
+    Returns
+    -------
+    Tuple[str, int]
+        Digest of the contents in the form ``"<algorithm>:<hex digest>"`` and the number of
+        bytes copied.
+
+    Raises
+    ------
+    shutil.SameFileError
+        If the source and destination are the same file.
+    """
+    __unlink_if_shares_source(source, destination)
+    with open(source, "rb") as in_file, open(destination, "wb") as out_file:
+        return copy_stream_with_digest(in_file, out_file, hash_name)
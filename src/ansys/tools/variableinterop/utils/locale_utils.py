@@ -21,6 +21,7 @@
 # SOFTWARE.
 """Provides utilities for dealing with locales."""
 from configparser import ConfigParser
+import functools
 import locale
 import os
 from typing import Any, Callable
@@ -56,6 +57,14 @@ class LocaleUtils:
         return result
 
 
+@functools.lru_cache(maxsize=None)
+def _strings_parser() -> ConfigParser:
+    """Get the parser for ``strings.properties``, reading the file on first use only."""
+    parser = ConfigParser()
+    parser.read(os.path.join(os.path.dirname(__file__), "../strings.properties"))
+    return parser
+
+
 class Strings:
     """Provides utilities for obtaining string resources."""
 
@@ -78,6 +87,4 @@ class Strings:
         str
             Localized string.
         """
-        parser = ConfigParser()
-        parser.read(os.path.join(os.path.dirname(__file__), "../strings.properties"))
-        return parser.get(section, name).format(*args)
+        return _strings_parser().get(section, name).format(*args)
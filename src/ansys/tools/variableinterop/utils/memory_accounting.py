@@ -0,0 +1,175 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides estimates of the memory used by values, states and metadata."""
+from __future__ import annotations
+
+import functools
+import sys
+from typing import Any, Iterable, Optional, Set, Tuple
+
+import numpy as np
+
+
+def estimate_nbytes(
+    obj: Any, include_file_contents: bool = False, seen: Optional[Set[int]] = None
+) -> int:
+    """
+    Estimate the memory used by an object and the objects it holds.
+
+    Objects that define ``_estimate_nbytes(include_file_contents, seen)`` report their
+    own size. Arrays count their header and data buffer, and dictionaries and sequences
+    count themselves and their contents. Any other object counts only its own size, as
+    reported by ``sys.getsizeof``.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to estimate.
+    include_file_contents : bool, optional
+        Whether to count the size of the contents of file values, which are normally
+        stored on disk rather than in memory.
+    seen : Optional[Set[int]], optional
+        IDs of the objects already counted, which are not counted again. The default
+        is ``None``, which counts every object reachable from ``obj`` once.
+
+    Returns
+    -------
+    int
+        Estimated size, in bytes.
+    """
+    if seen is None:
+        seen = set()
+    key = id(obj)
+    if key in seen:
+        return 0
+    seen.add(key)
+
+    estimate = getattr(type(obj), "_estimate_nbytes", None)
+    if estimate is not None:
+        return estimate(obj, include_file_contents, seen)
+    if isinstance(obj, np.ndarray):
+        return array_nbytes(obj, include_file_contents, seen)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            estimate_nbytes(k, include_file_contents, seen)
+            + estimate_nbytes(v, include_file_contents, seen)
+            for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(
+            estimate_nbytes(item, include_file_contents, seen) for item in obj
+        )
+    return sys.getsizeof(obj)
+
+
+def estimate_total_nbytes(items: Iterable[Any], include_file_contents: bool = False) -> int:
+    """
+    Estimate the memory used by a collection of objects.
+
+    Objects shared among the items, such as frozen values held by many states, are
+    counted once.
+
+    Parameters
+    ----------
+    items : Iterable[Any]
+        Values, states, metadata or other objects to estimate.
+    include_file_contents : bool, optional
+        Whether to count the size of the contents of file values.
+
+    Returns
+    -------
+    int
+        Estimated total size, in bytes.
+    """
+    seen: Set[int] = set()
+    return sum(estimate_nbytes(item, include_file_contents, seen) for item in items)
+
+
+def instance_nbytes(obj: Any, include_file_contents: bool, seen: Set[int]) -> int:
+    """
+    Estimate the memory used by an object and its instance attributes.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to estimate.
+    include_file_contents : bool
+        Whether to count the size of the contents of file values.
+    seen : Set[int]
+        IDs of the objects already counted.
+
+    Returns
+    -------
+    int
+        Estimated size, in bytes.
+    """
+    size = sys.getsizeof(obj)
+    attributes = getattr(obj, "__dict__", None)
+    if attributes:
+        size += estimate_nbytes(attributes, include_file_contents, seen)
+    # getsizeof already counts the slots themselves, but not the objects they refer to.
+    for name in _slot_names(type(obj)):
+        value = getattr(obj, name, None)
+        if value is not None:
+            size += estimate_nbytes(value, include_file_contents, seen)
+    return size
+
+
+@functools.lru_cache(maxsize=None)
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """Get the attribute names of the slots declared by a class and its bases."""
+    names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if slot in ("__dict__", "__weakref__"):
+                continue
+            if slot.startswith("__") and not slot.endswith("__"):
+                slot = f"_{klass.__name__.lstrip('_')}{slot}"
+            names.append(slot)
+    return tuple(names)
+
+
+def array_nbytes(array: np.ndarray, include_file_contents: bool, seen: Set[int]) -> int:
+    """
+    Estimate the memory used by an array, its data buffer and any objects it holds.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        Array to estimate.
+    include_file_contents : bool
+        Whether to count the size of the contents of file values.
+    seen : Set[int]
+        IDs of the objects already counted.
+
+    Returns
+    -------
+    int
+        Estimated size, in bytes.
+    """
+    # getsizeof counts the buffer only for arrays that own it, and most values are
+    # views of the array they were built from.
+    size = sys.getsizeof(array) + (0 if array.flags.owndata else array.nbytes)
+    if array.dtype == object:
+        size += sum(estimate_nbytes(item, include_file_contents, seen) for item in array.flat)
+    return size
@@ -0,0 +1,153 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Provides opt-in interning of frequently repeated scalar values.
+
+``BooleanValue`` instances are always shared: constructing one returns one of two frozen
+instances. Interning extends this to integers in a small range and to registered strings,
+such as the enumerated values of ``StringMetadata``. While interning is enabled,
+constructing an ``IntegerValue`` from an ``int`` in the range, or a ``StringValue`` from a
+registered ``str``, returns a shared, frozen instance instead of allocating a new one.
+
+Interning is off by default because it changes the identity of constructed values and
+makes them frozen, so :meth:`IVariableValue.thaw` must be used before modifying one.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Dict, Iterable, Optional, TypeVar, cast
+
+from . import scalar_values
+from .scalar_values import BooleanValue, IntegerValue, StringValue
+from .variable_value import IVariableValue
+
+DEFAULT_INTEGER_RANGE: range = range(-5, 257)
+"""Integers shared by default while interning is enabled."""
+
+DEFAULT_MAX_STRINGS: int = 4096
+"""Maximum number of strings shared by default while interning is enabled."""
+
+V = TypeVar("V", bound=IVariableValue)
+
+_lock = threading.Lock()
+_max_strings: int = 0
+
+
+def enable_interning(
+    integers: range = DEFAULT_INTEGER_RANGE, max_strings: int = DEFAULT_MAX_STRINGS
+) -> None:
+    """
+    Start sharing instances of frequently repeated integer and string values.
+
+    If interning is already enabled, its settings are replaced. Registered strings are
+    kept, up to the new maximum.
+
+    Parameters
+    ----------
+    integers : range, optional
+        Integers to share.
+    max_strings : int, optional
+        Maximum number of registered strings to share. Once it is reached, registering
+        another string stops the oldest registered string from being shared.
+    """
+    global _max_strings
+    with _lock:
+        _max_strings = max(max_strings, 0)
+        registered = list((scalar_values._interned_strings or {}).items())
+        scalar_values._interned_strings = dict(registered[max(len(registered) - _max_strings, 0) :])
+        scalar_values._interned_integers = {
+            i: cast(IntegerValue, IntegerValue(i).freeze()) for i in integers
+        }
+
+
+def disable_interning() -> None:
+    """Stop sharing integer and string values and forget the registered strings."""
+    with _lock:
+        scalar_values._interned_integers = None
+        scalar_values._interned_strings = None
+
+
+def interning_enabled() -> bool:
+    """
+    Determine whether interning is enabled.
+
+    Returns
+    -------
+    bool
+        ``True`` if integer and string values are being shared, ``False`` otherwise.
+    """
+    return scalar_values._interned_integers is not None
+
+
+def intern_strings(values: Iterable[str]) -> None:
+    """
+    Register strings whose ``StringValue`` instances should be shared.
+
+    This method does nothing if interning is not enabled. Setting the enumerated values
+    of a ``StringMetadata`` instance registers them.
+
+    Parameters
+    ----------
+    values : Iterable[str]
+        Strings to register.
+    """
+    if scalar_values._interned_strings is None:
+        return
+    with _lock:
+        strings = scalar_values._interned_strings
+        if strings is None or _max_strings == 0:
+            return
+        for value in values:
+            key = str(value)
+            if key in strings:
+                continue
+            while len(strings) >= _max_strings:
+                del strings[next(iter(strings))]
+            strings[key] = cast(StringValue, StringValue(key).freeze())
+
+
+def intern_value(value: V) -> V:
+    """
+    Get the shared instance equal to a value, if there is one.
+
+    Parameters
+    ----------
+    value : V
+        Value to look up.
+
+    Returns
+    -------
+    V
+        Shared, frozen instance equal to ``value`` if ``value`` is a ``BooleanValue``, or
+        an interned ``IntegerValue`` or ``StringValue``. Otherwise, ``value`` itself.
+    """
+    shared: Optional[IVariableValue] = None
+    value_type = type(value)
+    if value_type is BooleanValue:
+        shared = BooleanValue(bool(value))
+    elif value_type is IntegerValue:
+        integers: Optional[Dict[int, IntegerValue]] = scalar_values._interned_integers
+        shared = None if integers is None else integers.get(int(value))
+    elif value_type is StringValue:
+        strings: Optional[Dict[str, StringValue]] = scalar_values._interned_strings
+        shared = None if strings is None else strings.get(str(value))
+    return value if shared is None else cast(V, shared)
@@ -22,13 +22,18 @@
 """Defines the ``VariableState`` class."""
 from __future__ import annotations
 
+from typing import Set
+
 from .utils.implicit_coercion import implicit_coerce
+from .utils.memory_accounting import estimate_nbytes, instance_nbytes
 from .variable_value import IVariableValue, VariableValueInvalidError
 
 
 class VariableState:
     """Bundles a variable value with a validity flag."""
 
+    __slots__ = ("__value", "__is_valid")
+
     @implicit_coerce
     def __init__(self, value: IVariableValue, is_valid: bool):
         """
@@ -90,15 +95,91 @@ class VariableState:
         else:
             raise VariableValueInvalidError()
 
+    @property
+    def is_frozen(self) -> bool:
+        """
+        Flag indicating whether this state is frozen.
+
+        A state is frozen when its value is frozen. ``True`` indicates that the state is
+        frozen.
+        """
+        return self.__value.is_frozen
+
+    def freeze(self) -> VariableState:
+        """
+        Make this state read-only by freezing its value.
+
+        Cloning a frozen state returns the same instance instead of copying it.
+
+        Returns
+        -------
+        VariableState
+            This instance, for chaining.
+        """
+        self.__value = self.__value.freeze()
+        return self
+
+    def thaw(self) -> VariableState:
+        """
+        Get a modifiable version of this state.
+
+        Returns
+        -------
+        VariableState
+            This instance if it is not frozen, otherwise a new instance containing a
+            modifiable copy of this instance's value.
+        """
+        if not self.is_frozen:
+            return self
+        return VariableState(self.__value.thaw(), self.__is_valid)
+
     def clone(self) -> VariableState:
         """
         Clone the instance.
 
-        The returned instance contains a clone of this instance's value.
+        The returned instance contains a clone of this instance's value. If this
+        instance is frozen, it is returned instead since it cannot be modified.
 
         Returns
         -------
         VariableState
             Deep copy of the instance.
         """
+        if self.is_frozen:
+            return self
         return VariableState(self.__value.clone(), self.__is_valid)
+
+    def estimated_nbytes(self, include_file_contents: bool = False) -> int:
+        """
+        Estimate the memory used by this state.
+
+        Parameters
+        ----------
+        include_file_contents : bool, optional
+            Whether to count the size of the contents of file values, which are normally
+            stored on disk rather than in memory.
+
+        Returns
+        -------
+        int
+            Estimated size, in bytes.
+        """
+        return estimate_nbytes(self, include_file_contents)
+
+    def _estimate_nbytes(self, include_file_contents: bool, seen: Set[int]) -> int:
+        """
+        Estimate the memory used by this state, not counting objects already counted.
+
+        Parameters
+        ----------
+        include_file_contents : bool
+            Whether to count the size of the contents of file values.
+        seen : Set[int]
+            IDs of the objects already counted.
+
+        Returns
+        -------
+        int
+            Estimated size, in bytes.
+        """
+        return instance_nbytes(self, include_file_contents, seen)
@@ -23,10 +23,13 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any, Dict, Iterable, Union
+from typing import TYPE_CHECKING, Dict
 
 from .utils.locale_utils import Strings
-from .variable_value import IVariableValue
+
+if TYPE_CHECKING:
+    from .common_variable_metadata import CommonVariableMetadata
+    from .variable_value import IVariableValue
 
 
 class VariableType(Enum):
@@ -91,30 +94,34 @@ class VariableType(Enum):
     @property
     def associated_type_name(self) -> str:
         """Get the name of the associated ``IVariableValue`` type."""
-        from .array_values import (
-            BooleanArrayValue,
-            IntegerArrayValue,
-            RealArrayValue,
-            StringArrayValue,
-        )
-        from .file_array_value import FileArrayValue
-        from .file_value import FileValue
-        from .scalar_values import BooleanValue, IntegerValue, RealValue, StringValue
-
-        class_map: Dict[VariableType, str] = {
-            VariableType.UNKNOWN: "unknown",
-            VariableType.STRING: StringValue.__name__,
-            VariableType.REAL: RealValue.__name__,
-            VariableType.INTEGER: IntegerValue.__name__,
-            VariableType.BOOLEAN: BooleanValue.__name__,
-            VariableType.FILE: FileValue.__name__,
-            VariableType.STRING_ARRAY: StringArrayValue.__name__,
-            VariableType.REAL_ARRAY: RealArrayValue.__name__,
-            VariableType.INTEGER_ARRAY: IntegerArrayValue.__name__,
-            VariableType.BOOLEAN_ARRAY: BooleanArrayValue.__name__,
-            VariableType.FILE_ARRAY: FileArrayValue.__name__,
-        }
-        return class_map[self]
+        names = _ASSOCIATED_TYPE_NAMES
+        if not names:
+            from .array_values import (
+                BooleanArrayValue,
+                IntegerArrayValue,
+                RealArrayValue,
+                StringArrayValue,
+            )
+            from .file_array_value import FileArrayValue
+            from .file_value import FileValue
+            from .scalar_values import BooleanValue, IntegerValue, RealValue, StringValue
+
+            names.update(
+                {
+                    VariableType.UNKNOWN: "unknown",
+                    VariableType.STRING: StringValue.__name__,
+                    VariableType.REAL: RealValue.__name__,
+                    VariableType.INTEGER: IntegerValue.__name__,
+                    VariableType.BOOLEAN: BooleanValue.__name__,
+                    VariableType.FILE: FileValue.__name__,
+                    VariableType.STRING_ARRAY: StringArrayValue.__name__,
+                    VariableType.REAL_ARRAY: RealArrayValue.__name__,
+                    VariableType.INTEGER_ARRAY: IntegerArrayValue.__name__,
+                    VariableType.BOOLEAN_ARRAY: BooleanArrayValue.__name__,
+                    VariableType.FILE_ARRAY: FileArrayValue.__name__,
+                }
+            )
+        return names[self]
 
     @staticmethod
     def from_string(s: str) -> VariableType:
@@ -131,42 +138,7 @@ class VariableType(Enum):
         VariableType
             Result.
         """
-
-        class __IterableKeyDict(Dict[Union[Iterable, str], Any]):
-            """Provides a dictionary that can initialize with iterable keys and give
-            each value its own entry."""
-
-            def __init__(self, d_: Dict[Union[Iterable, str], VariableType]):
-                def __br():
-                    """Break down initializer dictionary to tuple subkeys."""
-                    for k, v in d_.items():
-                        if isinstance(k, str):
-                            yield k, v
-                        else:
-                            for subkey in k:
-                                yield subkey, v
-
-                super().__init__(__br())
-
-        __valtype_strings: Dict[Union[Iterable, str], VariableType] = __IterableKeyDict(
-            {
-                ("int", "integer", "long"): VariableType.INTEGER,
-                ("real", "double", "float"): VariableType.REAL,
-                ("bool", "boolean"): VariableType.BOOLEAN,
-                ("str", "string"): VariableType.STRING,
-                "file": VariableType.FILE,
-                ("int[]", "integer[]", "long[]"): VariableType.INTEGER_ARRAY,
-                ("real[]", "double[]", "float[]"): VariableType.REAL_ARRAY,
-                ("bool[]", "boolean[]"): VariableType.BOOLEAN_ARRAY,
-                ("str[]", "string[]"): VariableType.STRING_ARRAY,
-                "file[]": VariableType.FILE_ARRAY,
-            }
-        )
-
-        try:
-            return __valtype_strings[s.strip().lower()]
-        except KeyError:
-            return VariableType.UNKNOWN
+        return _TYPE_NAME_ALIASES.get(s.strip().lower(), VariableType.UNKNOWN)
 
     def to_display_string(self) -> str:
         """
@@ -177,21 +149,12 @@ class VariableType(Enum):
         str
             Display string.
         """
-        __valtype_display_string: Dict[VariableType, str] = {
-            VariableType.REAL: "DISPLAY_STRING_REAL",
-            VariableType.INTEGER: "DISPLAY_STRING_INTEGER",
-            VariableType.BOOLEAN: "DISPLAY_STRING_BOOL",
-            VariableType.STRING: "DISPLAY_STRING_STRING",
-            VariableType.FILE: "DISPLAY_STRING_FILE",
-            VariableType.REAL_ARRAY: "DISPLAY_STRING_REAL_ARRAY",
-            VariableType.INTEGER_ARRAY: "DISPLAY_STRING_INTEGER_ARRAY",
-            VariableType.BOOLEAN_ARRAY: "DISPLAY_STRING_BOOL_ARRAY",
-            VariableType.STRING_ARRAY: "DISPLAY_STRING_STRING_ARRAY",
-            VariableType.FILE_ARRAY: "DISPLAY_STRING_FILE_ARRAY",
-            VariableType.UNKNOWN: "DISPLAY_STRING_UNKNOWN",
-        }
-
-        return Strings.get("DisplayStrings", __valtype_display_string[self])
+        try:
+            return _DISPLAY_STRINGS[self]
+        except KeyError:
+            display_string = Strings.get("DisplayStrings", _DISPLAY_STRING_KEYS[self])
+            _DISPLAY_STRINGS[self] = display_string
+            return display_string
 
     def get_default_value(self) -> IVariableValue:
         """
@@ -202,57 +165,10 @@ class VariableType(Enum):
         IVariableValue
             New value object whose type matches this type.
         """
-        from .array_values import (
-            BooleanArrayValue,
-            IntegerArrayValue,
-            RealArrayValue,
-            StringArrayValue,
-        )
-        from .file_array_value import FileArrayValue
-        from .file_value import EMPTY_FILE
-        from .ivariable_type_pseudovisitor import IVariableTypePseudoVisitor, vartype_accept
-        from .scalar_values import BooleanValue, IntegerValue, RealValue, StringValue
-
-        class __DefaultValueVisitor(IVariableTypePseudoVisitor[IVariableValue]):
-            """Provides the visitor that returns a default value for each type."""
-
-            def visit_unknown(self) -> IVariableValue:
-                raise TypeError
-
-            def visit_int(self) -> IVariableValue:
-                return IntegerValue(0)
-
-            def visit_real(self) -> IVariableValue:
-                return RealValue()
-
-            def visit_boolean(self) -> IVariableValue:
-                return BooleanValue()
-
-            def visit_string(self) -> IVariableValue:
-                return StringValue()
-
-            def visit_file(self) -> IVariableValue:
-                return EMPTY_FILE
-
-            def visit_int_array(self) -> IVariableValue:
-                return IntegerArrayValue()
-
-            def visit_real_array(self) -> IVariableValue:
-                return RealArrayValue()
-
-            def visit_bool_array(self) -> IVariableValue:
-                return BooleanArrayValue()
+        from .default_value_visitors import TYPE_DEFAULT_VALUE_VISITOR
+        from .ivariable_type_pseudovisitor import vartype_accept
 
-            def visit_string_array(self) -> IVariableValue:
-                return StringArrayValue()
-
-            def visit_file_array(self) -> IVariableValue:
-                return FileArrayValue()
-
-        visitor = __DefaultValueVisitor()
-        return vartype_accept(visitor, self)
-
-    from .common_variable_metadata import CommonVariableMetadata
+        return vartype_accept(TYPE_DEFAULT_VALUE_VISITOR, self)
 
     def construct_variable_metadata(self) -> CommonVariableMetadata:
         """
@@ -263,53 +179,51 @@ class VariableType(Enum):
         CommonVariableMetadata
             New metadata object whose type matches this type.
         """
-        from .array_metadata import (
-            BooleanArrayMetadata,
-            IntegerArrayMetadata,
-            RealArrayMetadata,
-            StringArrayMetadata,
-        )
-        from .common_variable_metadata import CommonVariableMetadata
-        from .file_array_metadata import FileArrayMetadata
-        from .file_metadata import FileMetadata
-        from .ivariable_type_pseudovisitor import IVariableTypePseudoVisitor, vartype_accept
-        from .scalar_metadata import BooleanMetadata, IntegerMetadata, RealMetadata, StringMetadata
-
-        class __DefaultMetadataVisitor(IVariableTypePseudoVisitor[CommonVariableMetadata]):
-            """Provides the visitor that returns a default metadata for each type."""
-
-            def visit_unknown(self) -> CommonVariableMetadata:
-                raise TypeError
-
-            def visit_int(self) -> CommonVariableMetadata:
-                return IntegerMetadata()
-
-            def visit_real(self) -> CommonVariableMetadata:
-                return RealMetadata()
-
-            def visit_boolean(self) -> CommonVariableMetadata:
-                return BooleanMetadata()
-
-            def visit_string(self) -> CommonVariableMetadata:
-                return StringMetadata()
-
-            def visit_file(self) -> CommonVariableMetadata:
-                return FileMetadata()
-
-            def visit_int_array(self) -> CommonVariableMetadata:
-                return IntegerArrayMetadata()
-
-            def visit_real_array(self) -> CommonVariableMetadata:
-                return RealArrayMetadata()
-
-            def visit_bool_array(self) -> CommonVariableMetadata:
-                return BooleanArrayMetadata()
-
-            def visit_string_array(self) -> CommonVariableMetadata:
-                return StringArrayMetadata()
-
-            def visit_file_array(self) -> CommonVariableMetadata:
-                return FileArrayMetadata()
-
-        visitor = __DefaultMetadataVisitor()
-        return vartype_accept(visitor, self)
+        from .default_value_visitors import TYPE_DEFAULT_METADATA_VISITOR
+        from .ivariable_type_pseudovisitor import vartype_accept
+
+        return vartype_accept(TYPE_DEFAULT_METADATA_VISITOR, self)
+
+
+_TYPE_NAME_ALIASES: Dict[str, VariableType] = {
+    alias: var_type
+    for aliases, var_type in (
+        (("int", "integer", "long"), VariableType.INTEGER),
+        (("real", "double", "float"), VariableType.REAL),
+        (("bool", "boolean"), VariableType.BOOLEAN),
+        (("str", "string"), VariableType.STRING),
+        (("file",), VariableType.FILE),
+        (("int[]", "integer[]", "long[]"), VariableType.INTEGER_ARRAY),
+        (("real[]", "double[]", "float[]"), VariableType.REAL_ARRAY),
+        (("bool[]", "boolean[]"), VariableType.BOOLEAN_ARRAY),
+        (("str[]", "string[]"), VariableType.STRING_ARRAY),
+        (("file[]",), VariableType.FILE_ARRAY),
+    )
+    for alias in aliases
+}
+"""Lowercase type names accepted by ``VariableType.from_string``."""
+
+_DISPLAY_STRING_KEYS: Dict[VariableType, str] = {
+    VariableType.REAL: "DISPLAY_STRING_REAL",
+    VariableType.INTEGER: "DISPLAY_STRING_INTEGER",
+    VariableType.BOOLEAN: "DISPLAY_STRING_BOOL",
+    VariableType.STRING: "DISPLAY_STRING_STRING",
+    VariableType.FILE: "DISPLAY_STRING_FILE",
+    VariableType.REAL_ARRAY: "DISPLAY_STRING_REAL_ARRAY",
+    VariableType.INTEGER_ARRAY: "DISPLAY_STRING_INTEGER_ARRAY",
+    VariableType.BOOLEAN_ARRAY: "DISPLAY_STRING_BOOL_ARRAY",
+    VariableType.STRING_ARRAY: "DISPLAY_STRING_STRING_ARRAY",
+    VariableType.FILE_ARRAY: "DISPLAY_STRING_FILE_ARRAY",
+    VariableType.UNKNOWN: "DISPLAY_STRING_UNKNOWN",
+}
+"""Keys of the ``DisplayStrings`` resources for each type."""
+
+_DISPLAY_STRINGS: Dict[VariableType, str] = {}
+"""Display strings already resolved from ``strings.properties``."""
+
+_ASSOCIATED_TYPE_NAMES: Dict[VariableType, str] = {}
+"""
+Names of the ``IVariableValue`` type associated with each type.
+
+Filled on first use, since the value modules cannot be imported before this one.
+"""
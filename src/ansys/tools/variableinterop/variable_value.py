@@ -24,14 +24,17 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import copy
-from typing import Generic, Optional, Tuple, TypeVar
+import sys
+from typing import Generic, Optional, Set, Tuple, TypeVar
 
 from numpy.typing import NDArray
+from overrides import overrides
 
 import ansys.tools.variableinterop.variable_type as variable_type_lib
 
 from .isave_context import ISaveContext
 from .ivariable_visitor import IVariableValueVisitor
+from .utils.memory_accounting import array_nbytes, estimate_nbytes, instance_nbytes
 
 T = TypeVar("T")
 
@@ -39,9 +42,118 @@ T = TypeVar("T")
 class IVariableValue(ABC):
     """Defines an interface for the behavior common among all variable types."""
 
+    __slots__ = ()
+
     def clone(self) -> IVariableValue:
-        """Get a deep copy of this value."""
-        return copy.deepcopy(self)
+        """
+        Get a deep copy of this value.
+
+        Frozen values cannot be modified, so cloning a frozen value returns the same
+        instance instead of a copy.
+        """
+        if self.is_frozen:
+            return self
+        return self._unfrozen_copy()
+
+    @property
+    def is_frozen(self) -> bool:
+        """
+        Flag indicating whether this value is frozen.
+
+        Returns
+        -------
+        bool
+            ``True`` if the value has been frozen with the :meth:`freeze` method,
+            ``False`` otherwise.
+        """
+        return getattr(self, "_frozen", False)
+
+    def freeze(self) -> IVariableValue:
+        """
+        Make this value read-only.
+
+        A frozen value can be shared safely, so the :meth:`clone` method returns the
+        value itself instead of copying it. To get a modifiable value again, use the
+        :meth:`thaw` method. Freezing a value that is already frozen, such as a shared
+        ``BooleanValue`` or interned value, leaves it untouched.
+
+        Returns
+        -------
+        IVariableValue
+            Frozen value. This is the value itself, except for an array that views
+            another array, which is copied.
+        """
+        if not self.is_frozen:
+            self._frozen = True
+        return self
+
+    def thaw(self) -> IVariableValue:
+        """
+        Get a modifiable version of this value.
+
+        Frozen values may be shared by many owners, so they are never modified in place.
+        Instead, a frozen value is copied and the unfrozen copy is returned. A value that
+        is not frozen is returned as is.
+
+        Returns
+        -------
+        IVariableValue
+            Value that is not frozen.
+        """
+        if not self.is_frozen:
+            return self
+        return self._unfrozen_copy()
+
+    def _unfrozen_copy(self) -> IVariableValue:
+        """
+        Get a deep copy of this value that is not frozen.
+
+        Returns
+        -------
+        IVariableValue
+            New copy of this value.
+        """
+        duplicate: IVariableValue = copy.deepcopy(self)
+        try:
+            del duplicate._frozen
+        except AttributeError:
+            pass
+        return duplicate
+
+    def estimated_nbytes(self, include_file_contents: bool = False) -> int:
+        """
+        Estimate the memory used by this value.
+
+        Parameters
+        ----------
+        include_file_contents : bool, optional
+            Whether to count the size of the contents of file values, which are normally
+            stored on disk rather than in memory.
+
+        Returns
+        -------
+        int
+            Estimated size, in bytes.
+        """
+        return estimate_nbytes(self, include_file_contents)
+
+    def _estimate_nbytes(self, include_file_contents: bool, seen: Set[int]) -> int:
+        """
+        Estimate the memory used by this value, not counting objects already counted.
+
+        Parameters
+        ----------
+        include_file_contents : bool
+            Whether to count the size of the contents of file values.
+        seen : Set[int]
+            IDs of the objects already counted.
+
+        Returns
+        -------
+        int
+            Estimated size, in bytes.
+        """
+        return instance_nbytes(self, include_file_contents, seen)
 
     @abstractmethod
     def accept(self, visitor: IVariableValueVisitor[T]) -> T:
@@ -111,6 +223,35 @@ class CommonArrayValue(Generic[T], NDArray[T], IVariableValue, ABC):
     This class inherits the ``IVariableValue`` class.
     """
 
+    @property  # type: ignore
+    @overrides
+    def is_frozen(self) -> bool:
+        return not self.flags.writeable
+
+    @overrides
+    def freeze(self) -> CommonArrayValue[T]:
+        if not self.flags.writeable:
+            return self
+        base = self.base
+        if base is not None:
+            # Arrays are usually created as views of a buffer that nothing else refers
+            # to: the reference from this array, the local variable and the argument of
+            # getrefcount. Lock such a buffer along with this array. The data of any
+            # other base could still change through it, so freeze a copy instead.
+            if (
+                base.base is not None
+                or isinstance(base, CommonArrayValue)
+                or sys.getrefcount(base) > 3
+            ):
+                return self._unfrozen_copy().freeze()
+            base.flags.writeable = False
+        self.flags.writeable = False
+        return self
+
+    @overrides
+    def _estimate_nbytes(self, include_file_contents: bool, seen: Set[int]) -> int:
+        return array_nbytes(self, include_file_contents, seen)
+
     def get_lengths(self) -> Tuple[int]:
         """
         Get the dimension sizes of the array.
@@ -0,0 +1,238 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides a class-keyed dispatcher for applying value visitors to many values."""
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+import weakref
+
+from .array_values import BooleanArrayValue, IntegerArrayValue, RealArrayValue, StringArrayValue
+from .file_array_value import FileArrayValue
+from .file_value import FileValue
+from .ivariable_visitor import IVariableValueVisitor
+from .scalar_values import BooleanValue, IntegerValue, RealValue, StringValue
+from .variable_value import IVariableValue
+
+T = TypeVar("T")
+
+_VISIT_METHOD_NAMES: Tuple[Tuple[type, str], ...] = (
+    (IntegerValue, "visit_integer"),
+    (RealValue, "visit_real"),
+    (BooleanValue, "visit_boolean"),
+    (StringValue, "visit_string"),
+    (FileValue, "visit_file"),
+    (IntegerArrayValue, "visit_integer_array"),
+    (RealArrayValue, "visit_real_array"),
+    (BooleanArrayValue, "visit_boolean_array"),
+    (StringArrayValue, "visit_string_array"),
+    (FileArrayValue, "visit_file_array"),
+)
+"""Value classes paired with the visitor method their ``accept`` implementation calls."""
+
+
+def _visit_method_name(value_type: type) -> Optional[str]:
+    """
+    Get the visitor method that ``accept`` calls for a value class.
+
+    Parameters
+    ----------
+    value_type : type
+        Concrete value class.
+
+    Returns
+    -------
+    Optional[str]
+        Name of the visitor method, or ``None`` if the class is not one of the library's
+        value classes or overrides their ``accept`` method, in which case the visitor
+        must be applied through ``accept``.
+    """
+    for base, method_name in _VISIT_METHOD_NAMES:
+        if issubclass(value_type, base):
+            if value_type.accept is base.accept:
+                return method_name
+            return None
+    return None
+
+
+_VisitFunction = Callable[[IVariableValueVisitor, IVariableValue], T]
+"""Unbound function that applies a visitor to a value."""
+
+_method_tables: weakref.WeakKeyDictionary[type, Dict[type, _VisitFunction]] = (
+    weakref.WeakKeyDictionary()
+)
+"""Functions that visit each value class, for each visitor class."""
+_method_tables_lock = threading.Lock()
+
+
+def _accept(visitor: IVariableValueVisitor[T], value: IVariableValue) -> T:
+    """Apply a visitor to a value through the value's ``accept`` method."""
+    return value.accept(visitor)
+
+
+def _method_table(visitor_type: type) -> Dict[type, _VisitFunction]:
+    """
+    Get the table of functions that visit each value class for a visitor class.
+
+    The table holds unbound functions, so it never keeps a visitor instance alive.
+
+    Parameters
+    ----------
+    visitor_type : type
+        Visitor class.
+
+    Returns
+    -------
+    Dict[type, Callable[[IVariableValueVisitor, IVariableValue], T]]
+        Table shared by all dispatchers for visitors of the class. It is filled in as
+        value classes are encountered.
+    """
+    table = _method_tables.get(visitor_type)
+    if table is None:
+        with _method_tables_lock:
+            table = _method_tables.setdefault(visitor_type, {})
+    return table
+
+
+class TypeDispatcher(Generic[T]):
+    """
+    Applies a value visitor by looking up the visitor method for each value's class.
+
+    Calling ``value.accept(visitor)`` costs a call into the value and another into the
+    visitor for every value. A dispatcher resolves the ``visit_*`` method of the visitor's
+    class for each concrete value class once, then calls it directly, so visiting a value
+    costs a single dictionary lookup and call. The resolved methods are shared by all
+    dispatchers for visitors of the same class.
+
+    Dispatchers are safe to use from multiple threads.
+    """
+
+    def __init__(self, visitor: IVariableValueVisitor[T]):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        visitor : IVariableValueVisitor[T]
+            Visitor to apply to values.
+        """
+        self._visitor: IVariableValueVisitor[T] = visitor
+        self._methods: Dict[type, _VisitFunction] = _method_table(type(visitor))
+
+    @property
+    def visitor(self) -> IVariableValueVisitor[T]:
+        """Visitor applied by this dispatcher."""
+        return self._visitor
+
+    def _resolve(self, value_type: type) -> _VisitFunction:
+        """
+        Find and remember the function that visits values of a class.
+
+        Parameters
+        ----------
+        value_type : type
+            Concrete value class.
+
+        Returns
+        -------
+        Callable[[IVariableValueVisitor, IVariableValue], T]
+            Function that applies a visitor of this dispatcher's visitor class to a value of
+            the class.
+        """
+        method_name = _visit_method_name(value_type)
+        method: _VisitFunction
+        if method_name is None:
+            method = _accept
+        else:
+            method = getattr(type(self._visitor), method_name)
+        self._methods[value_type] = method
+        return method
+
+    def __call__(self, value: IVariableValue) -> T:
+        """
+        Apply the visitor to a single value.
+
+        Parameters
+        ----------
+        value : IVariableValue
+            Value to visit.
+
+        Returns
+        -------
+        T
+            Result of the visitor.
+        """
+        value_type = type(value)
+        method = self._methods.get(value_type)
+        if method is None:
+            method = self._resolve(value_type)
+        return method(self._visitor, value)
+
+    def apply(self, values: Iterable[IVariableValue]) -> List[T]:
+        """
+        Apply the visitor to each of a batch of values.
+
+        The values may be of any mix of types.
+
+        Parameters
+        ----------
+        values : Iterable[IVariableValue]
+            Values to visit.
+
+        Returns
+        -------
+        List[T]
+            Result of the visitor for each value, in the order of ``values``.
+        """
+        visitor = self._visitor
+        methods = self._methods
+        resolve = self._resolve
+        results: List[T] = []
+        append = results.append
+        for value in values:
+            value_type = type(value)
+            method = methods.get(value_type)
+            if method is None:
+                method = resolve(value_type)
+            append(method(visitor, value))
+        return results
+
+
+def dispatch_by_type(visitor: IVariableValueVisitor[T]) -> TypeDispatcher[T]:
+    """
+    Get a dispatcher for a visitor.
+
+    The visitor methods are resolved once per visitor class and shared by all
+    dispatchers for visitors of that class, so creating a dispatcher is cheap. The
+    dispatcher holds the only reference the library keeps to the visitor.
+
+    Parameters
+    ----------
+    visitor : IVariableValueVisitor[T]
+        Visitor to dispatch to.
+
+    Returns
+    -------
+    TypeDispatcher[T]
+        Dispatcher that applies the visitor.
+    """
+    return TypeDispatcher(visitor)
@@ -0,0 +1,172 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Defines the ``WriteBehindSaveContext`` class."""
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import contextvars
+from os import PathLike
+import threading
+from typing import Callable, Dict, List, Optional, Union
+from uuid import uuid4
+
+from overrides import overrides
+
+from .isave_context import ISaveContext
+
+
+class WriteBehindSaveContext(ISaveContext):
+    """
+    Provides a save context that saves files in the background.
+
+    This context wraps another save context. The ``save_file`` method returns a content
+    ID immediately and queues the actual save on the wrapped context to a pool of worker
+    threads, so serialization can continue while files are stored. The ``flush`` and
+    ``close`` methods wait for all queued saves to finish and raise the first error that
+    occurred, if any.
+
+    The wrapped context must store each file under the content ID it is given and must
+    be safe to use from several threads at once. A wrapped context that chooses its own
+    IDs, such as a ``ContentAddressedFileScope``, can be used with an ``id_factory`` that
+    computes the same IDs. A save stored under another ID is reported as an error, as the
+    ID returned by ``save_file`` may already have been serialized. Files passed to
+    ``save_file`` must remain in place and unchanged until they are saved. ``FileValue``
+    instances ensure this for their local copies through the ``release_when_saved``
+    method.
+    """
+
+    def __init__(
+        self,
+        inner: ISaveContext,
+        max_workers: int = 4,
+        max_pending: int = 64,
+        id_factory: Optional[Callable[[Union[PathLike, str]], str]] = None,
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        inner : ISaveContext
+            Save context that actually stores the files. It is closed when this context is
+            closed.
+        max_workers : int, optional
+            Maximum number of files saved at once. The default is ``4``.
+        max_pending : int, optional
+            Maximum number of saves that may be queued or running. When this many saves
+            are outstanding, the ``save_file`` method waits for one to finish. The default
+            is ``64``.
+        id_factory : Optional[Callable[[Union[PathLike, str]], str]], optional
+            Function that computes the content ID of a file when the caller does not
+            provide one, such as a digest of its content. The default is ``None``, in
+            which case a random UUID is used.
+        """
+        if max_pending < 1:
+            raise ValueError("At least one pending save must be allowed.")
+        self._inner: ISaveContext = inner
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_workers)
+        self._slots: threading.BoundedSemaphore = threading.BoundedSemaphore(max_pending)
+        self._id_factory: Callable[[Union[PathLike, str]], str] = (
+            id_factory if id_factory is not None else lambda source: str(uuid4())
+        )
+        self._lock: threading.Lock = threading.Lock()
+        self._pending: List[Future] = []
+        self._latest_saves: Dict[str, Future] = {}
+        self._errors: List[BaseException] = []
+        self._closed: bool = False
+
+    def _save(self, source: Union[PathLike, str], content_id: str) -> None:
+        try:
+            saved_id: str = self._inner.save_file(source, content_id)
+            if saved_id != content_id:
+                raise ValueError(
+                    f"The wrapped save context stored {source!s} as {saved_id} "
+                    f"instead of {content_id}."
+                )
+        except BaseException as error:
+            with self._lock:
+                self._errors.append(error)
+        finally:
+            self._slots.release()
+
+    @overrides
+    def save_file(self, source: Union[PathLike, str], content_id: Optional[str] = None) -> str:
+        if self._closed:
+            raise ValueError("The save context is closed.")
+        if content_id is None:
+            content_id = self._id_factory(source)
+        self._slots.acquire()
+        try:
+            # Run the save in a copy of the caller's context, so that it is seen as part of
+            # this call, for example by instrumentation.
+            future: Future = self._executor.submit(
+                contextvars.copy_context().run, self._save, source, content_id
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pending = [pending for pending in self._pending if not pending.done()]
+            self._pending.append(future)
+            self._latest_saves = {
+                path: save for path, save in self._latest_saves.items() if not save.done()
+            }
+            self._latest_saves[str(source)] = future
+        return content_id
+
+    @overrides
+    def release_when_saved(self, source: Union[PathLike, str], release: Callable[[], None]) -> None:
+        with self._lock:
+            future: Optional[Future] = self._latest_saves.get(str(source))
+        if future is None:
+            release()
+        else:
+            # Called at once if the save has already finished.
+            future.add_done_callback(lambda _: release())
+
+    def _wait(self) -> None:
+        """Wait for all queued saves and raise the first error that occurred."""
+        with self._lock:
+            pending: List[Future] = self._pending
+            self._pending = []
+        wait(pending)
+        with self._lock:
+            errors: List[BaseException] = self._errors
+            self._errors = []
+        if errors:
+            raise errors[0]
+
+    @overrides
+    def flush(self) -> None:
+        self._wait()
+        self._inner.flush()
+
+    @overrides
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+            self._inner.close()
@@ -0,0 +1,215 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Defines the ``DirectoryStoreFileScope`` class used by the tests."""
+from __future__ import annotations
+
+import functools
+from os import PathLike
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Union, cast
+from uuid import uuid4
+
+from anyio import to_thread
+from overrides import overrides
+
+from ansys.tools.variableinterop.file_scope import FileScope
+from ansys.tools.variableinterop.file_value import (
+    EMPTY_FILE,
+    AsyncLocalFileContentContext,
+    FileValue,
+    LocalFileContentContext,
+)
+from ansys.tools.variableinterop.isave_context import ILoadContext
+from ansys.tools.variableinterop.local_content_cache import LocalContentCache
+from ansys.tools.variableinterop.utils.content_sniffing import ContentSniffer
+from ansys.tools.variableinterop.utils.file_copy import FileCopyMethod, copy_file
+
+
+class DirectoryStoreFileScope(FileScope):
+    """
+    Provides a file scope that keeps file contents in a store directory that is treated
+    as remote storage.
+
+    Reading a file copies it into the store. Whenever a local copy of the contents is
+    requested, it is fetched from the store into a ``LocalContentCache`` instance, so
+    repeated requests for the same file value are served from the cache. Concurrent
+    requests for the same file value share a single fetch through the scope's pin
+    registry. This scope is a stand-in for scopes backed by genuinely remote storage,
+    used to test code that must work with file values that are not already local.
+
+    Closing the scope deletes the files it copied into the store.
+    """
+
+    class DirectoryStoreFileValue(FileValue):
+        """Implementation of a ``FileValue`` instance used by this scope."""
+
+        __slots__ = ("_scope", "_store_path")
+
+        def __init__(
+            self,
+            scope: DirectoryStoreFileScope,
+            store_path: Path,
+            original_path: Optional[PathLike] = None,
+            mime_type: Optional[str] = None,
+            encoding: Optional[str] = None,
+        ) -> None:
+            """
+            Construct a new ``DirectoryStoreFileValue`` instance.
+
+            Parameters
+            ----------
+            scope : DirectoryStoreFileScope
+                Scope that created this value.
+            store_path : Path
+                Path to the contents in the store.
+            original_path : Optional[PathLike], optional
+                Path to the file that was read. The default value is ``None``, which
+                indicates that the original path is not known.
+            mime_type : Optional[str], optional
+                MIME type of the file. The default value is ``None``, which indicates that
+                the MIME type is not known or the file does not have one.
+            encoding : Optional[str], optional
+                Encoding of the file. The default value is ``None``, which indicates that
+                the file does not have a known text encoding.
+            """
+            super().__init__(
+                original_path=original_path,
+                mime_type=mime_type,
+                encoding=encoding,
+                value_id=uuid4(),
+                file_size=store_path.stat().st_size,
+                copy_methods=scope.copy_methods,
+            )
+            self._scope: DirectoryStoreFileScope = scope
+            self._store_path: Path = store_path
+
+        @overrides
+        def _has_content(self) -> bool:
+            return True
+
+        def _fetch(self, destination: Path) -> None:
+            copy_file(self._store_path, destination, self._copy_methods)
+
+        @overrides
+        async def get_reference_to_actual_content_file_async(
+            self, progress_callback: Optional[Callable[[int], None]] = None
+        ) -> AsyncLocalFileContentContext:
+            async def fetch_async(destination: Path) -> None:
+                await to_thread.run_sync(functools.partial(self._fetch, destination))
+
+            async def realize() -> LocalFileContentContext:
+                return cast(
+                    LocalFileContentContext,
+                    await self._scope.cache.pin_async(
+                        str(self.id), fetch_async, self.get_extension()
+                    ),
+                )
+
+            return await self._scope.pin_registry.pin_async(str(self.id), realize)
+
+        @overrides
+        def get_reference_to_actual_content_file(
+            self, progress_callback: Optional[Callable[[int], None]] = None
+        ) -> LocalFileContentContext:
+            return self._scope.pin_registry.pin(
+                str(self.id),
+                lambda: self._scope.cache.pin(str(self.id), self._fetch, self.get_extension()),
+            )
+
+    def __init__(
+        self,
+        store_directory: Union[PathLike, str],
+        cache: LocalContentCache,
+        copy_methods: Optional[Sequence[FileCopyMethod]] = None,
+        content_sniffer: Optional[ContentSniffer] = None,
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        store_directory : Union[PathLike, str]
+            Directory that stands in for remote storage. It is created if it does not exist.
+        cache : LocalContentCache
+            Cache into which contents are fetched when a local copy is needed.
+        copy_methods : Optional[Sequence[FileCopyMethod]], optional
+            Methods tried, in order, when copying contents. The default is ``None``, in
+            which case the default methods are used.
+        content_sniffer : Optional[ContentSniffer], optional
+            Content sniffer used to detect the MIME type and encoding of files read without
+            them. The default is ``None``, in which case they are not detected.
+        """
+        super().__init__(copy_methods, content_sniffer)
+        self._store_directory: Path = Path(store_directory)
+        self._store_directory.mkdir(parents=True, exist_ok=True)
+        self._cache: LocalContentCache = cache
+        self._stored: List[Path] = []
+
+    @property
+    def cache(self) -> LocalContentCache:
+        """Cache into which contents are fetched when a local copy is needed."""
+        return self._cache
+
+    def _upload(
+        self,
+        to_read: PathLike,
+        original_path: Optional[PathLike],
+        mime_type: Optional[str],
+        encoding: Optional[str],
+    ) -> FileValue:
+        store_path: Path = self._store_directory / uuid4().hex
+        copy_file(to_read, store_path, self.copy_methods)
+        self._stored.append(store_path)
+        return DirectoryStoreFileScope.DirectoryStoreFileValue(
+            self, store_path, original_path, mime_type, encoding
+        )
+
+    @overrides
+    def read_from_file(
+        self, to_read: PathLike, mime_type: Optional[str] = None, encoding: Optional[str] = None
+    ) -> FileValue:
+        mime_type, encoding = self._sniff_metadata(to_read, mime_type, encoding)
+        return self._upload(to_read, to_read, mime_type, encoding)
+
+    @overrides
+    def from_api_object(
+        self, api_object: Dict[str, Optional[str]], load_context: ILoadContext
+    ) -> FileValue:
+        if FileValue.CONTENTS_KEY in api_object:
+            content: Optional[PathLike] = load_context.load_file(
+                api_object.get(FileValue.CONTENTS_KEY)
+            )
+            if content is not None:
+                original_path: Optional[str] = api_object.get(FileValue.ORIGINAL_FILENAME_KEY)
+                return self._upload(
+                    content,
+                    Path(original_path) if original_path else None,
+                    api_object.get(FileValue.MIMETYPE_KEY),
+                    api_object.get(FileValue.ENCODING_KEY),
+                )
+        return EMPTY_FILE
+
+    @overrides
+    def close(self) -> None:
+        for store_path in self._stored:
+            store_path.unlink(missing_ok=True)
+        self._stored.clear()
@@ -0,0 +1,169 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from pathlib import Path
+import tarfile
+import zipfile
+
+import pytest
+
+import ansys.tools.variableinterop as acvi
+
+_FORMATS = [
+    pytest.param(acvi.ZipSaveContext, {}, acvi.ZipLoadContext, "zip", id="zip"),
+    pytest.param(
+        acvi.ZipSaveContext,
+        {"compression": zipfile.ZIP_STORED},
+        acvi.ZipLoadContext,
+        "zip",
+        id="zip-stored",
+    ),
+    pytest.param(acvi.TarSaveContext, {}, acvi.TarLoadContext, "tar", id="tar"),
+    pytest.param(
+        acvi.TarSaveContext, {"compression": "gz"}, acvi.TarLoadContext, "tar.gz", id="tar-gz"
+    ),
+]
+
+
+@pytest.mark.parametrize("save_type,save_args,load_type,extension", _FORMATS)
+def test_round_trip(tmp_path: Path, save_type, save_args, load_type, extension) -> None:
+    # Setup
+    archive = tmp_path / f"files.{extension}"
+    sources = []
+    for index in range(20):
+        source = tmp_path / f"source{index}.txt"
+        source.write_text(f"contents {index}")
+        sources.append(source)
+
+    # Execute
+    with save_type(archive, **save_args) as save_context:
+        ids = [save_context.save_file(source) for source in sources]
+        named_id = save_context.save_file(sources[0], "named/content")
+    with load_type(archive) as load_context:
+        loaded = [load_context.load_file(content_id) for content_id in reversed(ids)]
+        contents = [path.read_text() for path in loaded]
+        named_contents = load_context.load_file(named_id).read_text()
+        repeated = load_context.load_file(ids[-1])
+
+    # Verify
+    assert len(set(ids)) == len(ids)
+    assert named_id == "named/content"
+    assert contents == [f"contents {index}" for index in reversed(range(20))]
+    assert named_contents == "contents 0"
+    assert repeated == loaded[0]
+    assert not any(path.exists() for path in loaded)
+
+
+@pytest.mark.parametrize("save_type,save_args,load_type,extension", _FORMATS)
+def test_load_missing_and_empty(tmp_path: Path, save_type, save_args, load_type, extension):
+    # Setup
+    archive = tmp_path / f"files.{extension}"
+    with save_type(archive, **save_args):
+        pass
+
+    with load_type(archive) as sut:
+        # Execute / Verify
+        assert sut.load_file(None) is None
+        assert sut.load_file("") is None
+        with pytest.raises(FileNotFoundError):
+            sut.load_file("missing")
+
+
+@pytest.mark.parametrize(
+    "content_id",
+    [
+        pytest.param("/absolute", id="absolute"),
+        pytest.param("../escape", id="parent"),
+        pytest.param("back\\slash", id="backslash"),
+        pytest.param("", id="empty"),
+    ],
+)
+def test_save_rejects_unsafe_ids(tmp_path: Path, content_id: str) -> None:
+    # Setup
+    source = tmp_path / "source.txt"
+    source.write_text("contents")
+
+    with acvi.ZipSaveContext(tmp_path / "files.zip") as sut:
+        # Execute / Verify
+        with pytest.raises(ValueError):
+            sut.save_file(source, content_id)
+
+
+def test_save_same_id_twice_writes_one_member(tmp_path: Path) -> None:
+    # Setup
+    source = tmp_path / "source.txt"
+    source.write_text("contents")
+    archive = tmp_path / "files.tar"
+
+    # Execute
+    with acvi.TarSaveContext(archive) as sut:
+        sut.save_file(source, "id")
+        sut.save_file(source, "id")
+
+    # Verify
+    with tarfile.open(archive) as tar:
+        assert tar.getnames() == ["id"]
+
+
+def test_file_value_round_trip(tmp_path: Path) -> None:
+    # Setup
+    source = tmp_path / "source.txt"
+    source.write_text("file contents")
+    archive = tmp_path / "files.zip"
+    scope = acvi.NonManagingFileScope()
+    value = scope.read_from_file(source, "text/plain", "utf-8")
+
+    # Execute
+    with acvi.ZipSaveContext(archive) as save_context:
+        api_string = acvi.to_api_string(value, save_context)
+    with acvi.ZipLoadContext(archive, tmp_path / "extracted") as load_context:
+        loaded = acvi.from_api_string(acvi.VariableType.FILE, api_string, scope, load_context)
+        contents = loaded.actual_content_file_name.read_text()
+
+    # Verify
+    assert contents == "file contents"
+    assert loaded.mime_type == "text/plain"
+    assert loaded.file_encoding == "utf-8"
+    assert list((tmp_path / "extracted").iterdir()) == []
+
+
+def test_save_skips_contents_with_known_digest(tmp_path: Path) -> None:
+    # Setup
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    first.write_text("same contents")
+    second.write_text("same contents")
+    archive = tmp_path / "files.zip"
+    with acvi.ContentAddressedFileScope(tmp_path / "blobs") as scope:
+        first_value = scope.read_from_file(first)
+        second_value = scope.read_from_file(second)
+
+        # Execute
+        with acvi.ZipSaveContext(archive) as sut:
+            first_object = first_value.to_api_object(sut)
+            second_object = second_value.to_api_object(sut)
+
+    # Verify
+    assert first_object[acvi.FileValue.CONTENTS_KEY] == second_object[acvi.FileValue.CONTENTS_KEY]
+    assert first_object[acvi.FileValue.DIGEST_KEY] == f"sha256:{first_value.content_digest}"
+    assert second_object[acvi.FileValue.DIGEST_KEY] == first_object[acvi.FileValue.DIGEST_KEY]
+    with zipfile.ZipFile(archive) as zip_archive:
+        assert len(zip_archive.namelist()) == 1
@@ -0,0 +1,131 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Unit tests of the async conversion wrappers."""
+import numpy
+import pytest
+
+import ansys.tools.variableinterop as acvi
+from ansys.tools.variableinterop import async_conversion
+from ansys.tools.variableinterop.array_value_conversion import to_integer_array_value
+from ansys.tools.variableinterop.scalar_value_conversion import to_integer_value
+
+
+@pytest.mark.anyio
+async def test_small_values_are_converted_inline(mocker) -> None:
+    """Verify that values under the threshold never leave the event loop."""
+    # Setup
+    run_sync = mocker.spy(async_conversion.to_thread, "run_sync")
+    value = acvi.RealArrayValue(values=[1.5, 2.5])
+
+    # Execute
+    api_string = await acvi.to_api_string_async(value)
+    parsed = await acvi.from_api_string_async(acvi.VariableType.REAL_ARRAY, api_string)
+    converted = await acvi.convert_async(to_integer_array_value, value)
+
+    # Verify
+    run_sync.assert_not_called()
+    assert api_string == value.to_api_string()
+    assert parsed == value
+    assert converted == acvi.IntegerArrayValue(values=[2, 3])
+
+
+@pytest.mark.anyio
+async def test_large_values_are_offloaded_to_a_thread(mocker) -> None:
+    """Verify that values over the threshold are converted on a worker thread."""
+    # Setup
+    run_sync = mocker.spy(async_conversion.to_thread, "run_sync")
+    value = acvi.IntegerArrayValue(values=numpy.arange(12).reshape(3, 4))
+
+    # Execute
+    api_string = await acvi.to_api_string_async(value, threshold=4)
+    parsed = await acvi.from_api_string_async(
+        acvi.VariableType.INTEGER_ARRAY, api_string, threshold=4
+    )
+    display = await acvi.to_display_string_async(acvi.EMPTY_FILE, "en_US", threshold=0)
+
+    # Verify
+    assert run_sync.call_count == 3
+    assert api_string == value.to_api_string()
+    assert type(parsed) is acvi.IntegerArrayValue
+    assert parsed == value
+    assert display == acvi.EMPTY_FILE.to_display_string("en_US")
+
+
+@pytest.mark.anyio
+async def test_large_arrays_can_be_parsed_on_a_process() -> None:
+    """Verify that array parsing on a worker process returns the array class."""
+    # Setup
+    value = acvi.RealArrayValue(values=numpy.linspace(0.0, 1.0, 50).reshape(5, 10))
+
+    # Execute
+    parsed = await acvi.from_api_string_async(
+        acvi.VariableType.REAL_ARRAY, value.to_api_string(), threshold=0, use_process=True
+    )
+
+    # Verify
+    assert type(parsed) is acvi.RealArrayValue
+    assert parsed == value
+
+
+@pytest.mark.anyio
+async def test_scalars_can_be_parsed_on_a_process(mocker) -> None:
+    """Verify that scalar parsing on a worker process returns the scalar class."""
+    # Setup
+    run_process = mocker.spy(async_conversion.to_process, "run_sync")
+
+    # Execute
+    parsed = await acvi.from_api_string_async(
+        acvi.VariableType.REAL, "1.5", threshold=0, use_process=True
+    )
+
+    # Verify
+    run_process.assert_called_once()
+    assert type(parsed) is acvi.RealValue
+    assert parsed == acvi.RealValue(1.5)
+
+
+@pytest.mark.anyio
+async def test_scalars_can_be_formatted_and_converted_on_a_process() -> None:
+    """Verify that scalars sent to a worker process arrive as their own class."""
+    # Setup
+    value = acvi.StringValue("x" * 20000)
+
+    # Execute
+    api_string = await acvi.to_api_string_async(value, use_process=True)
+    converted = await acvi.convert_async(
+        to_integer_value, acvi.RealValue(1.0), threshold=0, use_process=True
+    )
+
+    # Verify
+    assert api_string == value.to_api_string()
+    assert type(converted) is acvi.IntegerValue
+    assert converted == acvi.IntegerValue(1)
+
+
+@pytest.mark.anyio
+async def test_parse_errors_on_a_process_are_raised_as_format_exception() -> None:
+    """Verify that a parse error on a worker process reaches the caller unchanged."""
+    # Execute / Verify
+    with pytest.raises(acvi.exceptions.FormatException):
+        await acvi.from_api_string_async(
+            acvi.VariableType.INTEGER_ARRAY, "{1,,2}", threshold=0, use_process=True
+        )
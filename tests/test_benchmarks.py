@@ -0,0 +1,96 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Smoke tests of the benchmark suite."""
+from __future__ import annotations
+
+import importlib.util
+import json
+from pathlib import Path
+import sys
+
+import pytest
+
+_SCRIPT = Path(__file__).parents[1] / "benchmarks" / "interop_benchmarks.py"
+
+
+@pytest.fixture(scope="module")
+def benchmarks():
+    spec = importlib.util.spec_from_file_location("interop_benchmarks", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    yield module
+    del sys.modules[spec.name]
+
+
+def test_every_benchmark_runs(benchmarks, tmp_path: Path, monkeypatch) -> None:
+    # Setup
+    monkeypatch.setattr(benchmarks, "FILE_SIZE", 1024)
+    cases = benchmarks.all_benchmarks(tmp_path, max_elements=100)
+
+    # Execute
+    results = benchmarks.run(cases, repeat=1, min_seconds=0.0, report=lambda _: None)
+
+    # Verify
+    assert set(results["results"]) == {case.name for case in cases}
+    assert all(r["seconds"] > 0 for r in results["results"].values())
+    assert any(name.startswith("api_round_trip/") for name in results["results"])
+    assert "file/write_file" in results["results"]
+
+
+@pytest.mark.parametrize(
+    "current,expected",
+    [
+        pytest.param(1.1, {}, id="within threshold"),
+        pytest.param(1.5, {"a": 1.5}, id="regressed"),
+        pytest.param(0.5, {}, id="faster"),
+    ],
+)
+def test_find_regressions(benchmarks, current: float, expected) -> None:
+    # Setup
+    baseline = {"results": {"a": {"seconds": 1.0}, "gone": {"seconds": 1.0}}}
+    results = {"results": {"a": {"seconds": current}, "new": {"seconds": 9.0}}}
+
+    # Execute
+    regressions = benchmarks.find_regressions(results, baseline, threshold=0.2)
+
+    # Verify
+    assert regressions == pytest.approx(expected)
+
+
+def test_main_saves_and_compares(benchmarks, tmp_path: Path) -> None:
+    # Setup
+    baseline = tmp_path / "baseline.json"
+    args = ["-k", "^construct/", "--repeat", "1", "--min-seconds", "0"]
+
+    # Execute
+    saved = benchmarks.main(args + ["--save", str(baseline)])
+    data = json.loads(baseline.read_text())
+    for result in data["results"].values():
+        result["seconds"] = 1e-12
+    baseline.write_text(json.dumps(data))
+    compared = benchmarks.main(args + ["--compare", str(baseline)])
+
+    # Verify
+    assert saved == 0
+    assert "numpy" in data["environment"]
+    assert compared == 1
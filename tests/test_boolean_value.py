@@ -20,6 +20,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import copy
+import pickle
 from typing import Any, Callable, List, Tuple, Type, Union
 
 import numpy as np
@@ -484,13 +486,53 @@ def test_to_int_value(source: acvi.BooleanValue, expected_result: str) -> None:
 
 
 def test_clone() -> None:
-    """Verifies that clone returns a new BooleanValue with the same value."""
+    """Verifies that clone returns a new BooleanValue with the same value, unless the
+    value is one of the shared, frozen instances."""
     # Setup
-    sut: acvi.BooleanValue = acvi.BooleanValue(True)
+    shared: acvi.BooleanValue = acvi.BooleanValue(True)
+    sut: acvi.BooleanValue = shared.thaw()
 
     # SUT
     result: acvi.BooleanValue = sut.clone()
 
     # Verification
+    assert shared.clone() is shared
     assert result is not sut
     assert np.equal(result, True)
+
+
+@pytest.mark.parametrize("value", [False, True])
+def test_construction_returns_shared_frozen_instances(value: bool) -> None:
+    """Verifies that equal BooleanValues are the same frozen instance."""
+    # SUT
+    first = acvi.BooleanValue(value)
+    second = acvi.BooleanValue(np.bool_(value))
+    converted = acvi.BooleanValue(acvi.IntegerValue(int(value)))
+
+    # Verification
+    assert first is second is converted
+    assert first.is_frozen
+    assert bool(first) is value
+
+
+@pytest.mark.parametrize("value", [False, True])
+def test_copies_do_not_modify_shared_instances(value: bool) -> None:
+    """Verifies that copying, pickling and thawing leave the shared instances intact."""
+    # Setup
+    shared = acvi.BooleanValue(value)
+
+    # SUT
+    thawed = shared.thaw()
+    copies = [
+        copy.deepcopy(shared),
+        copy.deepcopy(thawed),
+        pickle.loads(pickle.dumps(thawed)),
+    ]
+
+    # Verification
+    assert thawed is not shared
+    assert not thawed.is_frozen
+    assert thawed == shared
+    assert all(c is shared for c in copies)
+    assert bool(acvi.BooleanValue(value)) is value
+    assert bool(acvi.BooleanValue(not value)) is not value
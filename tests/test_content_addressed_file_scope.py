@@ -0,0 +1,145 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+from pathlib import Path
+
+import pytest
+
+import ansys.tools.variableinterop as acvi
+
+
+@pytest.fixture
+def inputs(tmp_path: Path):
+    """Create two files with identical content and one with different content."""
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    other = tmp_path / "other.txt"
+    first.write_text("same contents")
+    second.write_text("same contents")
+    other.write_text("other contents")
+    return first, second, other
+
+
+def test_read_from_file_deduplicates(tmp_path: Path, inputs) -> None:
+    # Setup
+    first, second, other = inputs
+    with acvi.ContentAddressedFileScope(tmp_path / "blobs") as sut:
+        # Execute
+        first_value = sut.read_from_file(first, "text/plain", "utf-8")
+        second_value = sut.read_from_file(second)
+        other_value = sut.read_from_file(other)
+
+        # Verify
+        assert first_value != second_value
+        assert first_value.content_digest == second_value.content_digest
+        assert first_value.actual_content_file_name == second_value.actual_content_file_name
+        assert other_value.content_digest != first_value.content_digest
+        assert first_value.original_file_name == first
+        assert first_value.mime_type == "text/plain"
+        assert first_value.file_encoding == "utf-8"
+        assert first_value.file_size == len("same contents")
+        assert len(list((tmp_path / "blobs").rglob("*"))) == 4
+
+
+def test_save_and_load_round_trip(tmp_path: Path, inputs) -> None:
+    # Setup
+    first, second, _ = inputs
+    with acvi.ContentAddressedFileScope(tmp_path / "blobs") as sut:
+        value = sut.read_from_file(first, "text/plain", None)
+
+        # Execute
+        api_string = acvi.to_api_string(value, sut)
+        content_id = sut.save_file(second)
+        loaded = acvi.from_api_string(acvi.VariableType.FILE, api_string, sut, sut)
+
+        # Verify
+        assert json.loads(api_string)[acvi.FileValue.CONTENTS_KEY] == value.content_digest
+        assert content_id == value.content_digest
+        assert loaded.content_digest == value.content_digest
+        assert loaded.original_file_name == first
+        assert loaded.mime_type == "text/plain"
+
+
+def test_close_collects_unsaved_blobs(tmp_path: Path, inputs) -> None:
+    # Setup
+    first, _, other = inputs
+    blobs = tmp_path / "blobs"
+    with acvi.ContentAddressedFileScope(blobs) as sut:
+        saved = sut.read_from_file(first)
+        unsaved = sut.read_from_file(other)
+        sut.save_file(saved.actual_content_file_name)
+        saved_blob = Path(saved.actual_content_file_name)
+        unsaved_blob = Path(unsaved.actual_content_file_name)
+
+    # Verify
+    assert saved_blob.exists()
+    assert not unsaved_blob.exists()
+
+    # A later scope reuses the saved blob and does not delete it.
+    with acvi.ContentAddressedFileScope(blobs) as later:
+        assert later.load_file(saved.content_digest) == saved_blob
+        later.read_from_file(first)
+    assert saved_blob.exists()
+
+
+def test_close_keeps_blobs_used_by_other_scopes(tmp_path: Path, inputs) -> None:
+    # Setup
+    first, second, _ = inputs
+    blobs = tmp_path / "blobs"
+    adder = acvi.ContentAddressedFileScope(blobs)
+    sharer = acvi.ContentAddressedFileScope(blobs)
+    added = adder.read_from_file(first)
+    shared = sharer.read_from_file(second)
+
+    # Execute
+    adder.close()
+    still_there = Path(shared.actual_content_file_name).exists()
+    sharer.close()
+
+    # Verify
+    assert shared.actual_content_file_name == added.actual_content_file_name
+    assert still_there
+    assert not Path(shared.actual_content_file_name).exists()
+
+
+def test_store_reads_source_once(tmp_path: Path, inputs, mocker) -> None:
+    # Setup
+    first, _, _ = inputs
+    compute_digest = mocker.spy(acvi.ContentAddressedFileScope, "compute_digest")
+
+    # Execute
+    with acvi.ContentAddressedFileScope(tmp_path / "blobs") as sut:
+        value = sut.read_from_file(first)
+
+        # Verify
+        compute_digest.assert_not_called()
+        assert Path(value.actual_content_file_name).read_text() == "same contents"
+        assert sorted(p.name for p in (tmp_path / "blobs").iterdir()) == [value.content_digest[:2]]
+
+
+def test_load_file_invalid(tmp_path: Path) -> None:
+    with acvi.ContentAddressedFileScope(tmp_path / "blobs") as sut:
+        assert sut.load_file(None) is None
+        with pytest.raises(ValueError):
+            sut.load_file("../../etc/passwd")
+        with pytest.raises(FileNotFoundError):
+            sut.load_file("0" * 64)
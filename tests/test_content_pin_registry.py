@@ -0,0 +1,211 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import threading
+import time
+from typing import List
+
+import anyio
+import pytest
+
+import ansys.tools.variableinterop as acvi
+from directory_store_file_scope import DirectoryStoreFileScope
+
+
+class _RecordingContext(acvi.LocalFileContentContext):
+    """Local file content context that records how it was exited."""
+
+    def __init__(self, content_path: Path):
+        self._content_path = content_path
+        self.exits: int = 0
+        self.kept: bool = False
+
+    @property
+    def content_path(self) -> Path:
+        return self._content_path
+
+    def keep_file_on_exit(self) -> None:
+        self.kept = True
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.exits += 1
+
+
+@pytest.mark.anyio
+async def test_pin_async_shares_realization(tmp_path: Path) -> None:
+    # Setup
+    sut = acvi.ContentPinRegistry()
+    realized: List[_RecordingContext] = []
+    contexts: List[acvi.SharedFileContentContext] = []
+
+    async def realize() -> acvi.LocalFileContentContext:
+        await anyio.sleep(0.05)
+        realized.append(_RecordingContext(tmp_path / "content"))
+        return realized[-1]
+
+    async def reader() -> None:
+        contexts.append(await sut.pin_async("key", realize))
+
+    # Execute
+    async with anyio.create_task_group() as group:
+        for _ in range(20):
+            group.start_soon(reader)
+
+    # Verify
+    assert sut.realizations == 1
+    assert len(realized) == 1
+    assert {context.content_path for context in contexts} == {tmp_path / "content"}
+    assert "key" in sut
+    for context in contexts[:-1]:
+        async with context:
+            pass
+    assert realized[0].exits == 0
+    async with contexts[-1]:
+        pass
+    assert realized[0].exits == 1
+    assert "key" not in sut
+    assert len(sut) == 0
+
+
+@pytest.mark.anyio
+async def test_cancelled_async_waiter_releases_its_reference(tmp_path: Path) -> None:
+    # Setup
+    sut = acvi.ContentPinRegistry()
+    started = anyio.Event()
+    finish = anyio.Event()
+    realized = _RecordingContext(tmp_path / "content")
+
+    async def realize() -> acvi.LocalFileContentContext:
+        started.set()
+        await finish.wait()
+        return realized
+
+    async def owner() -> None:
+        async with await sut.pin_async("key", realize):
+            pass
+
+    # Execute
+    async with anyio.create_task_group() as group:
+        group.start_soon(owner)
+        await started.wait()
+        with anyio.move_on_after(0.2) as scope:
+            await sut.pin_async("key", realize)
+        finish.set()
+
+    # Verify
+    assert scope.cancelled_caught
+    assert realized.exits == 1
+    assert len(sut) == 0
+
+
+def test_pin_shares_realization_across_threads(tmp_path: Path) -> None:
+    # Setup
+    sut = acvi.ContentPinRegistry()
+    started = threading.Barrier(8)
+
+    def realize() -> acvi.LocalFileContentContext:
+        time.sleep(0.05)
+        return _RecordingContext(tmp_path / "content")
+
+    def reader() -> Path:
+        started.wait()
+        with sut.pin("key", realize) as context:
+            time.sleep(0.1)
+            return context.content_path
+
+    # Execute
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        paths = list(executor.map(lambda _: reader(), range(8)))
+
+    # Verify
+    assert paths == [tmp_path / "content"] * 8
+    assert sut.realizations == 1
+    assert len(sut) == 0
+
+
+@pytest.mark.anyio
+async def test_failed_realization_is_shared_then_retried(tmp_path: Path) -> None:
+    # Setup
+    sut = acvi.ContentPinRegistry()
+    errors: List[BaseException] = []
+
+    async def fail() -> acvi.LocalFileContentContext:
+        await anyio.sleep(0.05)
+        raise OSError("fetch failed")
+
+    async def reader() -> None:
+        try:
+            await sut.pin_async("key", fail)
+        except OSError as error:
+            errors.append(error)
+
+    # Execute
+    async with anyio.create_task_group() as group:
+        for _ in range(3):
+            group.start_soon(reader)
+    context = sut.pin("key", lambda: _RecordingContext(tmp_path / "content"))
+
+    # Verify
+    assert len(errors) == 3
+    assert sut.realizations == 2
+    assert context.content_path == tmp_path / "content"
+    context.__exit__(None, None, None)
+
+
+def test_keep_file_on_exit_detaches(tmp_path: Path) -> None:
+    # Setup
+    sut = acvi.ContentPinRegistry()
+    inner = _RecordingContext(tmp_path / "content")
+
+    # Execute
+    with sut.pin("key", lambda: inner) as context:
+        context.keep_file_on_exit()
+        assert "key" not in sut
+
+    # Verify
+    assert inner.kept
+    assert inner.exits == 1
+
+
+@pytest.mark.anyio
+async def test_directory_store_concurrent_readers_fetch_once(tmp_path: Path) -> None:
+    # Setup
+    source = tmp_path / "source.txt"
+    source.write_text("shared contents")
+    cache = acvi.LocalContentCache(tmp_path / "cache", 1024 * 1024)
+    results: List[str] = []
+    with DirectoryStoreFileScope(tmp_path / "store", cache) as scope:
+        value = scope.read_from_file(source)
+
+        async def reader() -> None:
+            results.append(await value.get_contents())
+
+        # Execute
+        async with anyio.create_task_group() as group:
+            for _ in range(10):
+                group.start_soon(reader)
+
+    # Verify
+    assert results == ["shared contents"] * 10
+    assert cache.misses == 1
+    assert scope.pin_registry.realizations == 1
@@ -0,0 +1,154 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import codecs
+import os
+from pathlib import Path
+
+import pytest
+
+import ansys.tools.variableinterop as acvi
+
+
+@pytest.mark.parametrize(
+    "name,raw,expected",
+    [
+        pytest.param(
+            "a.txt", codecs.BOM_UTF8 + b"abc", ("utf-8-sig", 3, "text/plain"), id="UTF-8 BOM"
+        ),
+        pytest.param(
+            "a.dat",
+            codecs.BOM_UTF16_LE + "abc".encode("utf-16-le"),
+            ("utf-16", 2, "text/plain"),
+            id="UTF-16 BOM",
+        ),
+        pytest.param(
+            "a.dat",
+            codecs.BOM_UTF32_LE + "abc".encode("utf-32-le"),
+            ("utf-32", 4, "text/plain"),
+            id="UTF-32 BOM",
+        ),
+        pytest.param("a.json", b'{"a": 1}', ("utf-8", 0, "application/json"), id="JSON"),
+        pytest.param("a.dat", "héllo".encode(), ("utf-8", 0, "text/plain"), id="UTF-8 text"),
+        pytest.param(
+            "a.dat", b"\x00\x01\x02\xff", (None, 0, "application/octet-stream"), id="Binary"
+        ),
+        pytest.param("a.dat", b"", ("utf-8", 0, "text/plain"), id="Empty"),
+    ],
+)
+def test_sniff(tmp_path: Path, name: str, raw: bytes, expected) -> None:
+    # Setup
+    file = tmp_path / name
+    file.write_bytes(raw)
+    sut = acvi.ContentSniffer()
+
+    # Execute
+    result: acvi.SniffedContent = sut.sniff(file)
+
+    # Verify
+    assert tuple(result) == expected
+
+
+def test_sniff_truncated_character(tmp_path: Path) -> None:
+    # Setup
+    file = tmp_path / "a.dat"
+    file.write_bytes("aé".encode())
+    sut = acvi.ContentSniffer(sample_size=2)
+
+    # Execute
+    result: acvi.SniffedContent = sut.sniff(file)
+
+    # Verify
+    assert result.encoding == "utf-8"
+
+
+def test_sniff_caches_until_file_changes(tmp_path: Path, mocker) -> None:
+    # Setup
+    file = tmp_path / "a.dat"
+    file.write_bytes(b"text")
+    sut = acvi.ContentSniffer(max_entries=1)
+    examine = mocker.spy(sut, "_examine")
+
+    # Execute
+    first = sut.sniff(file)
+    second = sut.sniff(file)
+    file.write_bytes(b"\x00binary")
+    os.utime(file, ns=(0, 0))
+    third = sut.sniff(file)
+
+    # Verify
+    assert first is second
+    assert third.encoding is None
+    assert examine.call_count == 2
+    assert len(sut) == 1
+    sut.clear()
+    assert len(sut) == 0
+
+
+@pytest.mark.anyio
+async def test_sniff_async(tmp_path: Path) -> None:
+    # Setup
+    file = tmp_path / "a.txt"
+    file.write_bytes(codecs.BOM_UTF8 + b"abc")
+
+    # Execute
+    result: acvi.SniffedContent = await acvi.ContentSniffer().sniff_async(file)
+
+    # Verify
+    assert result == acvi.SniffedContent("utf-8-sig", 3, "text/plain")
+
+
+@pytest.mark.anyio
+async def test_get_contents_uses_bom(tmp_path: Path) -> None:
+    # Setup
+    file = tmp_path / "a.txt"
+    file.write_text("あいう", encoding="utf-16")
+    scope = acvi.NonManagingFileScope()
+    value = scope.read_from_file(file, None, None)
+
+    # Execute
+    result: str = await value.get_contents()
+
+    # Verify
+    assert result == "あいう"
+
+
+def test_scope_sniffs_missing_metadata(tmp_path: Path) -> None:
+    # Setup
+    text = tmp_path / "a.json"
+    text.write_text("{}")
+    binary = tmp_path / "b.bin"
+    binary.write_bytes(b"\x00\x01")
+    missing = tmp_path / "missing.txt"
+    sut = acvi.NonManagingFileScope(content_sniffer=acvi.ContentSniffer())
+
+    # Execute
+    given = sut.read_from_file(text, "text/plain", None)
+    sniffed = sut.read_from_files([text, binary, missing])
+
+    # Verify
+    assert (given.mime_type, given.file_encoding) == ("text/plain", "utf-8")
+    assert [(value.mime_type, value.file_encoding) for value in sniffed] == [
+        ("application/json", "utf-8"),
+        ("application/octet-stream", None),
+        ("", None),
+    ]
+    assert acvi.NonManagingFileScope().read_from_file(text, None, None).mime_type == ""
@@ -20,9 +20,17 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import io
+import json
+from os import PathLike
 from pathlib import Path
+import threading
+import time
+from typing import Optional, Union
 
 import numpy
+from overrides import overrides
+import pytest
 
 import ansys.tools.variableinterop as acvi
 from test_file_value import _TestFileValue
@@ -96,3 +104,165 @@ def test_to_display_string():
         result == "<empty file>,<file read from unknown location>,"
         "<file read from file_path_here>"
     )
+
+
+class _SlowSaveContext(acvi.NonManagingFileScope):
+    """A pass-through context that records how many saves run at the same time."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self._active = 0
+        self.max_active = 0
+
+    @overrides
+    def save_file(self, source: Union[PathLike, str], content_id: Optional[str]) -> str:
+        with self._lock:
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        time.sleep(0.01)
+        with self._lock:
+            self._active -= 1
+        return super().save_file(source, content_id)
+
+
+def _make_array(scope: acvi.FileScope) -> acvi.FileArrayValue:
+    return acvi.FileArrayValue(
+        values=[
+            [scope.read_from_file(f"file/{row}/{col}", None, None) for col in range(4)]
+            for row in range(3)
+        ]
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_to_api_string_concurrent(max_workers: int) -> None:
+    # Setup
+    with _SlowSaveContext() as context:
+        sut = _make_array(context)
+
+        # Execute
+        result = json.loads(sut.to_api_string(context, max_workers=max_workers))
+
+        # Verify
+        assert [[item[acvi.FileValue.CONTENTS_KEY] for item in row] for row in result] == [
+            [f"file/{row}/{col}" for col in range(4)] for row in range(3)
+        ]
+        assert 1 <= context.max_active <= max_workers
+
+
+@pytest.mark.anyio
+async def test_to_api_string_async() -> None:
+    # Setup
+    with _SlowSaveContext() as context:
+        sut = _make_array(context)
+
+        # Execute
+        result = json.loads(await sut.to_api_string_async(context, max_concurrency=2))
+
+        # Verify
+        assert result == json.loads(sut.to_api_string(context))
+        assert context.max_active <= 2
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_from_api_object_concurrent(max_workers: int) -> None:
+    # Setup
+    with acvi.NonManagingFileScope() as scope:
+        source = json.loads(_make_array(scope).to_api_string(scope))
+
+        # Execute
+        result = acvi.FileArrayValue.from_api_object(source, scope, scope, max_workers)
+
+        # Verify
+        assert result.shape == (3, 4)
+        assert result[2, 1].original_file_name == Path("file/2/1")
+
+
+@pytest.mark.anyio
+async def test_from_api_object_async() -> None:
+    # Setup
+    with acvi.NonManagingFileScope() as scope:
+        source = json.loads(_make_array(scope).to_api_string(scope))
+
+        # Execute
+        result = await acvi.FileArrayValue.from_api_object_async(source, scope, scope, 3)
+
+        # Verify
+        assert result.shape == (3, 4)
+        assert result[1, 3].original_file_name == Path("file/1/3")
+
+
+@pytest.mark.anyio
+async def test_from_api_object_async_jagged() -> None:
+    with acvi.NonManagingFileScope() as scope:
+        with pytest.raises(TypeError):
+            await acvi.FileArrayValue.from_api_object_async([[{}], [{}, {}]], scope, scope)
+
+
+@pytest.mark.parametrize(
+    "shape",
+    [
+        pytest.param((3, 4), id="2d"),
+        pytest.param((2, 1, 3), id="3d"),
+        pytest.param((0,), id="empty"),
+        pytest.param((2, 0), id="empty rows"),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_api_string_stream_round_trip(shape, chunk_size: int) -> None:
+    # Setup
+    with acvi.NonManagingFileScope() as scope:
+        sut = acvi.FileArrayValue(shape)
+        for index in numpy.ndindex(*shape):
+            sut[index] = scope.read_from_file(Path("file", *map(str, index)), None, None)
+        stream = io.StringIO()
+
+        # Execute
+        sut.write_api_string(stream, scope)
+        stream.seek(0)
+        result = acvi.FileArrayValue.read_api_string(stream, scope, scope, chunk_size)
+
+        # Verify
+        assert stream.getvalue() == json.dumps(sut.to_api_object(scope))
+        assert result.shape == shape
+        assert [value.original_file_name for value in result.ravel()] == [
+            value.original_file_name for value in sut.ravel()
+        ]
+        reparsed = acvi.from_api_string(
+            acvi.VariableType.FILE_ARRAY, stream.getvalue(), scope, scope
+        )
+        assert reparsed.shape == shape
+
+
+def test_read_api_string_whitespace_and_numbers_split_across_chunks() -> None:
+    # Setup
+    source = ' [ [ {"contents": "a", "size": 12345} ,{"contents": "b"} ] ]  '
+    with acvi.NonManagingFileScope() as scope:
+        # Execute
+        result = acvi.FileArrayValue.read_api_string(io.StringIO(source), scope, scope, 2)
+
+        # Verify
+        assert result.shape == (1, 2)
+        assert result[0, 1].original_file_name == Path("b")
+
+
+@pytest.mark.parametrize(
+    "source,error",
+    [
+        pytest.param("[[{}], [{}, {}]]", TypeError, id="jagged lengths"),
+        pytest.param("[[{}], {}]", TypeError, id="jagged depth"),
+        pytest.param("[{}, [{}]]", TypeError, id="list after element"),
+        pytest.param("[[], [[]]]", TypeError, id="jagged empty"),
+        pytest.param("[1]", TypeError, id="not an object"),
+        pytest.param("{}", ValueError, id="not a list"),
+        pytest.param("[{} {}]", ValueError, id="missing comma"),
+        pytest.param("[{},]", ValueError, id="trailing comma"),
+        pytest.param("[{}", ValueError, id="unterminated"),
+        pytest.param("[{}] []", ValueError, id="extra data"),
+    ],
+)
+def test_read_api_string_invalid(source: str, error: type) -> None:
+    with acvi.NonManagingFileScope() as scope:
+        with pytest.raises(error):
+            acvi.FileArrayValue.read_api_string(io.StringIO(source), scope, scope, 3)
@@ -0,0 +1,99 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+import ansys.tools.variableinterop as acvi
+from ansys.tools.variableinterop.utils.file_copy import copy_file, copy_file_with_digest
+
+test_contents: bytes = bytes(range(256)) * 4096
+
+
+@pytest.mark.parametrize("method", list(acvi.FileCopyMethod))
+def test_copy_file(tmp_path: Path, method: acvi.FileCopyMethod) -> None:
+    # Setup
+    source = tmp_path / "source.bin"
+    destination = tmp_path / "destination.bin"
+    source.write_bytes(test_contents)
+    destination.write_bytes(b"previous contents that are longer than nothing")
+
+    # SUT
+    used: acvi.FileCopyMethod = copy_file(source, destination, [method])
+
+    # Verification
+    assert used == method
+    assert destination.read_bytes() == test_contents
+
+
+def test_copy_file_default_never_links(tmp_path: Path) -> None:
+    # Setup
+    source = tmp_path / "source.bin"
+    destination = tmp_path / "destination.bin"
+    source.write_bytes(test_contents)
+
+    # SUT
+    used: acvi.FileCopyMethod = copy_file(source, destination)
+
+    # Verification
+    assert used != acvi.FileCopyMethod.HARDLINK
+    assert not os.path.samefile(source, destination)
+    assert destination.read_bytes() == test_contents
+
+
+def test_copy_file_over_hardlink_keeps_source(tmp_path: Path) -> None:
+    # Setup
+    source = tmp_path / "source.bin"
+    destination = tmp_path / "destination.bin"
+    source.write_bytes(test_contents)
+    copy_file(source, destination, [acvi.FileCopyMethod.HARDLINK])
+
+    # SUT
+    copy_file(source, destination, [acvi.FileCopyMethod.STREAM])
+
+    # Verification
+    assert not os.path.samefile(source, destination)
+    assert source.read_bytes() == test_contents
+    assert destination.read_bytes() == test_contents
+
+
+def test_copy_file_missing_source(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        copy_file(tmp_path / "missing.bin", tmp_path / "destination.bin")
+
+
+@pytest.mark.parametrize("hash_name", ["sha256", "md5"])
+def test_copy_file_with_digest(tmp_path: Path, hash_name: str) -> None:
+    # Setup
+    source = tmp_path / "source.bin"
+    destination = tmp_path / "destination.bin"
+    source.write_bytes(test_contents)
+
+    # SUT
+    digest, size = copy_file_with_digest(source, destination, hash_name)
+
+    # Verification
+    assert digest == f"{hash_name}:{hashlib.new(hash_name, test_contents).hexdigest()}"
+    assert size == len(test_contents)
+    assert destination.read_bytes() == test_contents
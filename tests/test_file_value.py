@@ -20,10 +20,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import hashlib
 import json
 import os
 from os import PathLike
 from pathlib import Path
+import pickle
 from typing import Any, Optional, Union
 from uuid import UUID
 
@@ -376,3 +378,284 @@ async def test_write_file(encoding: Optional[str]):
     finally:
         os.remove(test_read_file)
         os.remove(out_file)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("method", list(acvi.FileCopyMethod))
+async def test_write_file_copy_method(tmp_path: Path, method: acvi.FileCopyMethod):
+    # Setup
+    in_file = tmp_path / "in.file"
+    out_file = tmp_path / "out.file"
+    in_file.write_text(test_contents)
+    file = _TestFileValue(None, None, None, None, None, in_file)
+
+    # SUT
+    await file.write_file(out_file, [method])
+
+    # Verification
+    assert out_file.read_text() == test_contents
+
+
+@pytest.mark.anyio
+async def test_write_file_scope_copy_methods(tmp_path: Path):
+    # Setup
+    in_file = tmp_path / "in.file"
+    out_file = tmp_path / "out.file"
+    in_file.write_text(test_contents)
+    with acvi.NonManagingFileScope(copy_methods=[acvi.FileCopyMethod.HARDLINK]) as scope:
+        file: acvi.FileValue = scope.read_from_file(in_file, None, None)
+
+        # SUT
+        await file.write_file(out_file)
+
+    # Verification
+    assert os.path.samefile(in_file, out_file)
+
+
+@pytest.mark.anyio
+async def test_write_file_records_digest(tmp_path: Path):
+    # Setup
+    in_file = tmp_path / "in.file"
+    in_file.write_text(test_contents)
+    file = _TestFileValue(None, None, None, None, None, in_file)
+    expected = "sha256:" + hashlib.sha256(test_contents.encode()).hexdigest()
+
+    # SUT
+    await file.write_file(tmp_path / "out.file", record_digest=True)
+
+    # Verification
+    assert file.digest == expected
+    assert file.file_size == len(test_contents)
+    assert file.to_api_object(acvi.NonManagingFileScope())[acvi.FileValue.DIGEST_KEY] == expected
+
+
+@pytest.mark.anyio
+async def test_write_file_does_not_hash_by_default(tmp_path: Path, mocker):
+    # Setup
+    in_file = tmp_path / "in.file"
+    in_file.write_text(test_contents)
+    file = _TestFileValue(None, None, None, None, None, in_file)
+    copy_with_digest = mocker.spy(acvi.file_value, "copy_file_with_digest")
+
+    # SUT
+    await file.write_file(tmp_path / "out.file")
+
+    # Verification
+    copy_with_digest.assert_not_called()
+    assert file.digest is None
+    assert (tmp_path / "out.file").read_text() == test_contents
+
+
+@pytest.mark.anyio
+async def test_to_api_object_omits_stale_digest(tmp_path: Path):
+    # Setup
+    in_file = tmp_path / "in.file"
+    in_file.write_text(test_contents)
+    file = _TestFileValue(in_file, None, None, None, None, in_file)
+    await file.write_file(tmp_path / "out.file", record_digest=True)
+    in_file.write_text("changed")
+    os.utime(in_file, ns=(0, 0))
+
+    # SUT
+    api_object = file.to_api_object(acvi.NonManagingFileScope())
+
+    # Verification
+    assert acvi.FileValue.DIGEST_KEY not in api_object
+
+
+def test_save_records_digest_and_detects_changes(tmp_path: Path):
+    # Setup
+    in_file = tmp_path / "in.file"
+    in_file.write_text(test_contents)
+    file = _TestFileValue(in_file, None, None, None, None, in_file)
+
+    # SUT
+    with acvi.ZipSaveContext(tmp_path / "first.zip") as context:
+        first_api_object = file.to_api_object(context)
+    in_file.write_text("changed")
+    os.utime(in_file, ns=(0, 0))
+    with acvi.ZipSaveContext(tmp_path / "second.zip") as context:
+        second_api_object = file.to_api_object(context)
+
+    # Verification
+    assert first_api_object[acvi.FileValue.DIGEST_KEY] == (
+        "sha256:" + hashlib.sha256(test_contents.encode()).hexdigest()
+    )
+    assert second_api_object[acvi.FileValue.DIGEST_KEY] == (
+        "sha256:" + hashlib.sha256(b"changed").hexdigest()
+    )
+
+
+class _CountingSaveContext(acvi.ISaveContext):
+    def __init__(self):
+        self.saves: int = 0
+
+    def save_file(self, source: Union[PathLike, str], content_id: Optional[str] = None) -> str:
+        self.saves += 1
+        return f"saved-{self.saves}"
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def test_to_api_object_reuses_saved_content_id(tmp_path: Path):
+    # Setup
+    in_file = tmp_path / "in.file"
+    in_file.write_text(test_contents)
+    file = _TestFileValue(in_file, None, None, None, None, in_file)
+    context = _CountingSaveContext()
+    other_context = _CountingSaveContext()
+
+    # SUT
+    first = file.to_api_object(context)
+    second = file.to_api_object(context)
+    other = file.to_api_object(other_context)
+    in_file.write_text("changed")
+    os.utime(in_file, ns=(0, 0))
+    changed = file.to_api_object(context)
+
+    # Verification
+    assert first[acvi.FileValue.CONTENTS_KEY] == "saved-1"
+    assert second[acvi.FileValue.CONTENTS_KEY] == "saved-1"
+    assert other[acvi.FileValue.CONTENTS_KEY] == "saved-1"
+    assert changed[acvi.FileValue.CONTENTS_KEY] == "saved-2"
+    assert context.saves == 2
+    assert other_context.saves == 1
+    assert context.get_saved_content_id(file.id, "not the fingerprint") is None
+
+
+def test_to_api_object_with_saved_content_id_does_not_pin(tmp_path: Path, mocker):
+    # Setup
+    in_file = tmp_path / "in.file"
+    in_file.write_text(test_contents)
+    file = _TestFileValue(in_file, None, None, None, None, in_file)
+    context = acvi.ZipSaveContext(tmp_path / "out.zip")
+    first = file.to_api_object(context)
+    pin = mocker.spy(file, "get_reference_to_actual_content_file")
+
+    # SUT
+    second = file.to_api_object(context)
+    context.close()
+
+    # Verification
+    pin.assert_not_called()
+    assert second == first
+    assert second[acvi.FileValue.DIGEST_KEY] == file.digest
+
+
+@pytest.mark.parametrize(
+    "raw,encoding,expected",
+    [
+        pytest.param(b"\xef\xbb\xbfabcdef", None, ["abcd", "ef"], id="UTF-8 BOM"),
+        pytest.param(b"\xff\xfea\x00b\x00c\x00", None, ["abc"], id="UTF-16 LE BOM"),
+        pytest.param("あい".encode("shift-jis"), "shift-jis", ["あい"], id="file"),
+    ],
+)
+def test_iter_chunks_detects_encoding(
+    tmp_path: Path, raw: bytes, encoding: Optional[str], expected: list
+):
+    # Setup
+    in_file = tmp_path / "in.file"
+    in_file.write_bytes(raw)
+    file = _TestFileValue(None, "text/plain", encoding, None, None, in_file)
+
+    # SUT
+    result = list(file.iter_chunks(4))
+
+    # Verification
+    assert result == expected
+
+
+def test_iter_chunks_binary(tmp_path: Path):
+    # Setup
+    in_file = tmp_path / "in.file"
+    in_file.write_bytes(bytes(range(10)))
+    file = _TestFileValue(None, None, None, None, None, in_file)
+
+    # SUT
+    result = list(file.iter_chunks(4, binary=True))
+
+    # Verification
+    assert result == [bytes(range(4)), bytes(range(4, 8)), bytes(range(8, 10))]
+
+
+@pytest.mark.anyio
+async def test_iter_chunks_async(tmp_path: Path):
+    # Setup
+    in_file = tmp_path / "in.file"
+    in_file.write_text(test_contents)
+    file = _TestFileValue(None, None, None, None, None, in_file)
+
+    # SUT
+    result = [chunk async for chunk in file.iter_chunks_async(2)]
+
+    # Verification
+    assert result == ["12", "34", "5"]
+
+
+def test_map_contents(tmp_path: Path):
+    # Setup
+    in_file = tmp_path / "in.file"
+    in_file.write_bytes(bytes(range(10)))
+    file = _TestFileValue(None, None, None, None, None, in_file)
+
+    # SUT
+    with file.map_contents() as view:
+        result = bytes(view[2:5])
+        readonly = view.readonly
+
+    # Verification
+    assert result == bytes([2, 3, 4])
+    assert readonly
+
+
+@pytest.mark.anyio
+async def test_map_contents_async_empty(tmp_path: Path):
+    # Setup
+    in_file = tmp_path / "in.file"
+    in_file.write_bytes(b"")
+    file = _TestFileValue(None, None, None, None, None, in_file)
+
+    # SUT
+    async with file.map_contents_async() as view:
+        result = len(view)
+
+    # Verification
+    assert result == 0
+
+
+def test_file_values_have_no_instance_dict_and_pickle(tmp_path: Path):
+    # Setup
+    in_file = tmp_path / "in.file"
+    in_file.write_text(test_contents)
+    file = acvi.NonManagingFileScope().read_from_file(in_file, "text/plain", "utf-8")
+
+    # SUT
+    result = pickle.loads(pickle.dumps(file))
+
+    # Verification
+    assert not hasattr(file, "__dict__")
+    assert not hasattr(acvi.EMPTY_FILE, "__dict__")
+    assert result == file
+    assert result.mime_type == "text/plain"
+    assert result.actual_content_file_name == file.actual_content_file_name
+
+
+def test_thaw_of_frozen_file_value(tmp_path: Path):
+    # Setup
+    in_file = tmp_path / "in.file"
+    in_file.write_text(test_contents)
+    file = acvi.NonManagingFileScope().read_from_file(in_file, None, None).freeze()
+
+    # SUT
+    clone = file.clone()
+    thawed = file.thaw()
+
+    # Verification
+    assert clone is file
+    assert thawed is not file
+    assert not thawed.is_frozen
+    assert file.is_frozen
@@ -37,6 +37,8 @@ from ansys.tools.variableinterop import (
     StringValue,
     VariableType,
     from_api_string,
+    from_api_strings,
+    to_api_strings,
 )
 from test_utils import _create_exception_context
 
@@ -516,3 +518,93 @@ def test_from_api_string_invalid(
     """
     with _create_exception_context(expected_exception):
         actual_result: IVariableValue = from_api_string(var_type, source)
+
+
+_MIXED_VALUES = [
+    RealValue(4.5),
+    IntegerValue(3),
+    StringValue("asdf"),
+    RealValue(float("inf")),
+    BooleanValue(True),
+    IntegerArrayValue(values=[[1, 2], [3, 4]]),
+    RealValue(-2.8e8),
+    IntegerValue(-9223372036854775808),
+    StringArrayValue(values=["a,b", '"q"']),
+    BooleanArrayValue(values=[True, False]),
+    RealArrayValue(values=[1.5, -0.25]),
+    BooleanValue(False),
+]
+
+
+def test_from_api_strings_round_trips_mixed_batch() -> None:
+    """Verify that a mixed batch round trips through the batch functions in order."""
+    # Setup
+    sources = to_api_strings(_MIXED_VALUES)
+
+    # Execute
+    results = from_api_strings([v.variable_type for v in _MIXED_VALUES], sources)
+
+    # Verify
+    assert sources == [v.to_api_string() for v in _MIXED_VALUES]
+    assert [type(r) for r in results] == [type(v) for v in _MIXED_VALUES]
+    for result, expected in zip(results, _MIXED_VALUES):
+        assert numpy.all(result == expected)
+
+
+@pytest.mark.parametrize(
+    "var_type,sources",
+    [
+        pytest.param(VariableType.REAL, ["1.5", "nan", "-Infinity", " 2 "], id="real"),
+        pytest.param(VariableType.INTEGER, ["1", "2.5", "-3.5", "1e3", " 7 "], id="integer"),
+        pytest.param(VariableType.BOOLEAN, ["true", "n", "0", "1.5"], id="boolean"),
+        pytest.param(VariableType.REAL_ARRAY, ["1.5,2", "bounds[1,2]{3,4}"], id="real array"),
+    ],
+)
+def test_from_api_strings_matches_from_api_string(
+    var_type: VariableType, sources: list[str]
+) -> None:
+    """Verify that a batch of one type produces the same values as single conversions."""
+    # Execute
+    from_pairs = from_api_strings([(var_type, s) for s in sources])
+    from_shared_type = from_api_strings(var_type, sources)
+
+    # Verify
+    expected = [from_api_string(var_type, s) for s in sources]
+    for results in (from_pairs, from_shared_type):
+        assert [type(r) for r in results] == [type(e) for e in expected]
+        assert [str(r) for r in results] == [str(e) for e in expected]
+
+
+@pytest.mark.parametrize(
+    "var_type,bad_source,expected_exception",
+    [
+        pytest.param(VariableType.REAL, "2.2.2", ValueError, id="real, multiple decimals"),
+        pytest.param(VariableType.REAL, None, TypeError, id="real, None"),
+        pytest.param(VariableType.INTEGER, "47b", ValueError, id="integer, extra characters"),
+        pytest.param(
+            VariableType.INTEGER,
+            "9.223372036854775300E+18",
+            OverflowError,
+            id="integer, valid float over max int",
+        ),
+        pytest.param(VariableType.INTEGER, None, TypeError, id="integer, None"),
+    ],
+)
+def test_from_api_strings_invalid(
+    var_type: VariableType, bad_source: str, expected_exception: Type[BaseException]
+) -> None:
+    """Verify that a batch raises the same exception as a single conversion."""
+    with _create_exception_context(expected_exception):
+        from_api_strings(var_type, ["1", bad_source, "2"])
+
+
+def test_from_api_strings_length_mismatch() -> None:
+    """Verify that differing numbers of types and sources are rejected."""
+    with pytest.raises(ValueError):
+        from_api_strings([VariableType.REAL], ["1", "2"])
+
+
+def test_from_api_strings_file_needs_scope() -> None:
+    """Verify that file values cannot be parsed without a scope and load context."""
+    with pytest.raises(NotImplementedError):
+        from_api_strings([(VariableType.REAL, "1"), (VariableType.FILE, "{}")])
@@ -0,0 +1,192 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Unit tests of the instrumentation registry and sinks."""
+import logging
+from pathlib import Path
+from typing import List
+
+import pytest
+
+import ansys.tools.variableinterop as acvi
+from ansys.tools.variableinterop import api_serialization, file_value, scalar_value_conversion
+
+
+def test_disabled_instrumentation_leaves_originals() -> None:
+    """Verify that nothing is wrapped before or after instrumentation is enabled."""
+    # Setup
+    original_function = api_serialization.to_api_string
+    original_method = file_value.FileValue.write_file
+    sink = acvi.StatsSink()
+
+    # Execute
+    with acvi.instrumented(sink):
+        wrapped_function = api_serialization.to_api_string
+        wrapped_export = acvi.to_api_string
+        wrapped_method = file_value.FileValue.write_file
+
+    # Verify
+    assert not hasattr(original_function, "__wrapped__")
+    assert wrapped_function.__wrapped__ is original_function
+    assert wrapped_export is wrapped_function
+    assert wrapped_method.__wrapped__ is original_method
+    assert api_serialization.to_api_string is original_function
+    assert acvi.to_api_string is original_function
+    assert file_value.FileValue.write_file is original_method
+    assert not acvi.instrumentation_enabled()
+
+
+def test_stats_sink_accumulates_conversions() -> None:
+    """Verify that conversions and serialization are counted and measured."""
+    # Setup
+    sink = acvi.StatsSink()
+    array = acvi.RealArrayValue(values=[1.5, 2.5, 3.5])
+
+    # Execute
+    with acvi.instrumented(sink):
+        api_string = acvi.to_api_string(array)
+        acvi.from_api_string(acvi.VariableType.REAL_ARRAY, api_string)
+        acvi.to_real_value(acvi.IntegerValue(3))
+        scalar_value_conversion.to_real_value(acvi.IntegerValue(4))
+        acvi.EMPTY_FILE.to_display_string("en_US")
+        with pytest.raises(acvi.IncompatibleTypesException):
+            acvi.to_integer_value(acvi.FileArrayValue())
+    acvi.to_api_string(array)
+    stats = sink.snapshot()
+
+    # Verify
+    assert stats["to_api_string"].calls == 1
+    assert stats["to_api_string"].elements == 3
+    assert stats["to_api_string"].nbytes == len(api_string)
+    assert stats["from_api_string"].elements == 3
+    assert stats["from_api_string"].nbytes == len(api_string)
+    assert stats["to_real_value"].calls == 2
+    assert stats["to_display_string"].calls == 1
+    assert stats["to_integer_value"].errors == 1
+    assert all(s.seconds >= 0 for s in stats.values())
+
+
+@pytest.mark.anyio
+async def test_file_operations_are_recorded(tmp_path: Path) -> None:
+    """Verify that file I/O is recorded once per call, with its size."""
+    # Setup
+    source = tmp_path / "source.txt"
+    source.write_text("some contents")
+    value = acvi.NonManagingFileScope().read_from_file(source, "text/plain", "utf-8")
+    records: List[acvi.OperationRecord] = []
+
+    # Execute
+    with acvi.instrumented(acvi.CallbackSink(records.append)):
+        with acvi.ZipSaveContext(tmp_path / "files.zip") as save_context:
+            content_id = save_context.save_file(source)
+        with acvi.ZipLoadContext(tmp_path / "files.zip") as load_context:
+            load_context.load_file(content_id)
+        await value.write_file(tmp_path / "copy.txt")
+        contents = await value.get_contents("utf-8")
+
+    # Verify
+    by_operation = {record.operation: record for record in records}
+    assert [record.operation for record in records] == [
+        "save_file",
+        "load_file",
+        "write_file",
+        "get_contents",
+    ]
+    assert by_operation["save_file"].nbytes == len("some contents")
+    assert by_operation["load_file"].nbytes == len("some contents")
+    assert by_operation["write_file"].nbytes == len("some contents")
+    assert by_operation["get_contents"].nbytes == len(contents)
+
+
+def test_value_methods_are_recorded() -> None:
+    """Verify that the serialization methods of the value types are recorded."""
+    # Setup
+    sink = acvi.StatsSink()
+    array = acvi.RealArrayValue(values=[1.5, 2.5, 3.5])
+    original_parse = acvi.RealArrayValue.__dict__["from_api_string"]
+
+    # Execute
+    with acvi.instrumented(sink):
+        api_string = array.to_api_string()
+        parsed = acvi.RealArrayValue.from_api_string(api_string)
+        acvi.IntegerValue(12).to_api_string()
+        acvi.IntegerValue.from_api_string("12")
+        acvi.to_api_string(acvi.IntegerValue(13))
+    stats = sink.snapshot()
+
+    # Verify
+    assert parsed == array
+    assert stats["to_api_string"].calls == 3
+    assert stats["to_api_string"].elements == 5
+    assert stats["from_api_string"].calls == 2
+    assert stats["from_api_string"].nbytes == len(api_string) + 2
+    assert acvi.RealArrayValue.__dict__["from_api_string"] is original_parse
+
+
+def test_write_behind_saves_are_recorded_once(tmp_path: Path) -> None:
+    """Verify that a save queued to a worker thread is not recorded again there."""
+    # Setup
+    source = tmp_path / "source.txt"
+    source.write_text("some contents")
+    records: List[acvi.OperationRecord] = []
+
+    # Execute
+    with acvi.instrumented(acvi.CallbackSink(records.append)):
+        with acvi.WriteBehindSaveContext(acvi.ZipSaveContext(tmp_path / "files.zip")) as sut:
+            sut.save_file(source)
+
+    # Verify
+    assert [record.operation for record in records] == ["save_file"]
+
+
+def test_logging_sink(caplog: pytest.LogCaptureFixture) -> None:
+    """Verify that the logging sink logs each call."""
+    # Setup
+    sink = acvi.LoggingSink(level=logging.INFO)
+
+    # Execute
+    with caplog.at_level(logging.INFO), acvi.instrumented(sink):
+        acvi.to_api_string(acvi.IntegerValue(12))
+
+    # Verify
+    assert any(message.startswith("to_api_string took") for message in caplog.messages)
+
+
+def test_sinks_are_removed_individually() -> None:
+    """Verify that instrumentation stays enabled until its last sink is removed."""
+    # Setup
+    first = acvi.StatsSink()
+    second = acvi.StatsSink()
+
+    # Execute
+    acvi.enable_instrumentation(first, second)
+    try:
+        acvi.disable_instrumentation(first)
+        acvi.to_api_string(acvi.IntegerValue(1))
+        still_enabled = acvi.instrumentation_enabled()
+    finally:
+        acvi.disable_instrumentation()
+
+    # Verify
+    assert still_enabled
+    assert first.snapshot() == {}
+    assert second.snapshot()["to_api_string"].calls == 1
+    assert not acvi.instrumentation_enabled()
@@ -392,3 +392,20 @@ def test_clone() -> None:
     # Verification
     assert result is not sut
     assert result == 7
+
+
+def test_clone_frozen() -> None:
+    """Verifies that clone of a frozen IntegerValue returns the same instance."""
+    # Setup
+    sut: IntegerValue = IntegerValue(7).freeze()
+
+    # SUT
+    result: IntegerValue = sut.clone()
+    thawed: IntegerValue = sut.thaw()
+
+    # Verification
+    assert result is sut
+    assert isinstance(thawed, IntegerValue)
+    assert thawed is not sut
+    assert not thawed.is_frozen
+    assert thawed == 7
@@ -0,0 +1,153 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests of the lazy loading of the package's public attributes."""
+from __future__ import annotations
+
+import ast
+import json
+from pathlib import Path
+import subprocess
+import sys
+from typing import Any, Dict
+
+import pytest
+
+import ansys.tools.variableinterop as acvi
+
+IMPORT_TIME_BUDGET_SECONDS = 0.5
+"""Generous upper bound on the time to import the package without using it."""
+
+_HEAVY_MODULES = (
+    "anyio",
+    "ansys.tools.variableinterop.file_value",
+    "ansys.tools.variableinterop.async_conversion",
+    "ansys.tools.variableinterop.api_serialization",
+    "ansys.tools.variableinterop.scalar_metadata",
+)
+
+
+def _run_isolated(code: str) -> Dict[str, Any]:
+    """Run code in a fresh interpreter and return the JSON it prints."""
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+def test_import_is_within_budget() -> None:
+    # Execute
+    result = _run_isolated(
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import ansys.tools.variableinterop\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))\n"
+    )
+
+    # Verify
+    assert result["elapsed"] < IMPORT_TIME_BUDGET_SECONDS
+    assert "numpy" not in result["modules"]
+    assert not set(_HEAVY_MODULES) & set(result["modules"])
+
+
+def test_scalar_use_does_not_load_other_subsystems() -> None:
+    # Execute
+    result = _run_isolated(
+        "import json, sys\n"
+        "import ansys.tools.variableinterop as acvi\n"
+        "value = acvi.RealValue(1.5) + acvi.IntegerValue(2)\n"
+        "print(json.dumps({'modules': sorted(sys.modules)}))\n"
+    )
+
+    # Verify
+    assert not set(_HEAVY_MODULES) & set(result["modules"])
+
+
+def test_each_submodule_can_be_loaded_first() -> None:
+    # Execute
+    result = _run_isolated(
+        "import json, sys\n"
+        "import ansys.tools.variableinterop as acvi\n"
+        "failures = {}\n"
+        "for module in sorted(set(acvi._LAZY_ATTRIBUTES.values())):\n"
+        "    for loaded in [m for m in sys.modules if m.startswith(acvi.__name__)]:\n"
+        "        del sys.modules[loaded]\n"
+        "    import ansys.tools.variableinterop as acvi\n"
+        "    name = next(n for n, m in acvi._LAZY_ATTRIBUTES.items() if m == module)\n"
+        "    try:\n"
+        "        getattr(acvi, name)\n"
+        "    except Exception as e:\n"
+        "        failures[name] = repr(e)\n"
+        "print(json.dumps(failures))\n"
+    )
+
+    # Verify
+    assert result == {}
+
+
+def test_every_public_attribute_resolves() -> None:
+    # Execute
+    resolved = {name: getattr(acvi, name) for name in acvi.__all__}
+
+    # Verify
+    assert resolved["RealValue"] is acvi.scalar_values.RealValue
+    assert resolved["FileValue"] is acvi.file_value.FileValue
+    assert isinstance(resolved["__version__"], str)
+    assert set(acvi.__all__) <= set(dir(acvi))
+
+
+def test_lazy_attributes_match_type_checking_imports() -> None:
+    # Setup
+    tree = ast.parse(Path(acvi.__file__).read_text())
+    type_checking = next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING"
+    )
+
+    # Execute
+    imported = {
+        alias.name: "." + node.module
+        for node in type_checking.body
+        if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    }
+
+    # Verify
+    assert imported == acvi._LAZY_ATTRIBUTES
+
+
+def test_unknown_attribute_raises() -> None:
+    # Execute / Verify
+    with pytest.raises(AttributeError, match="no_such_thing"):
+        acvi.no_such_thing
+
+
+def test_file_value_resource_parser_is_still_available() -> None:
+    # Setup
+    from ansys.tools.variableinterop import file_value
+
+    # Execute
+    parser = file_value.RESOURCE_PARSER
+
+    # Verify
+    assert parser.get("DisplayFormats", "FILE_EMPTY") == "<empty file>"
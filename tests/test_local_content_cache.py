@@ -0,0 +1,200 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from pathlib import Path
+from typing import List
+
+import pytest
+
+import ansys.tools.variableinterop as acvi
+from directory_store_file_scope import DirectoryStoreFileScope
+
+
+def _fetcher(contents: bytes, calls: List[Path]):
+    def fetch(destination: Path) -> None:
+        calls.append(destination)
+        destination.write_bytes(contents)
+
+    return fetch
+
+
+def test_pin_fetches_once(tmp_path: Path) -> None:
+    # Setup
+    sut = acvi.LocalContentCache(tmp_path / "cache", 100)
+    calls: List[Path] = []
+
+    # Execute
+    with sut.pin("a", _fetcher(b"0123456789", calls), ".txt") as first:
+        first_path = first.content_path
+    with sut.pin("a", _fetcher(b"0123456789", calls), ".txt") as second:
+        second_path = second.content_path
+
+    # Verify
+    assert len(calls) == 1
+    assert first_path == second_path
+    assert first_path.suffix == ".txt"
+    assert first_path.read_bytes() == b"0123456789"
+    assert sut.hits == 1
+    assert sut.misses == 1
+    assert sut.total_bytes == 10
+
+
+def test_evicts_least_recently_used(tmp_path: Path) -> None:
+    # Setup
+    sut = acvi.LocalContentCache(tmp_path / "cache", 25)
+    calls: List[Path] = []
+    with sut.pin("a", _fetcher(b"0123456789", calls)):
+        pass
+    with sut.pin("b", _fetcher(b"0123456789", calls)) as pinned:
+        evicted_path = pinned.content_path
+    # Touch "a" so that "b" becomes the least recently used entry.
+    with sut.pin("a", _fetcher(b"0123456789", calls)):
+        pass
+
+    # Execute
+    with sut.pin("c", _fetcher(b"0123456789", calls)):
+        pass
+
+    # Verify
+    assert "a" in sut
+    assert "b" not in sut
+    assert "c" in sut
+    assert sut.total_bytes == 20
+    assert not evicted_path.exists()
+
+
+def test_pinned_entries_are_not_evicted(tmp_path: Path) -> None:
+    # Setup
+    sut = acvi.LocalContentCache(tmp_path / "cache", 15)
+    calls: List[Path] = []
+
+    # Execute
+    with sut.pin("a", _fetcher(b"0123456789", calls)) as pinned:
+        with sut.pin("b", _fetcher(b"0123456789", calls)):
+            # Verify
+            assert pinned.content_path.exists()
+            assert sut.total_bytes == 20
+
+    # Once unpinned, the cache shrinks back under its limit.
+    assert sut.total_bytes <= 15
+    assert len(sut) == 1
+
+
+def test_keep_file_on_exit_detaches(tmp_path: Path) -> None:
+    # Setup
+    sut = acvi.LocalContentCache(tmp_path / "cache", 100)
+    calls: List[Path] = []
+
+    # Execute
+    with sut.pin("a", _fetcher(b"0123456789", calls)) as pinned:
+        pinned.keep_file_on_exit()
+    sut.clear()
+
+    # Verify
+    assert "a" not in sut
+    assert pinned.content_path.exists()
+
+
+def test_kept_file_survives_refetch_and_eviction(tmp_path: Path) -> None:
+    # Setup
+    sut = acvi.LocalContentCache(tmp_path / "cache", 10)
+    calls: List[Path] = []
+    with sut.pin("a", _fetcher(b"0123456789", calls)) as kept:
+        kept.keep_file_on_exit()
+
+    # Execute
+    with sut.pin("a", _fetcher(b"abcdefghij", calls)) as refetched:
+        refetched_path = refetched.content_path
+    with sut.pin("b", _fetcher(b"ABCDEFGHIJ", calls)):
+        pass
+
+    # Verify
+    assert len(calls) == 3
+    assert refetched_path != kept.content_path
+    assert not refetched_path.exists()
+    assert kept.content_path.read_bytes() == b"0123456789"
+
+
+def test_failed_fetch_is_not_cached(tmp_path: Path) -> None:
+    # Setup
+    sut = acvi.LocalContentCache(tmp_path / "cache", 100)
+
+    def fetch(destination: Path) -> None:
+        destination.write_bytes(b"partial")
+        raise IOError("connection lost")
+
+    # Execute
+    with pytest.raises(IOError):
+        sut.pin("a", fetch)
+
+    # Verify
+    assert "a" not in sut
+    assert list(sut.cache_directory.iterdir()) == []
+
+
+def test_instances_use_separate_directories_removed_on_close(tmp_path: Path) -> None:
+    # Setup
+    calls: List[Path] = []
+    first = acvi.LocalContentCache(tmp_path / "cache", 100)
+    second = acvi.LocalContentCache(tmp_path / "cache", 100)
+    with first.pin("a", _fetcher(b"0123456789", calls)):
+        pass
+
+    # Execute
+    with second:
+        with second.pin("a", _fetcher(b"0123456789", calls)) as kept:
+            kept.keep_file_on_exit()
+    first.close()
+
+    # Verify
+    assert first.cache_directory != second.cache_directory
+    assert first.cache_directory.parent == tmp_path / "cache"
+    assert not first.cache_directory.exists()
+    assert list((tmp_path / "cache").iterdir()) == [second.cache_directory]
+    assert list(second.cache_directory.iterdir()) == [kept.content_path]
+    with pytest.raises(ValueError):
+        first.pin("a", _fetcher(b"0123456789", calls))
+
+
+@pytest.mark.anyio
+async def test_directory_store_scope_uses_cache(tmp_path: Path) -> None:
+    # Setup
+    source = tmp_path / "input.txt"
+    source.write_text("contents")
+    cache = acvi.LocalContentCache(tmp_path / "cache", 1024)
+    with DirectoryStoreFileScope(tmp_path / "store", cache) as scope:
+        value: acvi.FileValue = scope.read_from_file(source, "text/plain", None)
+
+        # Execute
+        first: str = await value.get_contents()
+        second: str = await value.get_contents()
+        with value.get_reference_to_actual_content_file() as local:
+            local_path = local.content_path
+
+        # Verify
+        assert first == second == "contents"
+        assert local_path.suffix == ".txt"
+        assert local_path.parent == cache.cache_directory
+        assert cache.misses == 1
+        assert cache.hits == 2
+        assert value.file_size == len("contents")
+
+    assert list((tmp_path / "store").iterdir()) == []
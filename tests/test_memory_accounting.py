@@ -0,0 +1,125 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Unit tests of estimated_nbytes and estimate_total_nbytes."""
+from pathlib import Path
+
+import numpy
+import pytest
+
+import ansys.tools.variableinterop as acvi
+
+
+@pytest.mark.parametrize(
+    "small,large",
+    [
+        pytest.param(acvi.StringValue("a"), acvi.StringValue("a" * 1000), id="string"),
+        pytest.param(
+            acvi.RealArrayValue(values=numpy.zeros(10)),
+            acvi.RealArrayValue(values=numpy.zeros(10000)),
+            id="real array",
+        ),
+        pytest.param(
+            acvi.StringArrayValue(values=["a"] * 10),
+            acvi.StringArrayValue(values=["a" * 100] * 10),
+            id="string array",
+        ),
+    ],
+)
+def test_estimate_grows_with_contents(small: acvi.IVariableValue, large: acvi.IVariableValue):
+    """Verify that larger contents give larger estimates."""
+    assert 0 < small.estimated_nbytes() < large.estimated_nbytes()
+
+
+def test_array_estimate_counts_buffer() -> None:
+    """Verify that an array's data buffer is counted, whether or not the array owns it."""
+    # Setup
+    array = acvi.IntegerArrayValue(values=numpy.arange(5000))
+
+    # Execute
+    estimate = array.estimated_nbytes()
+
+    # Verify
+    assert array.nbytes < estimate < array.nbytes + 1024
+
+
+def test_scalar_estimate_counts_wrapper_overhead() -> None:
+    """Verify that scalar estimates include the Python object overhead."""
+    assert acvi.RealValue(1.5).estimated_nbytes() > numpy.dtype(numpy.float64).itemsize
+    assert acvi.BooleanValue(True).estimated_nbytes() > 0
+
+
+def test_metadata_estimate_counts_custom_metadata() -> None:
+    """Verify that custom metadata and enumerated values are counted."""
+    # Setup
+    plain = acvi.StringMetadata()
+    annotated = acvi.StringMetadata()
+    annotated.custom_metadata["notes"] = acvi.StringValue("n" * 500)
+    annotated.enumerated_values = [acvi.StringValue("option")] * 3
+
+    # Execute
+    plain_estimate = plain.estimated_nbytes()
+    annotated_estimate = annotated.estimated_nbytes()
+
+    # Verify
+    assert annotated_estimate > plain_estimate + 500
+
+
+def test_state_estimate_includes_value() -> None:
+    """Verify that a state's estimate includes its value."""
+    # Setup
+    value = acvi.RealArrayValue(values=numpy.zeros(1000))
+    state = acvi.VariableState(value, True)
+
+    # Verify
+    assert state.estimated_nbytes() > value.estimated_nbytes()
+
+
+def test_total_counts_shared_values_once() -> None:
+    """Verify that values shared among states are counted once by the aggregator."""
+    # Setup
+    shared = acvi.RealArrayValue(values=numpy.zeros(10000)).freeze()
+    states = [acvi.VariableState(shared, True) for _ in range(10)]
+
+    # Execute
+    total = acvi.estimate_total_nbytes(states)
+
+    # Verify
+    assert total < shared.nbytes * 2
+    assert total > shared.nbytes
+
+
+def test_file_contents_are_optional(tmp_path: Path) -> None:
+    """Verify that file contents are only counted on request."""
+    # Setup
+    source = tmp_path / "data.bin"
+    source.write_bytes(b"x" * 10000)
+    value = acvi.NonManagingFileScope().read_from_file(source, None, None)
+    array = acvi.FileArrayValue(values=[value, value])
+
+    # Execute
+    without_contents = value.estimated_nbytes()
+    with_contents = value.estimated_nbytes(include_file_contents=True)
+    array_with_contents = array.estimated_nbytes(include_file_contents=True)
+
+    # Verify
+    assert with_contents == without_contents + 10000
+    assert 10000 < array_with_contents < 20000
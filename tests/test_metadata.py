@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import pickle
 from typing import Any
 
 import pytest
@@ -625,3 +626,43 @@ def test_clone_custom_metadata(type_name: str) -> None:
     assert_equals(metadata1, metadata2)
     assert metadata1.custom_metadata["key1"] is not metadata2.custom_metadata["key1"]
     assert metadata1.custom_metadata["key2"] is not metadata2.custom_metadata["key2"]
+
+
+@pytest.mark.parametrize("type_name", all_metadata_types)
+def test_pickle_round_trip(type_name: str) -> None:
+    """Verify that metadata, which has no instance dictionary, survives pickling."""
+    # Setup
+    metadata_type = globals()[type_name]
+    metadata = metadata_type()
+    metadata.description = "described"
+    metadata.custom_metadata["key"] = IntegerValue(1)
+
+    # Execute
+    result = pickle.loads(pickle.dumps(metadata))
+
+    # Verify
+    assert not hasattr(metadata, "__dict__")
+    assert_equals(metadata, result)
+
+
+@pytest.mark.parametrize(
+    "type_name", [IntegerMetadata.__name__, RealMetadata.__name__, StringMetadata.__name__]
+)
+def test_unused_lists_are_not_allocated(type_name: str) -> None:
+    """Verify that empty lists are only created on first access."""
+    # Setup
+    metadata_type = globals()[type_name]
+    untouched = metadata_type()
+    accessed = metadata_type()
+
+    # Execute
+    accessed.enumerated_values.clear()
+    accessed.enumerated_aliases.clear()
+    accessed.custom_metadata.clear()
+
+    # Verify
+    assert not hasattr(untouched, "_enumerated_values")
+    assert not hasattr(untouched, "_custom_metadata")
+    assert_equals(untouched, accessed)
+    assert_equals(untouched.clone(), accessed)
+    assert untouched.enumerated_values == []
@@ -367,3 +367,68 @@ def test_array_from_string_jagged():
             str(thrown) == f"Encountered a {list} when attempting to deserialize "
             f"a file value element. Is the serialized array rectangular?"
         )
+
+
+@pytest.mark.parametrize("max_workers", [pytest.param(1, id="serial"), pytest.param(4, id="pool")])
+def test_read_from_files(tmp_path: Path, max_workers: int):
+    # Setup
+    directory = tmp_path / "results"
+    (directory / "nested").mkdir(parents=True)
+    (directory / "b.txt").write_text("bb")
+    (directory / "a.txt").write_text("a")
+    single = tmp_path / "single.txt"
+    single.write_text("ccc")
+    missing = tmp_path / "missing.txt"
+    sut: acvi.NonManagingFileScope = acvi.NonManagingFileScope()
+
+    # Execute
+    result = sut.read_from_files([single, directory, missing], "text/plain", "utf-8", max_workers)
+
+    # Verify
+    assert [value.original_file_name for value in result] == [
+        single,
+        directory / "a.txt",
+        directory / "b.txt",
+        missing,
+    ]
+    assert [value.file_size for value in result] == [3, 1, 2, None]
+    assert all(value.mime_type == "text/plain" for value in result)
+    assert all(value.file_encoding == "utf-8" for value in result)
+
+
+def test_read_from_files_keeps_path_types(tmp_path: Path):
+    # Setup
+    directory = tmp_path / "results"
+    directory.mkdir()
+    (directory / "a.txt").write_text("a")
+    sut: acvi.NonManagingFileScope = acvi.NonManagingFileScope()
+
+    # Execute
+    from_strings = sut.read_from_files([str(directory), str(directory / "a.txt")])
+    from_paths = sut.read_from_files([directory, directory / "a.txt"])
+
+    # Verify
+    assert [value.original_file_name for value in from_strings] == [
+        sut.read_from_file(str(directory / "a.txt"), None, None).original_file_name
+    ] * 2
+    assert all(type(value.original_file_name) is str for value in from_strings)
+    assert [value.original_file_name for value in from_paths] == [directory / "a.txt"] * 2
+    assert all(isinstance(value.original_file_name, Path) for value in from_paths)
+
+
+def test_lazy_file_size(tmp_path: Path):
+    # Setup
+    to_read = tmp_path / "file.txt"
+    sut: acvi.NonManagingFileScope = acvi.NonManagingFileScope(lazy_file_size=True)
+
+    # Execute
+    single = sut.read_from_file(to_read, None, None)
+    batch = sut.read_from_files([to_read])[0]
+    to_read.write_text("created after the values")
+
+    # Verify
+    assert sut.lazy_file_size
+    assert single.file_size == len("created after the values")
+    assert batch.file_size == len("created after the values")
+    to_read.write_text("changed")
+    assert single.file_size == len("created after the values")
@@ -0,0 +1,177 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Unit tests of from_api_string_parallel and from_api_strings_parallel."""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterator
+
+import numpy
+import pytest
+
+import ansys.tools.variableinterop as acvi
+from ansys.tools.variableinterop import parallel_api_serialization
+
+
+@pytest.fixture
+def executor() -> Iterator[ThreadPoolExecutor]:
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+@pytest.fixture
+def small_pieces(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Split even short test strings into several pieces."""
+    monkeypatch.setattr(parallel_api_serialization, "_MIN_CHUNK_LENGTH", 4)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param(acvi.RealArrayValue(values=numpy.linspace(-5, 5, 101)), id="real 1d"),
+        pytest.param(
+            acvi.IntegerArrayValue(values=numpy.arange(60).reshape(3, 4, 5)), id="integer 3d"
+        ),
+        pytest.param(
+            acvi.BooleanArrayValue(values=numpy.arange(40).reshape(5, 8) % 3 == 0),
+            id="boolean 2d",
+        ),
+        pytest.param(
+            acvi.StringArrayValue(
+                values=[["a,b", '"q",', "{x}"], ["", "plain", "\\"], ["あ", "1,2,3", "z"]]
+            ),
+            id="string 2d with commas and quotes",
+        ),
+    ],
+)
+def test_parallel_parse_matches_serial(
+    value: acvi.CommonArrayValue, executor: ThreadPoolExecutor, small_pieces: None
+) -> None:
+    """Verify that parsing in pieces gives the same array as parsing serially."""
+    # Setup
+    source = value.to_api_string()
+
+    # Execute
+    result = acvi.from_api_string_parallel(
+        value.variable_type, source, threshold=0, executor=executor
+    )
+
+    # Verify
+    expected = acvi.from_api_string(value.variable_type, source)
+    assert type(result) is type(expected)
+    assert result.shape == expected.shape
+    assert numpy.array_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "var_type,source",
+    [
+        pytest.param(acvi.VariableType.INTEGER_ARRAY, "bounds[2,2]{1,2,3}", id="too few"),
+        pytest.param(acvi.VariableType.INTEGER_ARRAY, "bounds[2,2]{1,2,3,4,5}", id="too many"),
+        pytest.param(acvi.VariableType.INTEGER_ARRAY, "bounds[2,2]{1,2,3,4,}", id="trailing"),
+        pytest.param(acvi.VariableType.REAL_ARRAY, "1.0,2.0,,3.0,4.0,5.0", id="empty element"),
+    ],
+)
+def test_parallel_parse_rejects_malformed(
+    var_type: acvi.VariableType, source: str, executor: ThreadPoolExecutor, small_pieces: None
+) -> None:
+    """Verify that malformed strings are rejected as they are by the serial parser."""
+    with pytest.raises(acvi.exceptions.FormatException):
+        acvi.from_api_string(var_type, source)
+    with pytest.raises(acvi.exceptions.FormatException):
+        acvi.from_api_string_parallel(var_type, source, threshold=0, executor=executor)
+
+
+def test_parallel_parse_below_threshold_is_serial(mocker) -> None:
+    """Verify that short strings and scalars do not start any workers."""
+    # Setup
+    pool = mocker.patch.object(parallel_api_serialization, "ProcessPoolExecutor")
+
+    # Execute
+    array = acvi.from_api_string_parallel(acvi.VariableType.REAL_ARRAY, "1.5,2.5")
+    scalar = acvi.from_api_string_parallel(acvi.VariableType.REAL, "1.5", threshold=0)
+
+    # Verify
+    pool.assert_not_called()
+    assert array == acvi.RealArrayValue(values=[1.5, 2.5])
+    assert scalar == acvi.RealValue(1.5)
+
+
+def test_parallel_parse_on_processes(small_pieces: None) -> None:
+    """Verify that a large array can be parsed on a process pool."""
+    # Setup
+    value = acvi.RealArrayValue(values=numpy.arange(2000, dtype=numpy.float64).reshape(40, 50))
+
+    # Execute
+    result = acvi.from_api_string_parallel(
+        acvi.VariableType.REAL_ARRAY, value.to_api_string(), threshold=0, max_workers=2
+    )
+
+    # Verify
+    assert type(result) is acvi.RealArrayValue
+    assert result == value
+
+
+def test_parallel_parse_errors_on_processes(small_pieces: None) -> None:
+    """Verify that a worker's parse error is raised as-is and leaves the executor usable."""
+    # Setup
+    source = "{1,2,3,4,5,6,7,,8,9,10,11,12,13,14,15,16}"
+
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        # Execute / Verify
+        with pytest.raises(acvi.exceptions.FormatException):
+            acvi.from_api_string_parallel(
+                acvi.VariableType.INTEGER_ARRAY, source, threshold=0, executor=pool
+            )
+        result = acvi.from_api_string_parallel(
+            acvi.VariableType.INTEGER_ARRAY, source.replace(",,", ","), threshold=0, executor=pool
+        )
+
+    assert result == acvi.IntegerArrayValue(values=numpy.arange(1, 17))
+
+
+def test_parallel_batch_on_processes() -> None:
+    """Verify that a batch parsed across processes keeps its order and value types."""
+    # Setup
+    values = [
+        acvi.RealValue(1.5),
+        acvi.IntegerValue(2),
+        acvi.StringValue("three"),
+        acvi.BooleanValue(True),
+        acvi.IntegerArrayValue(values=[[1, 2], [3, 4]]),
+    ] * 5
+
+    # Execute
+    result = acvi.from_api_strings_parallel(
+        [v.variable_type for v in values], acvi.to_api_strings(values), chunk_size=3, max_workers=2
+    )
+
+    # Verify
+    assert [type(r) for r in result] == [type(v) for v in values]
+    for actual, expected in zip(result, values):
+        assert numpy.all(actual == expected)
+
+
+def test_parallel_batch_parses_files_locally(executor: ThreadPoolExecutor) -> None:
+    """Verify that file values in a batch still need a scope and load context."""
+    with pytest.raises(NotImplementedError):
+        acvi.from_api_strings_parallel(
+            [(acvi.VariableType.REAL, "1"), (acvi.VariableType.FILE, "{}")], executor=executor
+        )
@@ -114,3 +114,74 @@ def test_from_api_string_valid(source: str, expected_result: RealArrayValue) ->
     # Verify
     assert isinstance(result, RealArrayValue)
     assert numpy.array_equal(result, expected_result)
+
+
+def test_freeze() -> None:
+    sut = RealArrayValue(values=[1.0, 2.0]).freeze()
+
+    assert sut.is_frozen
+    assert sut.clone() is sut
+    with pytest.raises(ValueError):
+        sut[0] = 3.0
+
+    thawed = sut.thaw()
+    thawed[0] = 3.0
+
+    assert type(thawed) is RealArrayValue
+    assert not thawed.is_frozen
+    assert sut[0] == 1.0
+
+
+def test_freeze_view_copies() -> None:
+    # Setup
+    array = RealArrayValue(values=[1.0, 2.0, 3.0])
+    view = array[1:]
+
+    # SUT
+    sut = view.freeze()
+    array[1] = 4.0
+
+    # Verification
+    assert sut is not view
+    assert sut.is_frozen
+    assert not view.is_frozen
+    assert numpy.array_equal(sut, [2.0, 3.0])
+    assert type(sut) is RealArrayValue
+
+
+def test_freeze_view_of_caller_array_copies() -> None:
+    # Setup
+    array = numpy.array([1.0, 2.0])
+
+    # SUT
+    sut = array.view(RealArrayValue).freeze()
+    array[0] = 3.0
+
+    # Verification
+    assert array.flags.writeable
+    assert sut.is_frozen
+    assert numpy.array_equal(sut, [1.0, 2.0])
+
+
+def test_freeze_created_array_in_place() -> None:
+    # Setup
+    sut = RealArrayValue(values=[1.0, 2.0])
+
+    # SUT
+    frozen = sut.freeze()
+
+    # Verification
+    assert frozen is sut
+    assert sut.is_frozen
+
+
+def test_freeze_owned_array_in_place() -> None:
+    # Setup
+    sut = RealArrayValue((2,))
+
+    # SUT
+    frozen = sut.freeze()
+
+    # Verification
+    assert frozen is sut
+    assert sut.is_frozen
@@ -0,0 +1,220 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests of the opt-in interning of scalar values."""
+from __future__ import annotations
+
+import pickle
+from typing import Iterator
+
+import numpy as np
+import pytest
+
+import ansys.tools.variableinterop as acvi
+
+
+@pytest.fixture(autouse=True)
+def _disable_after_test() -> Iterator[None]:
+    yield
+    acvi.disable_interning()
+
+
+def test_disabled_by_default() -> None:
+    # Execute
+    first = acvi.IntegerValue(1)
+    second = acvi.IntegerValue(1)
+
+    # Verify
+    assert not acvi.interning_enabled()
+    assert first is not second
+    assert not first.is_frozen
+
+
+@pytest.mark.parametrize(
+    "arg", [pytest.param(7, id="int"), pytest.param(np.int64(7), id="numpy int64")]
+)
+def test_small_integers_are_shared(arg) -> None:
+    # Setup
+    acvi.enable_interning()
+
+    # Execute
+    first = acvi.IntegerValue(arg)
+    second = acvi.IntegerValue(7)
+
+    # Verify
+    assert acvi.interning_enabled()
+    assert first is second
+    assert first.is_frozen
+    assert type(first) is acvi.IntegerValue
+    assert first == 7
+
+
+def test_integers_outside_the_range_are_not_shared() -> None:
+    # Setup
+    acvi.enable_interning(integers=range(0, 10))
+
+    # Execute
+    inside = acvi.IntegerValue(9), acvi.IntegerValue(9)
+    outside = acvi.IntegerValue(10), acvi.IntegerValue(10)
+    converted = acvi.IntegerValue(acvi.RealValue(9.0)), acvi.IntegerValue(acvi.RealValue(9.0))
+
+    # Verify
+    assert inside[0] is inside[1]
+    assert outside[0] is not outside[1]
+    assert converted[0] is not converted[1]
+
+
+def test_thawing_an_interned_integer_gives_a_private_copy() -> None:
+    # Setup
+    acvi.enable_interning()
+    shared = acvi.IntegerValue(3)
+
+    # Execute
+    thawed = shared.thaw()
+
+    # Verify
+    assert shared.clone() is shared
+    assert thawed is not shared
+    assert not thawed.is_frozen
+    assert thawed == shared
+
+
+def test_enumerated_strings_are_shared() -> None:
+    # Setup
+    acvi.enable_interning()
+    metadata = acvi.StringMetadata()
+
+    # Execute
+    metadata.enumerated_values = [acvi.StringValue("red"), acvi.StringValue("green")]
+    first = acvi.StringValue("green")
+    second = acvi.StringValue.from_api_string("green")
+    other = acvi.StringValue("blue"), acvi.StringValue("blue")
+
+    # Verify
+    assert first is acvi.StringValue("green")
+    assert first.is_frozen
+    assert first == second
+    assert other[0] is not other[1]
+
+
+def test_strings_are_not_registered_while_disabled() -> None:
+    # Setup
+    acvi.intern_strings(["red"])
+    acvi.enable_interning()
+
+    # Execute
+    first = acvi.StringValue("red")
+    second = acvi.StringValue("red")
+
+    # Verify
+    assert first is not second
+
+
+def test_registered_strings_are_bounded() -> None:
+    # Setup
+    acvi.enable_interning(max_strings=2)
+
+    # Execute
+    acvi.intern_strings(["a", "b", "c"])
+
+    # Verify
+    assert acvi.StringValue("a") is not acvi.StringValue("a")
+    assert acvi.StringValue("b") is acvi.StringValue("b")
+    assert acvi.StringValue("c") is acvi.StringValue("c")
+
+
+def test_reenabling_keeps_the_newest_strings() -> None:
+    # Setup
+    acvi.enable_interning()
+    acvi.intern_strings(["a", "b", "c"])
+
+    # Execute
+    acvi.enable_interning(max_strings=1)
+
+    # Verify
+    assert acvi.StringValue("b") is not acvi.StringValue("b")
+    assert acvi.StringValue("c") is acvi.StringValue("c")
+
+
+def test_disabling_forgets_shared_values() -> None:
+    # Setup
+    acvi.enable_interning()
+    acvi.intern_strings(["a"])
+
+    # Execute
+    acvi.disable_interning()
+
+    # Verify
+    assert not acvi.interning_enabled()
+    assert acvi.IntegerValue(1) is not acvi.IntegerValue(1)
+    assert acvi.StringValue("a") is not acvi.StringValue("a")
+
+
+@pytest.mark.parametrize(
+    "make",
+    [
+        pytest.param(lambda: acvi.BooleanValue(True).thaw(), id="boolean"),
+        pytest.param(lambda: acvi.IntegerValue(1).thaw(), id="integer"),
+        pytest.param(lambda: acvi.StringValue("a").thaw(), id="string"),
+    ],
+)
+def test_intern_value(make) -> None:
+    # Setup
+    acvi.enable_interning()
+    acvi.intern_strings(["a"])
+    value = make()
+
+    # Execute
+    result = acvi.intern_value(value)
+
+    # Verify
+    assert result is not value
+    assert result == value
+    assert result.is_frozen
+    assert acvi.intern_value(result) is result
+
+
+def test_intern_value_leaves_other_values_alone() -> None:
+    # Setup
+    real = acvi.RealValue(1.0)
+    integer = acvi.IntegerValue(1)
+
+    # Execute / Verify
+    assert acvi.intern_value(real) is real
+    assert acvi.intern_value(integer) is integer
+
+
+def test_unpickling_does_not_modify_shared_values() -> None:
+    # Setup
+    pickled = pickle.dumps([acvi.IntegerValue(3), acvi.StringValue("a")])
+    acvi.enable_interning()
+    acvi.intern_strings(["a"])
+    shared = [acvi.IntegerValue(3), acvi.StringValue("a")]
+    attributes = [dict(value.__dict__) for value in shared]
+
+    # Execute
+    result = pickle.loads(pickled)
+
+    # Verify
+    assert result[0] is shared[0]
+    assert result[1] is shared[1]
+    assert [value.__dict__ for value in shared] == attributes
+    assert shared[0].freeze() is shared[0]
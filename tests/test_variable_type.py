@@ -114,3 +114,31 @@ def test_var_type_to_display_string(inp: VariableType, expected_result: str):
 
     # Verify
     assert result == expected_result
+
+
+@pytest.mark.parametrize(
+    "inp,expected_result",
+    [
+        pytest.param("  Integer ", VariableType.INTEGER, id="padded mixed case"),
+        pytest.param("FLOAT[]", VariableType.REAL_ARRAY, id="upper case array"),
+        pytest.param("", VariableType.UNKNOWN, id="empty"),
+    ],
+)
+def test_var_type_from_string_normalizes(inp: str, expected_result: VariableType):
+    """Tests that VariableType.from_string() ignores case and surrounding whitespace."""
+    # SUT
+    result = VariableType.from_string(inp)
+
+    # Verify
+    assert result == expected_result
+
+
+def test_default_values_are_not_shared():
+    """Tests that each call to get_default_value() constructs a new value."""
+    # SUT
+    first = VariableType.INTEGER_ARRAY.get_default_value()
+    second = VariableType.INTEGER_ARRAY.get_default_value()
+
+    # Verify
+    assert first == second
+    assert first is not second
@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import pickle
 from typing import Any
 
 import pytest
@@ -78,3 +79,65 @@ def test_implicit_coerce(value: Any, expected_value: acvi.IVariableValue):
 
     assert isinstance(sut.value, acvi.IVariableValue)
     assert sut.value == expected_value
+
+
+@pytest.mark.parametrize("value,is_valid", __value_cases)
+def test_clone_frozen(value: acvi.IVariableValue, is_valid: bool):
+    """Verify that cloning a frozen state shares the instance."""
+    # Setup
+    original = acvi.VariableState(value.clone(), is_valid).freeze()
+
+    # Execute
+    clone = original.clone()
+
+    # Verify
+    assert original.is_frozen
+    assert clone is original
+
+
+def test_thaw_frozen_array():
+    """Verify that thawing a frozen state produces a writable copy."""
+    # Setup
+    original = acvi.VariableState(acvi.RealArrayValue(values=[1.0, 2.0]), True).freeze()
+
+    # Execute
+    thawed = original.thaw()
+    thawed.value[0] = 3.0
+
+    # Verify
+    assert not thawed.is_frozen
+    assert thawed is not original
+    assert original.value[0] == 1.0
+    with pytest.raises(ValueError):
+        original.value[0] = 3.0
+
+
+def test_freeze_array_view():
+    """Verify that freezing a state holding a view of an array freezes a copy."""
+    # Setup
+    array = acvi.RealArrayValue(values=[1.0, 2.0, 3.0])
+    view = array[0:2]
+
+    # Execute
+    sut = acvi.VariableState(view, True).freeze()
+    array[0] = 4.0
+
+    # Verify
+    assert sut.is_frozen
+    assert sut.value is not view
+    assert sut.value[0] == 1.0
+    assert not array.is_frozen
+
+
+@pytest.mark.parametrize("value,is_valid", __value_cases)
+def test_pickle_round_trip(value: acvi.IVariableValue, is_valid: bool):
+    """Verify that states, which have no instance dictionary, survive pickling."""
+    # Setup
+    original = acvi.VariableState(value, is_valid)
+
+    # Execute
+    result = pickle.loads(pickle.dumps(original))
+
+    # Verify
+    assert not hasattr(original, "__dict__")
+    assert result == original
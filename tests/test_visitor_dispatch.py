@@ -0,0 +1,157 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Unit tests of dispatch_by_type and TypeDispatcher."""
+import gc
+from typing import Any
+import weakref
+
+import pytest
+
+import ansys.tools.variableinterop as acvi
+
+
+class _MethodNameVisitor(acvi.IVariableValueVisitor[str]):
+    """Returns the name of the visit method that was called."""
+
+    def visit_integer(self, value: acvi.IntegerValue) -> str:
+        return "integer"
+
+    def visit_real(self, value: acvi.RealValue) -> str:
+        return "real"
+
+    def visit_boolean(self, value: acvi.BooleanValue) -> str:
+        return "boolean"
+
+    def visit_string(self, value: acvi.StringValue) -> str:
+        return "string"
+
+    def visit_file(self, value: acvi.FileValue) -> str:
+        return "file"
+
+    def visit_integer_array(self, value: acvi.IntegerArrayValue) -> str:
+        return "integer_array"
+
+    def visit_real_array(self, value: acvi.RealArrayValue) -> str:
+        return "real_array"
+
+    def visit_boolean_array(self, value: acvi.BooleanArrayValue) -> str:
+        return "boolean_array"
+
+    def visit_string_array(self, value: acvi.StringArrayValue) -> str:
+        return "string_array"
+
+    def visit_file_array(self, value: acvi.FileArrayValue) -> str:
+        return "file_array"
+
+
+class _RealAsStringArrayValue(acvi.RealArrayValue):
+    """Real array value that asks to be visited as a string array."""
+
+    def accept(self, visitor: acvi.IVariableValueVisitor) -> Any:
+        return visitor.visit_string_array(acvi.StringArrayValue(values=self.astype(str)))
+
+
+_VALUES = [
+    acvi.IntegerValue(1),
+    acvi.RealValue(1.5),
+    acvi.BooleanValue(True),
+    acvi.StringValue("a"),
+    acvi.EMPTY_FILE,
+    acvi.IntegerArrayValue(values=[1, 2]),
+    acvi.RealArrayValue(values=[1.5]),
+    acvi.BooleanArrayValue(values=[True]),
+    acvi.StringArrayValue(values=["a"]),
+    acvi.FileArrayValue(values=[acvi.EMPTY_FILE]),
+]
+
+
+@pytest.mark.parametrize("value", [pytest.param(v, id=type(v).__name__) for v in _VALUES])
+def test_dispatch_matches_accept(value: acvi.IVariableValue) -> None:
+    """Verify that a dispatcher calls the same visitor method as accept."""
+    # Setup
+    visitor = _MethodNameVisitor()
+    dispatch = acvi.dispatch_by_type(visitor)
+
+    # Execute
+    result = dispatch(value)
+
+    # Verify
+    assert result == value.accept(visitor)
+
+
+def test_apply_keeps_order() -> None:
+    """Verify that applying a dispatcher to a mixed batch returns results in order."""
+    # Setup
+    visitor = _MethodNameVisitor()
+    values = _VALUES + list(reversed(_VALUES))
+
+    # Execute
+    result = acvi.dispatch_by_type(visitor).apply(values)
+
+    # Verify
+    assert result == [v.accept(visitor) for v in values]
+
+
+def test_overridden_accept_is_respected() -> None:
+    """Verify that subclasses overriding accept are dispatched through accept."""
+    # Setup
+    dispatch = acvi.dispatch_by_type(_MethodNameVisitor())
+
+    # Execute
+    result = dispatch.apply(
+        [acvi.RealArrayValue(values=[1.0]), _RealAsStringArrayValue(values=[1.0])]
+    )
+
+    # Verify
+    assert result == ["real_array", "string_array"]
+
+
+def test_methods_are_shared_per_visitor_class() -> None:
+    """Verify that dispatchers for visitors of the same class share resolved methods."""
+    # Setup
+    visitor = _MethodNameVisitor()
+
+    # Execute
+    first = acvi.dispatch_by_type(visitor)
+    first(acvi.IntegerValue(1))
+    second = acvi.dispatch_by_type(_MethodNameVisitor())
+
+    # Verify
+    assert first.visitor is visitor
+    assert second.visitor is not visitor
+    assert second._methods is first._methods
+    assert acvi.IntegerValue in second._methods
+
+
+def test_dispatcher_does_not_keep_visitor_alive() -> None:
+    """Verify that a visitor can be collected once its dispatchers are gone."""
+    # Setup
+    visitor = _MethodNameVisitor()
+    acvi.dispatch_by_type(visitor).apply(_VALUES)
+    visitor_ref = weakref.ref(visitor)
+
+    # Execute
+    del visitor
+    gc.collect()
+
+    # Verify
+    assert visitor_ref() is None
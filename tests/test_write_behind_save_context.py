@@ -0,0 +1,191 @@
+# Copyright (C) 2024 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from os import PathLike
+from pathlib import Path
+import threading
+from typing import Dict, List, Optional, Union
+
+import pytest
+
+import ansys.tools.variableinterop as acvi
+from directory_store_file_scope import DirectoryStoreFileScope
+
+
+class _RecordingSaveContext(acvi.ISaveContext):
+    """Save context that records saves and can be made to block or fail."""
+
+    def __init__(self, fail_on: Optional[str] = None):
+        self.saved: Dict[str, str] = {}
+        self.release = threading.Event()
+        self.release.set()
+        self.fail_on = fail_on
+        self.flushed = 0
+        self.closed = False
+
+    def save_file(self, source: Union[PathLike, str], content_id: Optional[str] = None) -> str:
+        self.release.wait()
+        if content_id == self.fail_on:
+            raise OSError("disk full")
+        self.saved[content_id] = Path(source).read_text()
+        return content_id
+
+    def flush(self) -> None:
+        self.flushed += 1
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    path = tmp_path / "source.txt"
+    path.write_text("contents")
+    return path
+
+
+def test_save_file_returns_before_save_completes(source: Path) -> None:
+    # Setup
+    inner = _RecordingSaveContext()
+    inner.release.clear()
+    sut = acvi.WriteBehindSaveContext(inner)
+
+    # Execute
+    given_id = sut.save_file(source, "given")
+    generated_id = sut.save_file(source)
+
+    # Verify
+    assert given_id == "given"
+    assert generated_id not in ("", "given")
+    assert inner.saved == {}
+    inner.release.set()
+    sut.flush()
+    assert inner.saved == {"given": "contents", generated_id: "contents"}
+    assert inner.flushed == 1
+    sut.close()
+
+
+def test_close_waits_and_closes_inner(source: Path) -> None:
+    # Setup
+    inner = _RecordingSaveContext()
+    ids: List[str] = []
+
+    # Execute
+    with acvi.WriteBehindSaveContext(inner, max_workers=2, max_pending=2) as sut:
+        for _ in range(10):
+            ids.append(sut.save_file(source))
+
+    # Verify
+    assert sorted(inner.saved) == sorted(ids)
+    assert len(set(ids)) == 10
+    assert inner.closed
+
+
+def test_flush_raises_save_error(source: Path) -> None:
+    # Setup
+    inner = _RecordingSaveContext(fail_on="bad")
+    sut = acvi.WriteBehindSaveContext(inner)
+    sut.save_file(source, "good")
+    sut.save_file(source, "bad")
+
+    # Execute
+    with pytest.raises(OSError, match="disk full"):
+        sut.flush()
+
+    # Verify
+    assert inner.saved == {"good": "contents"}
+    sut.flush()
+    sut.close()
+    assert inner.closed
+
+
+def test_save_after_close_raises(source: Path) -> None:
+    # Setup
+    sut = acvi.WriteBehindSaveContext(_RecordingSaveContext())
+    sut.close()
+
+    # Execute / Verify
+    with pytest.raises(ValueError):
+        sut.save_file(source)
+
+
+def test_id_mismatch_is_reported(tmp_path: Path, source: Path) -> None:
+    # Setup
+    inner = acvi.ContentAddressedFileScope(tmp_path / "blobs")
+    sut = acvi.WriteBehindSaveContext(inner)
+    sut.save_file(source, "not-a-digest")
+
+    # Execute / Verify
+    with pytest.raises(ValueError):
+        sut.close()
+
+
+def test_finished_saves_are_not_retained(source: Path) -> None:
+    # Setup
+    sut = acvi.WriteBehindSaveContext(_RecordingSaveContext(), max_workers=1)
+
+    # Execute
+    for index in range(10):
+        sut.save_file(source, str(index))
+    sut.flush()
+    sut.save_file(source, "last")
+    sut.flush()
+
+    # Verify
+    assert len(sut._pending) == 0
+    assert len(sut._latest_saves) <= 1
+    sut.close()
+
+
+def test_cached_file_is_pinned_until_saved(tmp_path: Path, source: Path) -> None:
+    # Setup
+    inner = _RecordingSaveContext()
+    inner.release.clear()
+    cache = acvi.LocalContentCache(tmp_path / "cache", 0)
+    with DirectoryStoreFileScope(tmp_path / "store", cache) as scope:
+        value: acvi.FileValue = scope.read_from_file(source, "text/plain", None)
+        with acvi.WriteBehindSaveContext(inner) as sut:
+            # Execute
+            content_id = value.to_api_object(sut)[acvi.FileValue.CONTENTS_KEY]
+            cache.clear()
+            pinned = len(cache)
+            inner.release.set()
+            sut.flush()
+
+        # Verify
+        assert pinned == 1
+        assert inner.saved == {content_id: "contents"}
+        assert len(cache) == 0
+
+
+def test_id_factory_with_content_addressed_scope(tmp_path: Path, source: Path) -> None:
+    # Setup
+    inner = acvi.ContentAddressedFileScope(tmp_path / "blobs")
+    sut = acvi.WriteBehindSaveContext(inner, id_factory=inner.compute_digest)
+
+    # Execute
+    content_id = sut.save_file(source)
+    sut.flush()
+
+    # Verify
+    assert content_id == inner.compute_digest(source)
+    assert inner.load_file(content_id).read_text() == "contents"
+    sut.close()